@@ -0,0 +1,129 @@
+# Compares whole Mechanical Marquise turns using the move planner against the naive approach it replaced, which
+# re-sorted each origin's destinations and re-derived rule for every (origin, destination, warrior) check. Only each
+# turn's Daylight is timed, since Birdsong and Evening don't move: battle, recruit, build, the move step and Blitz for a
+# normal turn, and the escalated steps, second battle and Blitz for an escalated turn
+# Run from the repository root with: PYTHONPATH=src python benchmarks/benchmark_marquise_move_planner.py
+from __future__ import annotations
+import random
+import time
+from typing import Type
+
+from bot_resources.bot_factions.electric_eyrie.electric_eyrie_player import ElectricEyriePlayer
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_trait import TRAIT_BLITZ
+from constants import Suit
+from deck.cards.card import Card
+from game import Game
+from game_random import GameRandom
+from locations.clearing import Clearing
+from sort_utils import sort_clearings_by_priority
+
+ITERATIONS = 1000
+REPEATS = 5
+ORDER_SUITS = {'Normal': Suit.FOX, 'Escalated': Suit.BIRD}
+
+
+# The move step, escalated move step and blitz as they were before the move planner
+class NaiveMechanicalMarquiseV2Player(MechanicalMarquiseV2Player):
+    def move_step(self) -> None:
+        self.escalated_move_step()
+
+    def escalated_move_step(self) -> list[Clearing]:
+        destinations = []
+        planned_movements = self.naive_prepare_origin_movements()
+        for origin_clearing in sort_clearings_by_priority(list(planned_movements.keys())):
+            destination_clearing = planned_movements[origin_clearing]
+            self.move(origin_clearing.get_warriors_for_player(self)[3:], origin_clearing, destination_clearing)
+            destinations.append(destination_clearing)
+        return destinations
+
+    def naive_prepare_origin_movements(self) -> dict[Clearing, Clearing]:
+        planned_movements = {}
+        origin_clearings = [clearing for clearing in self.find_ruled_clearings() if
+                            Suit.are_suits_equal(clearing.suit, self.order_card.suit) and
+                            clearing.get_warrior_count_for_player(self) > 3]
+        for origin_clearing in sort_clearings_by_priority(origin_clearings):
+            warriors_to_move = origin_clearing.get_warriors_for_player(self)[3:]
+            for destination_clearing in self.sort_adjacent_clearings_by_most_enemy_pieces(origin_clearing):
+                if origin_clearing.can_move_pieces(self, warriors_to_move, destination_clearing, requires_rule=True):
+                    planned_movements[origin_clearing] = destination_clearing
+                    break
+        return planned_movements
+
+    def blitz(self) -> None:
+        ruled_empty_clearings = [clearing for clearing in self.find_ruled_clearings() if
+                                 clearing.get_total_piece_count() == clearing.get_piece_count_for_player(self)]
+        for origin_clearing in sort_clearings_by_priority(ruled_empty_clearings):
+            warriors_to_move = origin_clearing.get_warriors_for_player(self)[1:]
+            if not warriors_to_move:
+                continue
+            for destination_clearing in self.sort_adjacent_clearings_by_most_enemy_pieces(origin_clearing):
+                if origin_clearing.can_move_pieces(self, warriors_to_move, destination_clearing):
+                    self.move(warriors_to_move, origin_clearing, destination_clearing)
+                    self.initiate_battle(destination_clearing)
+                    return
+
+
+def create_midgame_board(marquise_class: Type[MechanicalMarquiseV2Player],
+                         order_suit: Suit) -> tuple[Game, MechanicalMarquiseV2Player]:
+    random.seed(0)
+    game = Game(game_random=GameRandom(0))
+    marquise = marquise_class(game)
+    marquise.traits = [TRAIT_BLITZ]
+    eyrie = ElectricEyriePlayer(game)
+    for player in [marquise, eyrie]:
+        game.add_player(player)
+        player.supply.add_pieces(player, player.piece_stock.pieces)
+    # A spread-out Marquise with enough warriors to move out of half the board, and Eyrie warriors scattered around
+    for clearing in game.clearings()[:6]:
+        marquise.supply.relocate_pieces(marquise, marquise.get_unplaced_warriors()[:4], clearing)
+    for clearing in game.clearings():
+        eyrie.supply.relocate_pieces(eyrie, eyrie.get_unplaced_warriors()[:random.randint(0, 2)], clearing)
+    marquise.order_card = Card('Order card', order_suit)
+    return game, marquise
+
+
+def get_board_state(game: Game) -> list[tuple[int, ...]]:
+    return [tuple(clearing.get_warrior_count_for_player(player) for player in game.players)
+            for clearing in game.clearings()]
+
+
+def play_turn(marquise_class: Type[MechanicalMarquiseV2Player], order_suit: Suit) -> tuple[float, Game]:
+    game, marquise = create_midgame_board(marquise_class, order_suit)
+    start_time = time.perf_counter()
+    marquise.daylight()
+    return time.perf_counter() - start_time, game
+
+
+def time_turns(marquise_class: Type[MechanicalMarquiseV2Player], order_suit: Suit) -> float:
+    return sum(play_turn(marquise_class, order_suit)[0] for _ in range(ITERATIONS))
+
+
+# The naive and planned turns take turns being timed, and the best repeat of each is kept, so that noise from the rest
+# of the machine doesn't favour either one
+def time_best_turns(order_suit: Suit) -> tuple[float, float]:
+    naive_times = []
+    planned_times = []
+    for _ in range(REPEATS):
+        naive_times.append(time_turns(NaiveMechanicalMarquiseV2Player, order_suit))
+        planned_times.append(time_turns(MechanicalMarquiseV2Player, order_suit))
+    return min(naive_times), min(planned_times)
+
+
+def main() -> None:
+    for turn_name, order_suit in ORDER_SUITS.items():
+        naive_game = play_turn(NaiveMechanicalMarquiseV2Player, order_suit)[1]
+        planned_game = play_turn(MechanicalMarquiseV2Player, order_suit)[1]
+        assert get_board_state(naive_game) == get_board_state(planned_game), \
+            f'The planner played the {turn_name.lower()} turn differently than the naive approach'
+
+        naive_time, planned_time = time_best_turns(order_suit)
+        print(f'{turn_name} turn')
+        print(f'  Naive:   {naive_time / ITERATIONS * 1e6:8.1f} us per turn')
+        print(f'  Planner: {planned_time / ITERATIONS * 1e6:8.1f} us per turn')
+        print(f'  Speedup: {naive_time / planned_time:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
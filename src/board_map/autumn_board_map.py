@@ -3,6 +3,7 @@ import random
 from typing import Optional, TYPE_CHECKING
 
 from board_map.board_map import BoardMap
+from board_map.board_topology import BoardTopology
 from constants import RUIN_ITEMS, Suit
 from locations.clearing import Clearing
 from locations.forest import Forest
@@ -30,109 +31,104 @@ AUTUMN_MAP_DEFAULT_SUITS_FOR_PRIORITY_CLEARING = [
 ]
 AUTUMN_MAP_RUINS_LOCATIONS = [6, 10, 11, 12]
 AUTUMN_MAP_CORNER_CLEARING_OPPOSITES = {1: 3, 2: 4, 3: 1, 4: 2}
+AUTUMN_MAP_CLEARING_PATH_CONNECTIONS = {1: [5, 9, 10],
+                                        2: [5, 6, 10],
+                                        3: [6, 7, 11],
+                                        4: [8, 9, 12],
+                                        5: [1, 2],
+                                        6: [2, 3, 11],
+                                        7: [3, 8, 12],
+                                        8: [4, 7],
+                                        9: [1, 4, 12],
+                                        10: [1, 2, 12],
+                                        11: [3, 6, 12],
+                                        12: [4, 7, 9, 10, 11]}
+AUTUMN_MAP_CLEARING_RIVER_CONNECTIONS = {1: [7],
+                                         7: [11],
+                                         11: [10],
+                                         10: [5]}
+# 0: Top of board
+# 1: Top-left
+# 2: Top-right and middle, connected to five clearings
+# 3: Left, connected to bottom-left clearing
+# 4: Bottom-right and middle, connected to bottom-right clearing
+# 5: Far right, connected to bottom-right clearing
+# 6: Bottom, connected to bottom-left clearing
+AUTUMN_MAP_CLEARING_FOREST_ADJACENCY = {1: [0, 1],
+                                        2: [0, 2],
+                                        3: [4, 5],
+                                        4: [3, 6],
+                                        5: [0],
+                                        6: [2, 5],
+                                        7: [4, 6],
+                                        8: [6],
+                                        9: [1, 3],
+                                        10: [0, 1, 2],
+                                        11: [2, 4, 5],
+                                        12: [1, 2, 3, 4, 6]}
+AUTUMN_MAP_FOREST_ADJACENCY = {0: [1, 2],
+                               1: [0, 2, 3],
+                               2: [0, 1, 4, 5],
+                               3: [1, 6],
+                               4: [2, 5, 6],
+                               5: [2, 4],
+                               6: [3, 4]}
+AUTUMN_BOARD_TOPOLOGY = BoardTopology(suits=AUTUMN_MAP_DEFAULT_SUITS_FOR_PRIORITY_CLEARING,
+                                      building_slots=AUTUMN_MAP_BUILDING_SLOTS_FOR_PRIORITY_CLEARING,
+                                      corner_clearing_opposites=AUTUMN_MAP_CORNER_CLEARING_OPPOSITES,
+                                      ruin_priorities=AUTUMN_MAP_RUINS_LOCATIONS,
+                                      path_connections=AUTUMN_MAP_CLEARING_PATH_CONNECTIONS,
+                                      river_connections=AUTUMN_MAP_CLEARING_RIVER_CONNECTIONS,
+                                      clearing_forest_adjacency=AUTUMN_MAP_CLEARING_FOREST_ADJACENCY,
+                                      forest_adjacency=AUTUMN_MAP_FOREST_ADJACENCY)
 
 
+# Each game only creates its own clearings and forests, and links them to each other from the shared Autumn topology
 class AutumnBoardMap(BoardMap):
     def __init__(self, game: Game) -> None:
+        self.topology = AUTUMN_BOARD_TOPOLOGY
         super().__init__(game)
 
     def initialize_forests(self) -> None:
         self.create_forests()
-        self.mark_adjacent_forests_to_forests()
-        if self.clearings:
-            self.mark_adjacent_forests_to_clearings()
 
     def initialize_clearings(self) -> None:
         ruins = self.initialize_ruins()
-        suits = AUTUMN_MAP_DEFAULT_SUITS_FOR_PRIORITY_CLEARING
         # TODO: Game options to shuffle clearing suits
+        suits = [clearing_topology.suit for clearing_topology in self.topology.clearing_topologies]
         self.create_clearings(suits, ruins)
-        self.initialize_opposite_corner_clearings()
-        self.connect_clearings_by_path()
-        self.connect_clearings_by_river()
-        if self.forests:
-            self.mark_adjacent_forests_to_clearings()
+        self.link_neighbours()
 
     def create_clearings(self, suits: list[Suit], ruins: list[Ruin]) -> None:
-        for i in range(12):
+        for clearing_topology in self.topology.clearing_topologies:
             clearing = Clearing(self.game,
-                                suit=suits[i],
-                                priority=i+1,
-                                total_building_slots=AUTUMN_MAP_BUILDING_SLOTS_FOR_PRIORITY_CLEARING[i],
-                                is_corner_clearing=(i < 4))
-            if i+1 in AUTUMN_MAP_RUINS_LOCATIONS and ruins:
+                                suit=suits[clearing_topology.priority - 1],
+                                priority=clearing_topology.priority,
+                                total_building_slots=clearing_topology.total_building_slots,
+                                is_corner_clearing=clearing_topology.is_corner_clearing,
+                                topology=clearing_topology)
+            if clearing_topology.has_ruin and ruins:
                 clearing.add_ruin(ruins.pop())
             self.clearings.append(clearing)
 
-    # 0: Top of board
-    # 1: Top-left
-    # 2: Top-right and middle, connected to five clearings
-    # 3: Left, connected to bottom-left clearing
-    # 4: Bottom-right and middle, connected to bottom-right clearing
-    # 5: Far right, connected to bottom-right clearing
-    # 6: Bottom, connected to bottom-left clearing
     def create_forests(self) -> None:
-        for i in range(7):
-            self.forests.append(Forest(self.game))
+        for index in range(self.topology.get_forest_count()):
+            self.forests.append(Forest(self.game, index))
 
-    def mark_adjacent_forests_to_forests(self) -> None:
-        # A bit of redundancy in adjacency A->B and then B->A later, but the adjacency method is idempotent and it
-        # makes the adjacencies between the forests much clearer
-        forest_adjacency = {0: [1, 2],
-                            1: [0, 2, 3],
-                            2: [0, 1, 4, 5],
-                            3: [1, 6],
-                            4: [2, 5, 6],
-                            5: [2, 4],
-                            6: [3, 4]}
-        for origin_index, destination_forests in forest_adjacency.items():
-            for destination_index in destination_forests:
-                self.forests[origin_index].mark_forest_as_adjacent_to_self(self.forests[destination_index])
-
-    def mark_adjacent_forests_to_clearings(self) -> None:
-        clearing_forest_adjacency = {1: [0, 1],
-                                     2: [0, 2],
-                                     3: [4, 5],
-                                     4: [3, 6],
-                                     5: [0],
-                                     6: [2, 5],
-                                     7: [4, 6],
-                                     8: [6],
-                                     9: [1, 3],
-                                     10: [0, 1, 2],
-                                     11: [2, 4, 5],
-                                     12: [1, 2, 3, 4, 6]}
-        for origin_priority, destination_forests in clearing_forest_adjacency.items():
-            for destination_index in destination_forests:
-                self.get_clearing(origin_priority).mark_forest_as_adjacent_to_self(self.forests[destination_index])
-
-    def connect_clearings_by_path(self) -> None:
-        # A bit of redundancy in connection A->B and then B->A later, but the connection method is idempotent and it
-        # makes the connections between the clearings much clearer
-        clearing_path_connections = {1: [5, 9, 10],
-                                     2: [5, 6, 10],
-                                     3: [6, 7, 11],
-                                     4: [8, 9, 12],
-                                     5: [1, 2],
-                                     6: [2, 3, 11],
-                                     7: [3, 8, 12],
-                                     8: [4, 7],
-                                     9: [1, 4, 12],
-                                     10: [1, 2, 12],
-                                     11: [3, 6, 12],
-                                     12: [4, 7, 9, 10, 11]}
-        for origin_priority, destination_clearings in clearing_path_connections.items():
-            for destination_priority in destination_clearings:
-                self.get_clearing(origin_priority).connect_clearing_by_path(self.get_clearing(destination_priority))
-
-    def connect_clearings_by_river(self) -> None:
-        clearing_river_connections = {1: 7,
-                                      7: 11,
-                                      11: 10,
-                                      10: 5}
-        for origin_priority, destination_priority in clearing_river_connections.items():
-            self.get_clearing(origin_priority).connect_clearing_by_river(self.get_clearing(destination_priority))
-
-    def initialize_opposite_corner_clearings(self):
-        for first_clearing, opposite_clearing in AUTUMN_MAP_CORNER_CLEARING_OPPOSITES.items():
-            self.get_clearing(first_clearing).mark_corner_clearings_as_opposite(self.get_clearing(opposite_clearing))
+    # Neighbours are resolved once per game into tuples of this game's objects, so adjacency queries never look them up
+    def link_neighbours(self) -> None:
+        for clearing in self.clearings:
+            clearing_topology = clearing.topology
+            clearing.path_connected_clearings = tuple(self.get_clearing(priority) for priority in
+                                                      clearing_topology.path_connected_priorities)
+            clearing.river_connected_clearings = tuple(self.get_clearing(priority) for priority in
+                                                       clearing_topology.river_connected_priorities)
+            clearing.adjacent_forests = tuple(self.forests[index] for index in
+                                              clearing_topology.adjacent_forest_indices)
+            if clearing_topology.opposite_corner_priority is not None:
+                clearing.opposite_corner_clearing = self.get_clearing(clearing_topology.opposite_corner_priority)
+        for forest in self.forests:
+            forest.adjacent_clearings = tuple(self.get_clearing(priority) for priority in
+                                              self.topology.forest_adjacent_clearing_priorities[forest.index])
+            forest.adjacent_forests = tuple(self.forests[index] for index in
+                                            self.topology.forest_adjacent_forest_indices[forest.index])
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-import random
 from typing import TYPE_CHECKING
 
 from constants import RUIN_ITEMS, Suit
@@ -9,12 +8,14 @@ from pieces.item_token import ItemToken
 from pieces.ruin import Ruin
 
 if TYPE_CHECKING:
+    from board_map.board_topology import BoardTopology
     from game import Game
     from locations.clearing import Clearing
 
 
 class BoardMap(ABC):
     game: Game
+    topology: BoardTopology  # Set by each map before its clearings and forests are created
     clearings: list[Clearing]
     forests: list[Forest]
 
@@ -47,7 +48,7 @@ class BoardMap(ABC):
         for _ in range(items_per_ruin):
             for item in RUIN_ITEMS:
                 ruin_items.append(ItemToken(item, is_ruin_item=True))
-        random.shuffle(ruin_items)
+        self.game.random.ruin_items.shuffle(ruin_items)
         return [Ruin(ruin_items[start_index::4]) for start_index in range(4)]
 
     def get_clearings_of_suit(self, suit: Suit) -> list[Clearing]:
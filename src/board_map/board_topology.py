@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from constants import Suit
+
+
+# The static layout of a single clearing. Neighbours are referred to by priority (clearings) or index (forests), so
+# the layout never refers to any one game's Clearing or Forest objects
+class ClearingTopology:
+    priority: int
+    suit: Suit
+    total_building_slots: int
+    is_corner_clearing: bool
+    opposite_corner_priority: Optional[int]
+    has_ruin: bool
+    path_connected_priorities: tuple[int, ...]
+    river_connected_priorities: tuple[int, ...]
+    adjacent_forest_indices: tuple[int, ...]
+
+    def __init__(self, priority: int, suit: Suit, total_building_slots: int, is_corner_clearing: bool,
+                 opposite_corner_priority: Optional[int], has_ruin: bool, path_connected_priorities: tuple[int, ...],
+                 river_connected_priorities: tuple[int, ...], adjacent_forest_indices: tuple[int, ...]) -> None:
+        self.priority = priority
+        self.suit = suit
+        self.total_building_slots = total_building_slots
+        self.is_corner_clearing = is_corner_clearing
+        self.opposite_corner_priority = opposite_corner_priority
+        self.has_ruin = has_ruin
+        self.path_connected_priorities = path_connected_priorities
+        self.river_connected_priorities = river_connected_priorities
+        self.adjacent_forest_indices = adjacent_forest_indices
+
+
+# The static layout of a whole map, built once per process and shared by every game played on that map
+# Board maps only create the per-game Clearing and Forest objects (and their pieces) on top of it. Since it's built when
+# its module is imported, worker processes forked after the import share it with their parent instead of copying it
+# Nothing should modify a topology once it's built
+class BoardTopology:
+    clearing_topologies: tuple[ClearingTopology, ...]
+    forest_adjacent_forest_indices: tuple[tuple[int, ...], ...]
+    forest_adjacent_clearing_priorities: tuple[tuple[int, ...], ...]
+
+    # Connections only need to be given in one direction, they are made symmetric here
+    def __init__(self, suits: list[Suit], building_slots: list[int], corner_clearing_opposites: dict[int, int],
+                 ruin_priorities: list[int], path_connections: dict[int, list[int]],
+                 river_connections: dict[int, list[int]], clearing_forest_adjacency: dict[int, list[int]],
+                 forest_adjacency: dict[int, list[int]]) -> None:
+        clearing_count = len(suits)
+        path_connected_priorities = get_symmetric_connections(path_connections, range(1, clearing_count + 1))
+        river_connected_priorities = get_symmetric_connections(river_connections, range(1, clearing_count + 1))
+        self.clearing_topologies = tuple(
+            ClearingTopology(priority=priority,
+                             suit=suits[priority - 1],
+                             total_building_slots=building_slots[priority - 1],
+                             is_corner_clearing=priority in corner_clearing_opposites,
+                             opposite_corner_priority=corner_clearing_opposites.get(priority),
+                             has_ruin=priority in ruin_priorities,
+                             path_connected_priorities=path_connected_priorities[priority],
+                             river_connected_priorities=river_connected_priorities[priority],
+                             adjacent_forest_indices=tuple(sorted(clearing_forest_adjacency.get(priority, []))))
+            for priority in range(1, clearing_count + 1))
+        forest_count = max(forest_adjacency) + 1 if forest_adjacency else 0
+        forest_adjacent_forest_indices = get_symmetric_connections(forest_adjacency, range(forest_count))
+        self.forest_adjacent_forest_indices = tuple(forest_adjacent_forest_indices[index]
+                                                    for index in range(forest_count))
+        self.forest_adjacent_clearing_priorities = tuple(
+            tuple(clearing_topology.priority for clearing_topology in self.clearing_topologies
+                  if index in clearing_topology.adjacent_forest_indices)
+            for index in range(forest_count))
+
+    def get_clearing_topology(self, priority: int) -> ClearingTopology:
+        return self.clearing_topologies[priority - 1]
+
+    def get_clearing_count(self) -> int:
+        return len(self.clearing_topologies)
+
+    def get_forest_count(self) -> int:
+        return len(self.forest_adjacent_forest_indices)
+
+
+def get_symmetric_connections(connections: dict[int, list[int]], keys: range) -> dict[int, tuple[int, ...]]:
+    symmetric_connections = {key: set() for key in keys}
+    for origin, destinations in connections.items():
+        for destination in destinations:
+            symmetric_connections[origin].add(destination)
+            symmetric_connections[destination].add(origin)
+    return {key: tuple(sorted(destinations)) for key, destinations in symmetric_connections.items()}
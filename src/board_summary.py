@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game import Game
+    from locations.clearing import Clearing
+    from player_resources.player import Player
+
+
+# Every count the clearing sorting methods need, worked out in a single pass over the pieces in the clearing
+class ClearingSummary:
+    piece_counts: dict[Player, int]
+    warrior_counts: dict[Player, int]
+    building_counts: dict[Player, int]
+    token_counts: dict[Player, int]
+    defenseless_building_counts: dict[Player, int]
+    martial_law_players: set[Player]
+    ruler: Optional[Player]
+    total_piece_count: int
+    total_warrior_count: int
+    total_building_count: int
+    total_token_count: int
+    total_defenseless_building_count: int
+    open_building_slot_count: int
+
+    def __init__(self, clearing: Clearing) -> None:
+        self.piece_counts = {}
+        self.warrior_counts = {}
+        self.building_counts = {}
+        self.token_counts = {}
+        self.defenseless_building_counts = {}
+        self.martial_law_players = set()
+        for player, piece_map in clearing.pieces.items():
+            piece_count = piece_map.get_count_of_pieces()
+            if not piece_count:
+                continue
+            self.piece_counts[player] = piece_count
+            self.warrior_counts[player] = len(piece_map.warriors)
+            self.building_counts[player] = len(piece_map.buildings)
+            self.token_counts[player] = len(piece_map.tokens)
+            # Martial law: Three or more warriors of a single player
+            if len(piece_map.warriors) >= 3:
+                self.martial_law_players.add(player)
+            if clearing.game.capabilities.is_defenseless(player, clearing):
+                self.defenseless_building_counts[player] = len(piece_map.buildings)
+        self.total_piece_count = sum(self.piece_counts.values())
+        self.total_warrior_count = sum(self.warrior_counts.values())
+        self.total_building_count = sum(self.building_counts.values())
+        self.total_token_count = sum(self.token_counts.values())
+        self.total_defenseless_building_count = sum(self.defenseless_building_counts.values())
+        self.open_building_slot_count = clearing.get_open_building_slot_count()
+        # Each player decides for themselves whether they rule (Eyrie Dynasties rule tied clearings)
+        self.ruler = next((player for player in self.piece_counts if player.does_rule_clearing(clearing)), None)
+
+    def get_piece_count_for_player(self, player: Player) -> int:
+        return self.piece_counts.get(player, 0)
+
+    def get_warrior_count_for_player(self, player: Player) -> int:
+        return self.warrior_counts.get(player, 0)
+
+    def get_building_count_for_player(self, player: Player) -> int:
+        return self.building_counts.get(player, 0)
+
+    def get_token_count_for_player(self, player: Player) -> int:
+        return self.token_counts.get(player, 0)
+
+    def get_enemy_piece_count(self, acting_player: Player) -> int:
+        return self.total_piece_count - self.piece_counts.get(acting_player, 0)
+
+    def get_enemy_warrior_count(self, acting_player: Player) -> int:
+        return self.total_warrior_count - self.warrior_counts.get(acting_player, 0)
+
+    def get_enemy_building_count(self, acting_player: Player) -> int:
+        return self.total_building_count - self.building_counts.get(acting_player, 0)
+
+    def get_enemy_token_count(self, acting_player: Player) -> int:
+        return self.total_token_count - self.token_counts.get(acting_player, 0)
+
+    def get_defenseless_enemy_building_count(self, acting_player: Player) -> int:
+        return self.total_defenseless_building_count - self.defenseless_building_counts.get(acting_player, 0)
+
+    def is_under_enemy_martial_law(self, acting_player: Player) -> bool:
+        return any(player != acting_player for player in self.martial_law_players)
+
+
+# A summary of every clearing on the board. Bots get it through get_board_summary, which only rebuilds it after the
+# board has changed
+class BoardSummary:
+    clearing_summaries: dict[Clearing, ClearingSummary]
+
+    def __init__(self, clearings: list[Clearing]) -> None:
+        self.clearing_summaries = {clearing: ClearingSummary(clearing) for clearing in clearings}
+
+    def get_clearing_summary(self, clearing: Clearing) -> ClearingSummary:
+        return self.clearing_summaries[clearing]
+
+
+def get_board_summary(game: Game) -> BoardSummary:
+    return game.query_cache.get(('board_summary',), lambda: BoardSummary(game.clearings()))
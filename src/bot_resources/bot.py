@@ -1,7 +1,6 @@
 from __future__ import annotations
 from abc import ABC
 from collections import defaultdict
-import random
 from typing import Optional, TYPE_CHECKING
 
 from bot_resources.bot_constants import BotDifficulty
@@ -40,11 +39,12 @@ class Bot(Player, ABC):
         # The only corner clearings that start with buildings or tokens on them are homeland corner clearings
         corner_homelands = [clearing for clearing in corner_clearings if clearing.get_total_token_count() > 0 or
                             clearing.get_total_building_count() > 0]
-        if len(corner_homelands) == 3:
-            return [clearing for clearing in corner_clearings if clearing not in corner_homelands][0]
+        free_corner_clearings = [clearing for clearing in corner_clearings if clearing not in corner_homelands]
+        if len(free_corner_clearings) == 1:
+            return free_corner_clearings[0]
         else:
-            random.shuffle(corner_homelands)
-            return corner_homelands[0]
+            self.game.random.corner_homeland.shuffle(free_corner_clearings)
+            return free_corner_clearings[0]
 
     def reveal_order(self) -> None:
         self.order_card = self.game.draw_card()
@@ -107,7 +107,6 @@ class Bot(Player, ABC):
     def remove_snare_if_it_prevents_placing(self, pieces_to_place: list[Piece], sorted_clearings: list[Clearing],
                                             ignore_building_slots: bool = False) -> bool:
         for clearing in sorted_clearings:
-            pieces_in_clearing = clearing.get_pieces()
             for piece in pieces_to_place:
                 # If the issue is not having enough building slots in this clearing, skip that clearing. It's not due
                 # to a snare
@@ -116,7 +115,7 @@ class Bot(Player, ABC):
                     continue
                 # Check if the clearing has any snares - if not, skip that clearing
                 # ...
-                for piece_already_in_clearing in pieces_in_clearing:
+                for piece_already_in_clearing in clearing.placement_restricting_pieces:
                     # Add 'if piece is not snare'. If so, continue
                     if piece_already_in_clearing.prevents_piece_being_placed_by_player(self, piece):
                         continue
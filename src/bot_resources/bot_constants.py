@@ -2,6 +2,6 @@ from enum import Enum
 
 
 class BotDifficulty(Enum):
-    BEGINNER = 0,
-    EXPERT = 1,
+    BEGINNER = 0
+    EXPERT = 1
     MASTER = 2
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import cast, TYPE_CHECKING
 
 from bot_resources.bot_factions.automated_alliance.base import Base
 from bot_resources.bot_factions.automated_alliance.sympathy import Sympathy
@@ -20,7 +20,7 @@ class AutomatedAlliancePieceStock(PieceStock):
         super().__init__(player, warriors, buildings, tokens)
 
     def get_bases(self) -> list[Base]:
-        return [building for building in self.buildings if isinstance(building, Base)]
+        return cast(list[Base], self.get_pieces_of_type(Base))
 
     def get_sympathy(self) -> list[Sympathy]:
-        return [token for token in self.tokens if isinstance(token, Sympathy)]
+        return cast(list[Sympathy], self.get_pieces_of_type(Sympathy))
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import random
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from battle_utils import RollResult, DamageResult
+from board_summary import get_board_summary
 from bot_resources.bot import Bot
 from bot_resources.bot_factions.automated_alliance.automated_alliance_piece_stock import AutomatedAlliancePieceStock
 from bot_resources.bot_factions.automated_alliance.automated_alliance_trait import TRAIT_INFORMANTS, \
@@ -12,8 +13,7 @@ from bot_resources.bot_factions.automated_alliance.sympathy import Sympathy
 from constants import Faction, Suit
 from locations.clearing import Clearing
 from player_resources.supply import Supply
-from sort_utils import sort_clearings_by_enemy_pieces, sort_clearings_by_martial_law, sort_clearings_by_priority, \
-    sort_clearings_by_matching_suit
+from sort_utils import sort_clearings_by_enemy_pieces, sort_clearings_by_priority
 
 if TYPE_CHECKING:
     from deck.cards.card import Card
@@ -34,6 +34,10 @@ class AutomatedAlliancePlayer(Bot):
     crafted_items: list[ItemToken]
     has_revolted: bool
     players_who_have_removed_sympathy_since_last_turn: set[Player]
+    sympathetic_clearings: set[Clearing]
+    sympathy_adjacency_counts: dict[Clearing, int]
+    sympathy_counted_clearings: dict[Clearing, list[Clearing]]  # By sympathetic clearing
+    sympathy_frontier_treats_rivers_as_paths: bool
 
     SYMPATHY_SCORES = [0, 1, 1, 1, 2, 2, 3, 4, 4, 4]
 
@@ -43,6 +47,12 @@ class AutomatedAlliancePlayer(Bot):
 
         self.has_revolted = False
         self.players_who_have_removed_sympathy_since_last_turn = set()
+        # The sympathy frontier: how many sympathetic clearings each clearing is adjacent to. Kept up to date by the
+        # sympathy tokens themselves whenever they're placed or removed
+        self.sympathetic_clearings = set()
+        self.sympathy_adjacency_counts = {}
+        self.sympathy_counted_clearings = {}
+        self.sympathy_frontier_treats_rivers_as_paths = False
 
     def setup(self) -> None:
         pass
@@ -84,17 +94,17 @@ class AutomatedAlliancePlayer(Bot):
         valid_revolt_clearings = []
         for base in self.piece_stock.get_bases():
             # Skip bases that don't match the order card
-            if not Suit.are_suits_equal(base.location, self.order_card.suit):
+            if not Suit.are_suits_equal(base.suit, self.order_card.suit):
                 continue
             # Skip bases that are on the map
             if not isinstance(base.location, Supply):
                 continue
             # Skip bases without matching sympathetic clearings
-            for token in self.piece_stock.get_sympathy():
+            for sympathetic_clearing in self.sympathetic_clearings:
                 # We don't check if clearing.can_place_piece here, because any piece that prevents the base from being
                 # placed is removed by the revolt
-                if isinstance(token.location, Clearing) and token.location.suit == base.suit:
-                    valid_revolt_clearings.append(token.location)
+                if sympathetic_clearing.suit == base.suit:
+                    valid_revolt_clearings.append(sympathetic_clearing)
         return valid_revolt_clearings
 
     def revolt_step(self) -> None:
@@ -121,30 +131,16 @@ class AutomatedAlliancePlayer(Bot):
         self.has_revolted = True
 
     def public_pity(self) -> None:
-        placed_sympathy = [token for token in self.piece_stock.get_sympathy() if isinstance(token.location, Clearing)]
-        if len(placed_sympathy) <= 4:
+        if len(self.sympathetic_clearings) <= 4:
             self.spread_sympathy()
         self.spread_sympathy()
 
     def spread_sympathy(self, score: bool = True) -> None:
-        unplaced_sympathy = [token for token in self.get_unplaced_tokens()]
-        if not unplaced_sympathy:
+        if not self.get_unplaced_token_count():
             self.score_bonus_for_unplaced_sympathy(score)
             return
 
-        sympathy_tokens_clearings = [token.location for token in self.piece_stock.get_sympathy() if
-                                     isinstance(token.location, Clearing)]
-        # If no sympathy tokens are already on the map, the first token can be placed anywhere
-        if not sympathy_tokens_clearings:
-            sympathy_adjacent_clearings = [clearing for clearing in self.game.clearings()]
-        # Otherwise, we only look at clearings already adjacent to sympathy tokens
-        else:
-            sympathy_adjacent_clearings = set()
-            for sympathetic_clearing in sympathy_tokens_clearings:
-                adjacent_clearings = self.get_adjacent_clearings(sympathetic_clearing)
-                for adjacent_clearing in adjacent_clearings:
-                    sympathy_adjacent_clearings.add(adjacent_clearing)
-            sympathy_adjacent_clearings = list(sympathy_adjacent_clearings)
+        sympathy_adjacent_clearings = self.get_sympathy_frontier()
         if not sympathy_adjacent_clearings:
             self.score_bonus_for_unplaced_sympathy(score)
             return
@@ -154,6 +150,41 @@ class AutomatedAlliancePlayer(Bot):
         else:
             self.spread_sympathy_without_bird_order_card(sympathy_adjacent_clearings, score)
 
+    # If no sympathy tokens are already on the map, the first token can be placed anywhere
+    # Otherwise, we only look at clearings already adjacent to sympathy tokens
+    def get_sympathy_frontier(self) -> list[Clearing]:
+        if not self.sympathetic_clearings:
+            return [clearing for clearing in self.game.clearings()]
+        # Gaining (or losing) river paths changes which clearings every sympathetic clearing is adjacent to
+        if self.game.capabilities.treats_rivers_as_paths(self) != self.sympathy_frontier_treats_rivers_as_paths:
+            self.rebuild_sympathy_frontier()
+        return list(self.sympathy_adjacency_counts)
+
+    def update_sympathy_frontier(self, previous_location: Optional[Location], new_location: Location) -> None:
+        if isinstance(previous_location, Clearing):
+            self.sympathetic_clearings.discard(previous_location)
+            # Only the clearings this sympathy was counted in are uncounted, even if its adjacency has changed since
+            for adjacent_clearing in self.sympathy_counted_clearings.pop(previous_location, []):
+                self.sympathy_adjacency_counts[adjacent_clearing] -= 1
+                if not self.sympathy_adjacency_counts[adjacent_clearing]:
+                    del self.sympathy_adjacency_counts[adjacent_clearing]
+        if isinstance(new_location, Clearing):
+            self.sympathetic_clearings.add(new_location)
+            adjacent_clearings = self.get_adjacent_clearings(new_location)
+            self.sympathy_counted_clearings[new_location] = adjacent_clearings
+            for adjacent_clearing in adjacent_clearings:
+                self.sympathy_adjacency_counts[adjacent_clearing] = \
+                    self.sympathy_adjacency_counts.get(adjacent_clearing, 0) + 1
+
+    # Recomputes the sympathy frontier from scratch, from wherever the sympathy tokens currently are
+    def rebuild_sympathy_frontier(self) -> None:
+        self.sympathetic_clearings = set()
+        self.sympathy_adjacency_counts = {}
+        self.sympathy_counted_clearings = {}
+        self.sympathy_frontier_treats_rivers_as_paths = self.game.capabilities.treats_rivers_as_paths(self)
+        for token in self.piece_stock.get_sympathy():
+            self.update_sympathy_frontier(None, token.location)
+
     # If no sympathy tokens are on the map, sympathy_adjacent_clearings is all clearings
     # Otherwise, it's all clearings that are adjacent to a clearing with a sympathy token
     # Spread using the tie-breaker: Avoid martial law -> respect order suit -> high priority
@@ -161,14 +192,16 @@ class AutomatedAlliancePlayer(Bot):
                                                 score: bool = True) -> None:
         unplaced_sympathy = [token for token in self.get_unplaced_tokens()]
         unplaced_sympathy_count = len(unplaced_sympathy)
-        sorted_sympathy_adjacent_clearings = sort_clearings_by_priority(sympathy_adjacent_clearings)
-        sorted_sympathy_adjacent_clearings = sort_clearings_by_matching_suit(sorted_sympathy_adjacent_clearings,
-                                                                             self.order_card.suit)
-        sorted_sympathy_adjacent_clearings = sort_clearings_by_martial_law(sorted_sympathy_adjacent_clearings, self)
+        # A single sort on the whole tie-breaker, in the same order as sorting by priority, then by matching suit, then
+        # by martial law
+        board_summary = get_board_summary(self.game)
+        sorted_sympathy_adjacent_clearings = sorted(sympathy_adjacent_clearings, key=lambda c: (
+            not board_summary.get_clearing_summary(c).is_under_enemy_martial_law(self),
+            not Suit.are_suits_equal(c.suit, self.order_card.suit), c.priority))
 
         self.place_pieces_in_one_of_clearings(unplaced_sympathy[:1], sorted_sympathy_adjacent_clearings)
         if score:
-            if unplaced_sympathy_count > len(self.get_unplaced_tokens()):
+            if unplaced_sympathy_count > self.get_unplaced_token_count():
                 self.score_for_sympathy()
             else:
                 self.score_bonus_for_unplaced_sympathy(score)
@@ -183,7 +216,7 @@ class AutomatedAlliancePlayer(Bot):
         sorted_sympathy_adjacent_clearings = sort_clearings_by_priority(sympathy_adjacent_clearings, descending=False)
         self.place_pieces_in_one_of_clearings(unplaced_sympathy[:1], sorted_sympathy_adjacent_clearings)
         if score:
-            if unplaced_sympathy_count > len(self.get_unplaced_tokens()):
+            if unplaced_sympathy_count > self.get_unplaced_token_count():
                 self.score_for_sympathy()
             else:
                 self.score_bonus_for_unplaced_sympathy(score)
@@ -286,14 +319,13 @@ class AutomatedAlliancePlayer(Bot):
     def move_removed_pieces_into_supply(self, pieces: list[Piece], origin_location: Location) -> None:
         for piece in pieces:
             if isinstance(piece, Base):
-                for sympathy in self.piece_stock.get_sympathy():
-                    if isinstance(sympathy.location, Clearing) and sympathy.location.suit == piece.suit:
-                        sympathy.location.remove_pieces(self, [sympathy])
+                for sympathetic_clearing in list(self.sympathetic_clearings):
+                    if sympathetic_clearing.suit == piece.suit:
+                        sympathetic_clearing.remove_pieces(self, sympathetic_clearing.get_tokens_for_player(self))
         self.supply.add_pieces(self, pieces)
 
     def score_for_sympathy(self) -> None:
-        placed_sympathy = [token for token in self.piece_stock.get_sympathy() if isinstance(token.location, Clearing)]
-        score_for_sympathy = self.SYMPATHY_SCORES[len(placed_sympathy) - 1]
+        score_for_sympathy = self.SYMPATHY_SCORES[len(self.sympathetic_clearings) - 1]
         self.add_victory_points(score_for_sympathy)
 
     def score_bonus_for_unplaced_sympathy(self, score: bool) -> None:
@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from pieces.token import Token
 
 if TYPE_CHECKING:
     from bot_resources.bot_factions.automated_alliance.automated_alliance_player import AutomatedAlliancePlayer
+    from locations.location import Location
     from pieces.piece import Piece
 
 
@@ -14,3 +15,10 @@ class Sympathy(Token):
 
     def prevents_piece_being_placed_by_player(self, player: AutomatedAlliancePlayer, piece: Piece) -> bool:
         return isinstance(piece, Sympathy)
+
+    # The Alliance keeps track of which clearings its sympathy can spread to as tokens are placed and removed
+    def update_location(self, location: Optional[Location]) -> None:
+        previous_location = self.location
+        super().update_location(location)
+        if previous_location is not self.location:
+            self.player.update_sympathy_frontier(previous_location, self.location)
@@ -1,5 +1,5 @@
+from __future__ import annotations
 from typing import TYPE_CHECKING
-import random
 
 from bot_resources.bot_factions.electric_eyrie.loyal_vizier import LoyalVizier
 from constants import Suit
@@ -10,8 +10,11 @@ if TYPE_CHECKING:
 
 
 class Decree:
+    player: ElectricEyriePlayer
     viziers: list[LoyalVizier]
     columns: dict[Suit, list[Card]]
+    suited_card_counts: dict[Suit, int]
+    most_cards_in_a_column: int
 
     def __init__(self, player: ElectricEyriePlayer) -> None:
         self.player = player
@@ -22,30 +25,51 @@ class Decree:
             Suit.RABBIT: [],
             Suit.BIRD: [vizier for vizier in self.viziers]
         }
+        # Kept up to date as cards are added and purged, so resolving the decree never has to recount the columns
+        self.suited_card_counts = {suit: len(column) for suit, column in self.columns.items()}
+        self.most_cards_in_a_column = max(self.suited_card_counts.values())
+        self.player.game.zobrist_hash.add_features(self.get_card_features())
 
     def add_to_decree(self, card: Card) -> None:
         self.columns[card.suit].append(card)
+        self.player.game.zobrist_hash.add_feature(self.get_card_feature(card.suit, card))
+        self.suited_card_counts[card.suit] += 1
+        self.most_cards_in_a_column = max(self.most_cards_in_a_column, self.suited_card_counts[card.suit])
+
+    # Replaces the whole decree, such as when restoring a saved game
+    def restore_columns(self, columns: dict[Suit, list[Card]]) -> None:
+        self.player.game.zobrist_hash.remove_features(self.get_card_features())
+        self.columns = columns
+        self.player.game.zobrist_hash.add_features(self.get_card_features())
+        self.suited_card_counts = {suit: len(column) for suit, column in self.columns.items()}
+        self.most_cards_in_a_column = max(self.suited_card_counts.values())
 
     def get_count_of_suited_cards_in_decree(self, suit: Suit) -> int:
-        return len(self.columns[suit])
+        return self.suited_card_counts[suit]
 
     def get_count_of_bird_cards_in_decree(self) -> int:
         return self.get_count_of_suited_cards_in_decree(Suit.BIRD)
 
     def column_has_most_cards(self, suit: Suit) -> bool:
-        suited_card_count = self.get_count_of_suited_cards_in_decree(suit)
-        for column_suit, cards in self.columns.items():
-            if len(cards) > suited_card_count:
-                return False
-        return True
+        return self.suited_card_counts[suit] == self.most_cards_in_a_column
 
+    # Every card but the Loyal Viziers is discarded together, and the Loyal Viziers return to the bird column
     def purge(self) -> None:
-        discarded_cards = []
+        discarded_cards = [card for column in self.columns.values() for card in column
+                           if not isinstance(card, LoyalVizier)]
+        self.player.game.zobrist_hash.remove_features(self.get_card_features())
         for column in self.columns.values():
-            for card in column:
-                if not isinstance(card, LoyalVizier):
-                    discarded_cards.append(card)
-                column.remove(card)
-        random.shuffle(discarded_cards)
-        for card in discarded_cards:
-            self.player.game.discard_card(card)
+            column.clear()
+        self.columns[Suit.BIRD].extend(self.viziers)
+        self.player.game.zobrist_hash.add_features(self.get_card_features())
+        self.suited_card_counts = {suit: len(column) for suit, column in self.columns.items()}
+        self.most_cards_in_a_column = len(self.viziers)
+        self.player.game.discard_cards(discarded_cards)
+
+    # The order of cards within a column doesn't matter, so each card is hashed by its column alone
+    def get_card_feature(self, column_suit: Suit, card: Card) -> tuple:
+        return 'Decree', self.player.faction, column_suit, card.name, card.suit
+
+    def get_card_features(self) -> list[tuple]:
+        return [self.get_card_feature(column_suit, card) for column_suit, column in self.columns.items()
+                for card in column]
@@ -1,6 +1,5 @@
 from __future__ import annotations
-from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import cast, TYPE_CHECKING
 
 from bot_resources.bot_factions.electric_eyrie.roost import Roost
 from pieces.warrior import Warrior
@@ -18,4 +17,4 @@ class ElectricEyriePieceStock(PieceStock):
         super().__init__(player, warriors, buildings)
 
     def get_roosts(self) -> list[Roost]:
-        return [building for building in self.buildings if isinstance(building, Roost)]
+        return cast(list[Roost], self.get_pieces_of_type(Roost))
@@ -1,12 +1,13 @@
 from __future__ import annotations
-import random
 from typing import TYPE_CHECKING
 
+from board_summary import get_board_summary
 from bot_resources.bot import Bot
 from bot_resources.bot_factions.electric_eyrie.decree import Decree
 from bot_resources.bot_factions.electric_eyrie.electric_eyrie_piece_stock import ElectricEyriePieceStock
 from bot_resources.bot_factions.electric_eyrie.electric_eyrie_trait import TRAIT_NOBILITY, TRAIT_RELENTLESS, \
     TRAIT_SWOOP, TRAIT_WAR_TAX
+from bot_resources.move_planner import MovePlanner
 from constants import Faction, Suit
 from locations.clearing import Clearing
 from pieces.building import Building
@@ -66,7 +67,7 @@ class ElectricEyriePlayer(Bot):
         self.turmoil = False
         self.reveal_order()
         self.decree.add_to_decree(self.order_card)
-        if len(self.get_unplaced_buildings()) == 7:
+        if self.get_unplaced_building_count() == 7:
             self.replace_first_roost()
 
     def daylight(self) -> None:
@@ -93,7 +94,7 @@ class ElectricEyriePlayer(Bot):
     ###################
 
     def recruit_step(self, suit: Suit) -> None:
-        warrior_count_in_supply = len(self.get_unplaced_warriors())
+        warrior_count_in_supply = self.get_unplaced_warrior_count()
 
         # Skip recruiting for columns with 0 cards in the suit, or if you are in turmoil
         if self.turmoil or self.decree.get_count_of_suited_cards_in_decree(suit) == 0:
@@ -116,7 +117,7 @@ class ElectricEyriePlayer(Bot):
         # TODO: Remove - Nobility update
         # If we couldn't recruit anywhere, or couldn't recruit as many warriors as we were supposed to, check if we
         # have the Nobility trait. If so, enter turmoil
-        warrior_count_recruited = warrior_count_in_supply - len(self.get_unplaced_warriors())
+        warrior_count_recruited = warrior_count_in_supply - self.get_unplaced_warrior_count()
         if warrior_count_recruited < self.get_recruiting_amount(suit):
             if self.has_trait(TRAIT_NOBILITY):
                 self.turmoil = True
@@ -152,21 +153,15 @@ class ElectricEyriePlayer(Bot):
         sorted_suited_clearings = sort_clearings_by_priority(suited_ruled_clearings)
         sorted_suited_clearings = sort_clearings_by_own_warriors(sorted_suited_clearings, self)
 
-        for origin_clearing in sorted_suited_clearings:
-            warriors_to_move = self.get_warriors_to_move(origin_clearing, suit)
-
-            destination_clearings = self.get_movement_destinations(origin_clearing)
-            for destination in destination_clearings:
-                if origin_clearing.can_move_pieces(self, warriors_to_move, destination, requires_rule=True):
-                    self.move(warriors_to_move, origin_clearing, destination)
-                    return
+        move_planner = MovePlanner(self, self.get_movement_destinations)
+        planned_move, blocked_move = move_planner.plan_move(
+            sorted_suited_clearings, lambda origin_clearing: self.get_warriors_to_move(origin_clearing, suit))
+        if planned_move:
+            self.move(planned_move.pieces, planned_move.origin, planned_move.destination)
         # If we couldn't move anywhere, check if it was due to a snare, and remove that snare if so
-        for origin_clearing in sorted_suited_clearings:
-            warriors_to_move = self.get_warriors_to_move(origin_clearing, suit)
-
-            destination_clearings = self.get_movement_destinations(origin_clearing)
-            if self.remove_snare_if_it_prevents_movement(warriors_to_move, origin_clearing, destination_clearings):
-                return
+        elif blocked_move:
+            self.remove_snare_if_it_prevents_movement(blocked_move.pieces, blocked_move.origin,
+                                                      [blocked_move.destination])
 
     def get_warriors_to_move(self, origin_clearing: Clearing, suit: Suit) -> list[Warrior]:
         own_rule_value = self.get_rule_value(origin_clearing)
@@ -179,6 +174,10 @@ class ElectricEyriePlayer(Bot):
         return origin_clearing.get_warriors_for_player(self)[:warrior_count_to_move]
 
     def get_movement_destinations(self, origin_clearing: Clearing) -> list[Clearing]:
+        return list(self.game.query_cache.get(('movement_destinations', self, origin_clearing),
+                                              lambda: self.sort_movement_destinations(origin_clearing)))
+
+    def sort_movement_destinations(self, origin_clearing: Clearing) -> list[Clearing]:
         potential_destination_clearings = [clearing for clearing in self.get_adjacent_clearings(origin_clearing)]
         # Find destinations this move could end in, sorted by [no roost] -> [min enemy pieces] -> [lowest priority]
         sorted_destination_clearings = sort_clearings_by_priority(potential_destination_clearings, descending=True)
@@ -227,8 +226,11 @@ class ElectricEyriePlayer(Bot):
                             clearing.is_player_warriors_in_location(self) and
                             clearing.is_any_other_player_in_location(self)]
         sorted_suited_clearings = sort_clearings_by_priority(suited_clearings)
-        sorted_suited_clearings = sort_clearings_by_defenseless_enemy_buildings(sorted_suited_clearings, self)
-        sorted_suited_clearings = sort_clearings_by_any_own_buildings(sorted_suited_clearings, self, descending=False)
+        board_summary = get_board_summary(self.game)
+        sorted_suited_clearings = sort_clearings_by_defenseless_enemy_buildings(sorted_suited_clearings, self,
+                                                                                board_summary=board_summary)
+        sorted_suited_clearings = sort_clearings_by_any_own_buildings(sorted_suited_clearings, self, descending=False,
+                                                                      board_summary=board_summary)
         # TODO: Mercenaries prevent fighting otters
         if not sorted_suited_clearings:
             return
@@ -247,7 +249,7 @@ class ElectricEyriePlayer(Bot):
             self.battle(clearing, potential_targets[0])
 
     def battle(self, clearing: Clearing, defender: Player) -> None:
-        random_rolls = (random.randint(0, 3), random.randint(0, 3))
+        random_rolls = self.game.random.roll_battle_dice()
         # Defender allocates the rolls - high roll to attacker, low roll to defender, except in the case of Veterans
         roll_result = defender.allocate_rolls_as_defender(random_rolls)
         # Each battler caps their hits and adds their relevant bonus hits
@@ -287,12 +289,12 @@ class ElectricEyriePlayer(Bot):
         self.place_pieces_in_one_of_clearings(unplaced_roosts[:1], sorted_ruled_clearings)
 
         # If we failed to place a roost, enter turmoil
-        roost_placed = unplaced_roosts_count > len(self.get_unplaced_buildings())
+        roost_placed = unplaced_roosts_count > self.get_unplaced_building_count()
         if not roost_placed:
             self.turmoil = True
 
     def get_score_for_roosts(self) -> int:
-        return max(0, len(self.get_unplaced_buildings()) - 1)
+        return max(0, self.get_unplaced_building_count() - 1)
 
     #########################
     #                       #
@@ -302,7 +304,7 @@ class ElectricEyriePlayer(Bot):
 
     def replace_first_roost(self):
         roost_to_place = self.get_unplaced_buildings()[0]
-        warrior_count_to_place = max(4, len(self.get_unplaced_warriors()))
+        warrior_count_to_place = max(4, self.get_unplaced_warrior_count())
         warriors_to_place = self.get_unplaced_warriors()[:warrior_count_to_place]
         pieces_to_place = [roost_to_place]
         pieces_to_place.extend(warriors_to_place)
@@ -329,7 +331,7 @@ class ElectricEyriePlayer(Bot):
 
     def swoop(self) -> None:
         # TODO: Triggers Nobility turmoil? - No, Nobility update
-        warrior_count_to_place = max(2, len(self.get_unplaced_warriors()))
+        warrior_count_to_place = max(2, self.get_unplaced_warrior_count())
         warriors_to_place = self.get_unplaced_warriors()[:warrior_count_to_place]
         clearings_without_own_pieces = [clearing for clearing in self.game.clearings() if
                                         clearing.get_piece_count_for_player(self) == 0]
@@ -374,3 +376,6 @@ class ElectricEyriePlayer(Bot):
         if self.deal_extra_hit:
             bonus_hits += 1
         return bonus_hits
+
+    def get_zobrist_features(self) -> list[tuple]:
+        return super().get_zobrist_features() + self.decree.get_card_features()
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import cast, TYPE_CHECKING
 
 from bot_resources.bot_factions.mechanical_marquise_v2.keep import Keep
 from bot_resources.bot_factions.mechanical_marquise_v2.recruiter import Recruiter
@@ -29,16 +29,13 @@ class MechanicalMarquiseV2PieceStock(PieceStock):
         super().__init__(player, warriors, buildings, tokens)
 
     def get_sawmills(self) -> list[Sawmill]:
-        sawmills = [building for building in self.buildings if isinstance(building, Sawmill)]
-        return sawmills
+        return cast(list[Sawmill], self.get_pieces_of_type(Sawmill))
 
     def get_workshops(self) -> list[Workshop]:
-        workshops = [building for building in self.buildings if isinstance(building, Workshop)]
-        return workshops
+        return cast(list[Workshop], self.get_pieces_of_type(Workshop))
 
     def get_recruiters(self) -> list[Recruiter]:
-        recruiters = [building for building in self.buildings if isinstance(building, Recruiter)]
-        return recruiters
+        return cast(list[Recruiter], self.get_pieces_of_type(Recruiter))
 
     def get_keep(self) -> Keep:
-        return [token for token in self.tokens if isinstance(token, Keep)][0]
+        return cast(Keep, self.pieces_by_type[Keep][0])
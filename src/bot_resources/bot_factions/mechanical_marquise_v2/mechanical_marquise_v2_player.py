@@ -15,6 +15,7 @@ from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_tr
 from bot_resources.bot_factions.mechanical_marquise_v2.recruiter import Recruiter
 from bot_resources.bot_factions.mechanical_marquise_v2.sawmill import Sawmill
 from bot_resources.bot_factions.mechanical_marquise_v2.workshop import Workshop
+from bot_resources.move_planner import MovePlanner, PlannedMove
 from constants import Faction, Suit
 from locations.clearing import Clearing
 from pieces.warrior import Warrior
@@ -41,7 +42,7 @@ class MechanicalMarquiseV2Player(Bot):
 
     def __init__(self, game: Game) -> None:
         piece_stock = MechanicalMarquiseV2PieceStock(self)
-        super().__init__(game, Faction.MARQUISE_DE_CAT, piece_stock)
+        super().__init__(game, Faction.MECHANICAL_MARQUISE_2_0, piece_stock)
 
         self.built_building_this_turn = False
 
@@ -182,7 +183,7 @@ class MechanicalMarquiseV2Player(Bot):
     ###################
 
     def recruit_step(self) -> None:
-        warrior_count_in_supply = len(self.get_unplaced_warriors())
+        warrior_count_in_supply = self.get_unplaced_warrior_count()
 
         warriors_to_recruit = self.get_warriors_to_recruit()
         if not warriors_to_recruit:
@@ -195,11 +196,11 @@ class MechanicalMarquiseV2Player(Bot):
         # TODO: Update to BASE-2: Try and fail to recruit at the snare
         self.place_pieces_spread_among_clearings(warriors_to_recruit, sorted_ruled_ordered_clearings)
 
-        warrior_count_recruited = warrior_count_in_supply - len(self.get_unplaced_warriors())
+        warrior_count_recruited = warrior_count_in_supply - self.get_unplaced_warrior_count()
         self.score_for_failing_to_recruit(self.get_recruiting_amount() - warrior_count_recruited)
 
     def escalated_recruit_step(self) -> None:
-        warrior_count_in_supply = len(self.get_unplaced_warriors())
+        warrior_count_in_supply = self.get_unplaced_warrior_count()
 
         warriors_to_recruit = self.get_warriors_to_recruit()
         if not warriors_to_recruit:
@@ -215,7 +216,7 @@ class MechanicalMarquiseV2Player(Bot):
         # TODO: Update to ESCALATED-3: Try and fail to recruit at the snare
         self.place_pieces_spread_among_clearings(warriors_to_recruit, sorted_ruled_clearings)
 
-        warrior_count_recruited = warrior_count_in_supply - len(self.get_unplaced_warriors())
+        warrior_count_recruited = warrior_count_in_supply - self.get_unplaced_warrior_count()
         self.score_for_failing_to_recruit(self.get_recruiting_amount() - warrior_count_recruited)
 
     def get_warriors_to_recruit(self) -> list[Warrior]:
@@ -276,39 +277,27 @@ class MechanicalMarquiseV2Player(Bot):
         return sorted_ruled_clearings
 
     def get_suited_building_to_build(self, suit: Suit) -> Optional[MechanicalMarquiseV2Building]:
-        unplaced_ordered_buildings = [building for building in
-                                      cast(list[MechanicalMarquiseV2Building], self.get_unplaced_buildings()) if
-                                      building.suit == suit]
-        if unplaced_ordered_buildings:
-            return unplaced_ordered_buildings[0]
-        return None
+        return cast(Optional[MechanicalMarquiseV2Building], self.supply.get_first_piece_of_suit(suit))
 
     def get_building_of_most_common_suit_on_board_unless_all_on_board(self) -> Optional[MechanicalMarquiseV2Building]:
-        unplaced_buildings = self.get_unplaced_buildings()
-        unplaced_sawmills = [building for building in unplaced_buildings if isinstance(building, Sawmill)]
-        unplaced_sawmill_count = len(unplaced_sawmills)
-        unplaced_workshops = [building for building in unplaced_buildings if isinstance(building, Workshop)]
-        unplaced_workshop_count = len(unplaced_workshops)
-        unplaced_recruiters = [building for building in unplaced_buildings if isinstance(building, Recruiter)]
-        unplaced_recruiter_count = len(unplaced_recruiters)
+        unplaced_sawmill_count = self.supply.get_count_of_pieces_of_type(Sawmill)
+        unplaced_workshop_count = self.supply.get_count_of_pieces_of_type(Workshop)
+        unplaced_recruiter_count = self.supply.get_count_of_pieces_of_type(Recruiter)
 
         if 0 < unplaced_sawmill_count <= unplaced_recruiter_count and unplaced_sawmill_count <= unplaced_workshop_count:
-            return unplaced_sawmills[0]
+            building_class = Sawmill
         elif 0 < unplaced_workshop_count <= unplaced_recruiter_count:
-            return unplaced_workshops[0]
+            building_class = Workshop
         elif 0 < unplaced_recruiter_count:
-            return unplaced_recruiters[0]
+            building_class = Recruiter
         else:
             return None
+        return cast(MechanicalMarquiseV2Building, self.supply.get_first_piece_of_type(building_class))
 
     def get_class_of_most_common_building_on_board(self) -> Type[MechanicalMarquiseV2Building]:
-        unplaced_buildings = self.get_unplaced_buildings()
-        unplaced_sawmills = [building for building in unplaced_buildings if isinstance(building, Sawmill)]
-        unplaced_sawmill_count = len(unplaced_sawmills)
-        unplaced_workshops = [building for building in unplaced_buildings if isinstance(building, Workshop)]
-        unplaced_workshop_count = len(unplaced_workshops)
-        unplaced_recruiters = [building for building in unplaced_buildings if isinstance(building, Recruiter)]
-        unplaced_recruiter_count = len(unplaced_recruiters)
+        unplaced_sawmill_count = self.supply.get_count_of_pieces_of_type(Sawmill)
+        unplaced_workshop_count = self.supply.get_count_of_pieces_of_type(Workshop)
+        unplaced_recruiter_count = self.supply.get_count_of_pieces_of_type(Recruiter)
 
         if unplaced_sawmill_count <= unplaced_recruiter_count and unplaced_sawmill_count <= unplaced_workshop_count:
             return Sawmill
@@ -323,16 +312,10 @@ class MechanicalMarquiseV2Player(Bot):
 
     def get_score_for_building(self) -> int:
         if self.order_card.suit != Suit.BIRD:
-            unplaced_ordered_buildings = [building for building in
-                                          cast(list[MechanicalMarquiseV2Building], self.get_unplaced_buildings()) if
-                                          building.suit == self.order_card.suit]
-            return max(0, 5 - len(unplaced_ordered_buildings))
+            return max(0, 5 - self.supply.get_count_of_pieces_of_suit(self.order_card.suit))
 
         most_common_building_class = self.get_class_of_most_common_building_on_board()
-        unplaced_common_buildings = [building for building in
-                                     cast(list[MechanicalMarquiseV2Building], self.get_unplaced_buildings()) if
-                                     isinstance(building, most_common_building_class)]
-        return max(0, 5 - len(unplaced_common_buildings))
+        return max(0, 5 - self.supply.get_count_of_pieces_of_type(most_common_building_class))
 
     ################
     #              #
@@ -341,41 +324,45 @@ class MechanicalMarquiseV2Player(Bot):
     ################
 
     def move_step(self) -> None:
-        planned_movements = self.prepare_origin_movements()
-        for origin_clearing in sort_clearings_by_priority(list(planned_movements.keys())):
-            destination_clearing = planned_movements.get(origin_clearing)
-            warriors_to_move = origin_clearing.get_warriors_for_player(self)[3:]
-            self.move(warriors_to_move, origin_clearing, destination_clearing)
+        self.perform_planned_moves(self.prepare_origin_movements())
 
     def escalated_move_step(self) -> list[Clearing]:
+        return self.perform_planned_moves(self.prepare_origin_movements())
+
+    def perform_planned_moves(self, planned_moves: list[PlannedMove]) -> list[Clearing]:
         destinations = []
-        planned_movements = self.prepare_origin_movements()
-        for origin_clearing in sort_clearings_by_priority(list(planned_movements.keys())):
-            destination_clearing = planned_movements.get(origin_clearing)
-            warriors_to_move = origin_clearing.get_warriors_for_player(self)[3:]
-            self.move(warriors_to_move, origin_clearing, destination_clearing)
-            destinations.append(destination_clearing)
+        for planned_move in planned_moves:
+            self.move(planned_move.pieces, planned_move.origin, planned_move.destination)
+            destinations.append(planned_move.destination)
         return destinations
 
-    def prepare_origin_movements(self) -> dict[Clearing, Clearing]:
-        planned_movements = {}
+    # All moves are planned against the board before any of them are made, so warriors that arrive in a clearing
+    # during the move step don't move again from there
+    def prepare_origin_movements(self) -> list[PlannedMove]:
+        planned_moves = []
+        move_planner = self.create_move_planner()
         origin_clearings = [clearing for clearing in self.get_ruled_ordered_clearings() if
                             clearing.get_warrior_count_for_player(self) > 3]
-        sort_clearings_by_priority(origin_clearings)
+        origin_clearings = sort_clearings_by_priority(origin_clearings)
         for origin_clearing in origin_clearings:
-            valid_destination_clearings = self.find_adjacent_clearings_sorted_by_most_enemy_pieces(origin_clearing)
-            for destination_clearing in valid_destination_clearings:
-                if origin_clearing.can_move_pieces(self, origin_clearing.get_warriors_for_player(self),
-                                                   destination_clearing, requires_rule=True):
-                    planned_movements[origin_clearing] = destination_clearing
-                    break
+            warriors_to_move = origin_clearing.get_warriors_for_player(self)[3:]
+            planned_move = move_planner.plan_move_from_origin(origin_clearing, warriors_to_move)
+            if not planned_move:
+                continue
+            if not planned_move.is_blocked_from_leaving:
+                planned_moves.append(planned_move)
             # If we haven't found any legal destination, check if it was due to a snare, and remove that snare if so
-            if origin_clearing not in planned_movements:
-                self.remove_snare_if_it_prevents_movement(origin_clearing.get_warriors_for_player(self),
-                                                          origin_clearing, valid_destination_clearings)
-        return planned_movements
+            else:
+                self.remove_snare_if_it_prevents_movement(planned_move.pieces, origin_clearing,
+                                                          [planned_move.destination])
+        return planned_moves
+
+    # The planner already ranks each origin's destinations once per step, and every step that moves changes the board,
+    # so ranking them through the query cache would never hit
+    def create_move_planner(self) -> MovePlanner:
+        return MovePlanner(self, self.sort_adjacent_clearings_by_most_enemy_pieces)
 
-    def find_adjacent_clearings_sorted_by_most_enemy_pieces(self, origin_clearing: Clearing) -> list[Clearing]:
+    def sort_adjacent_clearings_by_most_enemy_pieces(self, origin_clearing: Clearing) -> list[Clearing]:
         adjacent_clearings = self.get_adjacent_clearings(origin_clearing)
         # Sort by priority first, then by enemy piece count so priority is the tie-breaker
         adjacent_clearings = sort_clearings_by_priority(adjacent_clearings)
@@ -396,27 +383,20 @@ class MechanicalMarquiseV2Player(Bot):
 
     def blitz(self) -> None:
         ruled_empty_clearings = [clearing for clearing in self.get_ruled_clearings() if
-                                 clearing.get_total_piece_count() == clearing.get_piece_count_for_player(self)]
+                                 clearing.get_total_piece_count() == clearing.get_piece_count_for_player(self) and
+                                 clearing.get_warrior_count_for_player(self) > 1]
         ruled_empty_clearings = sort_clearings_by_priority(ruled_empty_clearings)
-        for origin_clearing in ruled_empty_clearings:
-            warriors_in_clearing = origin_clearing.get_warriors_for_player(self)
-            warriors_to_move = warriors_in_clearing[1:]
-            if warriors_to_move:
-                valid_destination_clearings = self.find_adjacent_clearings_sorted_by_most_enemy_pieces(origin_clearing)
-                for destination_clearing in valid_destination_clearings:
-                    if origin_clearing.can_move_pieces(self, warriors_to_move, destination_clearing):
-                        self.move(warriors_to_move, origin_clearing, destination_clearing)
-                        self.initiate_battle(destination_clearing)
-                        return
+        move_planner = self.create_move_planner()
+        planned_move, blocked_move = move_planner.plan_move(
+            ruled_empty_clearings, lambda origin_clearing: origin_clearing.get_warriors_for_player(self)[1:],
+            requires_rule=False)
+        if planned_move:
+            self.move(planned_move.pieces, planned_move.origin, planned_move.destination)
+            self.initiate_battle(planned_move.destination)
         # If we haven't found any legal movement, check if it was due to a snare, and remove that snare if so
-        for origin_clearing in ruled_empty_clearings:
-            warriors_in_clearing = origin_clearing.get_warriors_for_player(self)
-            warriors_to_move = warriors_in_clearing[1:]
-            if warriors_to_move:
-                valid_destination_clearings = self.find_adjacent_clearings_sorted_by_most_enemy_pieces(origin_clearing)
-                if self.remove_snare_if_it_prevents_movement(warriors_to_move, origin_clearing,
-                                                             valid_destination_clearings):
-                    return
+        elif blocked_move:
+            self.remove_snare_if_it_prevents_movement(blocked_move.pieces, blocked_move.origin,
+                                                      [blocked_move.destination], requires_rule=False)
 
     # MM2.0 takes half the damage of a normal hit if they're Fortified, and in a clearing with only their buildings
     def halves_damage(self, battle_clearing: Clearing) -> bool:
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from player_resources.supply import Supply
@@ -9,52 +10,87 @@ if TYPE_CHECKING:
     from player_resources.player import Player
 
 
+# Items are bucketed by state (undamaged/damaged x ready/exhausted) in insertion-ordered dicts, so exhausting,
+# refreshing, repairing and damaging only touch the items involved and availability checks are just a len()
 class Satchel(Supply):
-    undamaged_items: list[ItemToken]
-    damaged_items: list[ItemToken]
+    undamaged_ready_items: dict[ItemToken, None]
+    undamaged_exhausted_items: dict[ItemToken, None]
+    damaged_ready_items: dict[ItemToken, None]
+    damaged_exhausted_items: dict[ItemToken, None]
     battle_track: list[ItemToken]
 
     def __init__(self, game: Game, player: Player) -> None:
         super().__init__(game, player)
-        self.undamaged_items = []
-        self.damaged_items = []
+        self.undamaged_ready_items = {}
+        self.undamaged_exhausted_items = {}
+        self.damaged_ready_items = {}
+        self.damaged_exhausted_items = {}
         self.battle_track = []
 
+    @property
+    def undamaged_items(self) -> list[ItemToken]:
+        return [*self.undamaged_ready_items, *self.undamaged_exhausted_items]
+
+    @property
+    def damaged_items(self) -> list[ItemToken]:
+        return [*self.damaged_ready_items, *self.damaged_exhausted_items]
+
+    # An item_count below 1 returns every item in the bucket
+    @staticmethod
+    def get_items_from_bucket(bucket: dict[ItemToken, None], item_count: int) -> list[ItemToken]:
+        if item_count < 1:
+            return list(bucket)
+        return list(islice(bucket, item_count))
+
+    def move_item_between_buckets(self, item: ItemToken, origin: dict[ItemToken, None],
+                                  destination: dict[ItemToken, None]) -> None:
+        del origin[item]
+        destination[item] = None
+        self.game.zobrist_hash.replace_feature(self.get_item_feature(item, origin),
+                                               self.get_item_feature(item, destination))
+
+    # Items of the same kind in the same bucket are interchangeable, so they share a feature in the game's Zobrist hash
+    def get_item_feature(self, item: ItemToken, bucket: dict[ItemToken, None]) -> tuple:
+        if bucket is self.undamaged_ready_items:
+            bucket_name = 'Undamaged ready'
+        elif bucket is self.undamaged_exhausted_items:
+            bucket_name = 'Undamaged exhausted'
+        elif bucket is self.damaged_ready_items:
+            bucket_name = 'Damaged ready'
+        else:
+            bucket_name = 'Damaged exhausted'
+        return 'Satchel', self.player.faction, bucket_name, item.item
+
+    def get_battle_track_feature(self, item: ItemToken) -> tuple:
+        return 'Battle track', self.player.faction, item.item
+
+    def get_features(self) -> list[tuple]:
+        features = [self.get_battle_track_feature(item) for item in self.battle_track]
+        for bucket in [self.undamaged_ready_items, self.undamaged_exhausted_items, self.damaged_ready_items,
+                       self.damaged_exhausted_items]:
+            features += [self.get_item_feature(item, bucket) for item in bucket]
+        return features
+
     def get_exhausted_undamaged_items(self, item_count: int = 1) -> list[ItemToken]:
-        items = []
-        for item in self.undamaged_items:
-            if item.is_exhausted:
-                items.append(item)
-                if len(items) == item_count:
-                    break
-        return items
+        return self.get_items_from_bucket(self.undamaged_exhausted_items, item_count)
 
     def get_unexhausted_undamaged_items(self, item_count: int = 1) -> list[ItemToken]:
-        items = []
-        for item in self.undamaged_items:
-            if not item.is_exhausted:
-                items.append(item)
-                if len(items) == item_count:
-                    break
-        return items
+        return self.get_items_from_bucket(self.undamaged_ready_items, item_count)
 
     def get_exhausted_damaged_items(self, item_count: int = 1) -> list[ItemToken]:
-        items = []
-        for item in self.damaged_items:
-            if item.is_exhausted:
-                items.append(item)
-                if len(items) == item_count:
-                    break
-        return items
+        return self.get_items_from_bucket(self.damaged_exhausted_items, item_count)
 
     def get_unexhausted_damaged_items(self, item_count: int = 1) -> list[ItemToken]:
-        items = []
-        for item in self.damaged_items:
-            if not item.is_exhausted:
-                items.append(item)
-                if len(items) == item_count:
-                    break
-        return items
+        return self.get_items_from_bucket(self.damaged_ready_items, item_count)
+
+    def get_unexhausted_undamaged_item_count(self) -> int:
+        return len(self.undamaged_ready_items)
+
+    def get_undamaged_item_count(self) -> int:
+        return len(self.undamaged_ready_items) + len(self.undamaged_exhausted_items)
+
+    def get_damaged_item_count(self) -> int:
+        return len(self.damaged_ready_items) + len(self.damaged_exhausted_items)
 
     def exhaust_items_if_possible(self, item_count: int = 1) -> bool:
         items_to_exhaust = self.get_unexhausted_undamaged_items(item_count)
@@ -62,42 +98,54 @@ class Satchel(Supply):
             return False
         for item in items_to_exhaust:
             item.is_exhausted = True
+            self.move_item_between_buckets(item, self.undamaged_ready_items, self.undamaged_exhausted_items)
         return True
 
     def add_item(self, item: ItemToken) -> None:
         item.is_exhausted = False
         if self.get_total_item_count() in [5, 8, 11]:
             self.battle_track.append(item)
+            self.game.zobrist_hash.add_feature(self.get_battle_track_feature(item))
         else:
-            self.undamaged_items.append(item)
+            self.undamaged_ready_items[item] = None
+            self.game.zobrist_hash.add_feature(self.get_item_feature(item, self.undamaged_ready_items))
 
     def refresh_item(self) -> None:
-        item_to_refresh = self.get_exhausted_undamaged_items()
-        if not item_to_refresh:
-            item_to_refresh = self.get_exhausted_damaged_items()
-        if not item_to_refresh:
+        if self.undamaged_exhausted_items:
+            origin, destination = self.undamaged_exhausted_items, self.undamaged_ready_items
+        elif self.damaged_exhausted_items:
+            origin, destination = self.damaged_exhausted_items, self.damaged_ready_items
+        else:
             return
-        item_to_refresh[0].is_exhausted = False
+        item_to_refresh = next(iter(origin))
+        item_to_refresh.is_exhausted = False
+        self.move_item_between_buckets(item_to_refresh, origin, destination)
 
     def repair_item(self) -> None:
-        item_to_repair = self.get_unexhausted_damaged_items()
-        if not item_to_repair:
-            item_to_repair = self.get_exhausted_damaged_items()
-        if not item_to_repair:
+        if self.damaged_ready_items:
+            origin, destination = self.damaged_ready_items, self.undamaged_ready_items
+        elif self.damaged_exhausted_items:
+            origin, destination = self.damaged_exhausted_items, self.undamaged_exhausted_items
+        else:
             return
-        self.damaged_items.remove(item_to_repair[0])
-        self.undamaged_items.append(item_to_repair[0])
+        self.move_item_between_buckets(next(iter(origin)), origin, destination)
 
     def damage_specific_item(self, item: ItemToken) -> None:
-        if item not in self.undamaged_items:
-            return
-        self.undamaged_items.remove(item)
-        self.damaged_items.append(item)
+        if item in self.undamaged_ready_items:
+            self.move_item_between_buckets(item, self.undamaged_ready_items, self.damaged_ready_items)
+        elif item in self.undamaged_exhausted_items:
+            self.move_item_between_buckets(item, self.undamaged_exhausted_items, self.damaged_exhausted_items)
 
     def repair_all_items(self) -> None:
-        while self.damaged_items:
-            item = self.damaged_items.pop()
-            self.undamaged_items.append(item)
+        for origin, destination in [(self.damaged_ready_items, self.undamaged_ready_items),
+                                    (self.damaged_exhausted_items, self.undamaged_exhausted_items)]:
+            for item in origin:
+                self.game.zobrist_hash.replace_feature(self.get_item_feature(item, origin),
+                                                       self.get_item_feature(item, destination))
+        self.undamaged_ready_items.update(self.damaged_ready_items)
+        self.undamaged_exhausted_items.update(self.damaged_exhausted_items)
+        self.damaged_ready_items.clear()
+        self.damaged_exhausted_items.clear()
 
     def get_total_item_count(self) -> int:
-        return len(self.undamaged_items) + len(self.damaged_items) + len(self.battle_track)
+        return self.get_undamaged_item_count() + self.get_damaged_item_count() + len(self.battle_track)
@@ -56,7 +56,7 @@ class VagabotRanger(VagabotCharacter):
         self.player.satchel.repair_item()
 
     def can_perform_special_action(self) -> bool:
-        return len(self.player.satchel.damaged_items) > 0
+        return self.player.satchel.get_damaged_item_count() > 0
 
 
 class VagabotTinker(VagabotCharacter):
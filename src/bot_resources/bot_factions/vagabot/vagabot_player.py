@@ -42,6 +42,7 @@ class VagabotPlayer(Bot):
     satchel: Satchel
     has_slipped: bool
     has_battled: bool
+    can_be_defenseless: bool = False
 
     def __init__(self, game: Game, character: VagabotCharacter) -> None:
         piece_stock = VagabotPieceStock(self)
@@ -75,7 +76,7 @@ class VagabotPlayer(Bot):
         self.has_slipped = False
         self.has_battled = False
         self.reveal_order()
-        if len(self.satchel.undamaged_items) < 3:
+        if self.satchel.get_undamaged_item_count() < 3:
             self.slip_into_forest()
 
     def daylight(self) -> None:
@@ -129,7 +130,7 @@ class VagabotPlayer(Bot):
                                                       [destination], requires_rule=False)
 
     def move_along_path(self, path: list[Clearing]) -> None:
-        while path and self.satchel.get_unexhausted_undamaged_items():
+        while path and self.satchel.get_unexhausted_undamaged_item_count():
             next_step = path[0]
             self.move_pawn(next_step)
             # If the move was successful, pop it from the list
@@ -210,8 +211,10 @@ class VagabotPlayer(Bot):
         sorted_players_with_crafted_items = sort_players_by_victory_points(sorted_players_with_crafted_items,
                                                                            descending=False)
 
-        valid_aid_clearings = [clearing for clearing in self.game.clearings() if
-                               any(clearing.is_player_in_location(player) for player in players_with_crafted_items)]
+        crafted_items_presence_mask = 0
+        for player in players_with_crafted_items:
+            crafted_items_presence_mask |= player.presence_bit
+        valid_aid_clearings = self.game.get_clearings_with_presence(crafted_items_presence_mask)
         if not valid_aid_clearings:
             if self.has_trait(TRAIT_HELPER):
                 return self.helper_aid_step()
@@ -247,8 +250,7 @@ class VagabotPlayer(Bot):
         if not player_to_aid:
             return
 
-        valid_aid_clearings = [clearing for clearing in self.game.clearings() if
-                               clearing.is_player_in_location(player_to_aid)]
+        valid_aid_clearings = self.game.get_clearings_with_presence(player_to_aid.presence_bit)
         self.travel_to_target_clearings(valid_aid_clearings)
 
         if self.get_pawn_location() in valid_aid_clearings and self.satchel.exhaust_items_if_possible():
@@ -261,9 +263,7 @@ class VagabotPlayer(Bot):
         sorted_players = sort_players_by_setup_order(self.game.players)
         sorted_players = sort_players_by_victory_points(sorted_players, descending=False)
         for player in sorted_players:
-            valid_aid_clearings = [clearing for clearing in self.game.clearings() if
-                                   clearing.is_player_in_location(player)]
-            if valid_aid_clearings:
+            if player.clearing_presence_mask:
                 return player
 
     def battle_step(self) -> None:
@@ -274,8 +274,7 @@ class VagabotPlayer(Bot):
         if not target_opponent:
             return
 
-        valid_battle_clearings = [clearing for clearing in self.game.clearings() if
-                                  clearing.is_player_in_location(target_opponent)]
+        valid_battle_clearings = self.game.get_clearings_with_presence(target_opponent.presence_bit)
         self.travel_to_target_clearings(valid_battle_clearings)
 
         # The first battle each turn requires exhausting one item. Future battles require exhausting two items
@@ -294,14 +293,11 @@ class VagabotPlayer(Bot):
         sorted_players = sort_players_by_setup_order(self.game.players)
         sorted_players = sort_players_by_victory_points(sorted_players)
         for player in sorted_players:
-            valid_battle_clearings = [clearing for clearing in self.game.clearings() if
-                                      clearing.is_player_in_location(player)]
-            if valid_battle_clearings:
+            if player.clearing_presence_mask:
                 return player
 
     def berserker_battle_step(self) -> None:
-        valid_battle_clearings = [clearing for clearing in self.game.clearings() if
-                                  clearing.is_any_other_player_in_location(self)]
+        valid_battle_clearings = self.game.get_clearings_with_presence(~self.presence_bit)
         sorted_valid_battle_clearings = sort_clearings_by_priority(valid_battle_clearings)
         sorted_valid_battle_clearings = sort_clearings_by_enemy_pieces(sorted_valid_battle_clearings, self)
         if not sorted_valid_battle_clearings:
@@ -339,7 +335,7 @@ class VagabotPlayer(Bot):
         for _ in range(self.get_refresh_amount()):
             self.satchel.refresh_item()
         # Refresh two bonus items if you have no damaged items
-        if not self.satchel.damaged_items:
+        if not self.satchel.get_damaged_item_count():
             self.satchel.refresh_item()
             self.satchel.refresh_item()
 
@@ -362,14 +358,14 @@ class VagabotPlayer(Bot):
             # Marksman Vagabot is currently the only way for a player to deal hits in battle to a bot before the roll
             # To prevent messy logic in handling taking hits, we just deal two hits of damage in this case, which will
             # still functionally remove one building
-            if defender.halves_damage(clearing):
+            if self.game.capabilities.halves_damage(defender, clearing):
                 marksman_damage_result = defender.suffer_damage(clearing, 2, self, is_attacker=False)
             else:
                 marksman_damage_result = defender.suffer_damage(clearing, 1, self, is_attacker=False)
             self.add_victory_points(marksman_damage_result.points_awarded +
                                     self.supplementary_score_for_removed_pieces_in_battle(
                                         defender, marksman_damage_result.removed_pieces, is_attacker=True))
-        random_rolls = (random.randint(0, 3), random.randint(0, 3))
+        random_rolls = self.game.random.roll_battle_dice()
         # Defender allocates the rolls - high roll to attacker, low roll to defender, except in the case of Veterans
         roll_result = defender.allocate_rolls_as_defender(random_rolls)
         # Each battler caps their hits and adds their relevant bonus hits
@@ -425,3 +421,6 @@ class VagabotPlayer(Bot):
 
     def get_item(self, item_token: ItemToken) -> None:
         self.satchel.add_item(item_token)
+
+    def get_zobrist_features(self) -> list[tuple]:
+        return super().get_zobrist_features() + self.satchel.get_features()
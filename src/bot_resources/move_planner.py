@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from locations.clearing import Clearing
+    from pieces.piece import Piece
+    from player_resources.player import Player
+
+
+class PlannedMove:
+    origin: Clearing
+    destination: Clearing
+    pieces: list[Piece]
+    is_blocked_from_leaving: bool  # Only a Snare in the origin stops this move from being legal
+
+    def __init__(self, origin: Clearing, destination: Clearing, pieces: list[Piece],
+                 is_blocked_from_leaving: bool = False) -> None:
+        self.origin = origin
+        self.destination = destination
+        self.pieces = pieces
+        self.is_blocked_from_leaving = is_blocked_from_leaving
+
+
+# Plans bot moves against a snapshot of the board: the clearings the player rules are looked up at most once (and only
+# if a move needs rule), and each origin's destinations are ranked once, however many times the origin is considered
+# A planner should only be used while the board is unchanged, so bots create a new one for each step that moves
+class MovePlanner:
+    player: Player
+    rank_destinations: Callable[[Clearing], list[Clearing]]
+    ruled_clearings: Optional[set[Clearing]]
+    ranked_destinations: dict[Clearing, list[Clearing]]
+
+    def __init__(self, player: Player, rank_destinations: Callable[[Clearing], list[Clearing]]) -> None:
+        self.player = player
+        self.rank_destinations = rank_destinations
+        self.ruled_clearings = None
+        self.ranked_destinations = {}
+
+    def is_ruled(self, clearing: Clearing) -> bool:
+        if self.ruled_clearings is None:
+            self.ruled_clearings = set(self.player.get_ruled_clearings())
+        return clearing in self.ruled_clearings
+
+    def get_ranked_destinations(self, origin: Clearing) -> list[Clearing]:
+        if origin not in self.ranked_destinations:
+            self.ranked_destinations[origin] = self.rank_destinations(origin)
+        return self.ranked_destinations[origin]
+
+    # Finds the best ranked destination the pieces could move to. If only the origin stops them from leaving (Snare),
+    # the move is still returned but marked as blocked, so the bot can deal with the Snare
+    def plan_move_from_origin(self, origin: Clearing, pieces: list[Piece],
+                              requires_rule: bool = True) -> Optional[PlannedMove]:
+        requires_ruled_destination = requires_rule and not self.is_ruled(origin)
+        can_leave_origin: Optional[bool] = None
+        for destination in self.get_ranked_destinations(origin):
+            if requires_ruled_destination and not self.is_ruled(destination):
+                continue
+            if not destination.can_move_pieces_into(self.player, pieces):
+                continue
+            if can_leave_origin is None:
+                can_leave_origin = origin.can_move_pieces_out_of(self.player, pieces)
+            return PlannedMove(origin, destination, pieces, is_blocked_from_leaving=not can_leave_origin)
+        return None
+
+    # Returns the first legal move from the origins (in order), and the first move that only a Snare blocks as a
+    # fallback, from a single pass over the origins
+    def plan_move(self, origins: list[Clearing], get_pieces_to_move: Callable[[Clearing], list[Piece]],
+                  requires_rule: bool = True) -> tuple[Optional[PlannedMove], Optional[PlannedMove]]:
+        blocked_move = None
+        for origin in origins:
+            pieces = get_pieces_to_move(origin)
+            planned_move = self.plan_move_from_origin(origin, pieces, requires_rule)
+            if not planned_move:
+                continue
+            if not planned_move.is_blocked_from_leaving:
+                return planned_move, blocked_move
+            if not blocked_move:
+                blocked_move = planned_move
+        return None, blocked_move
@@ -0,0 +1,74 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game import Game
+    from locations.clearing import Clearing
+    from player_resources.player import Player
+
+
+# Which players have each faction capability the game asks about over and over (taking discarded cards, exploring
+# ruins, treating rivers as paths, halving damage, being defenseless). Resolved once from the players in the game, so
+# the hot paths can look the answer up instead of asking every player each time
+# Refreshed whenever the game's players are replaced, and updated for a player whenever they craft, since crafted
+# effects (eg. Riverboats) can give them a capability mid-game
+class CapabilityRegistry:
+    game: Game
+    discarded_card_taker: Optional[Player]
+    ruin_explorer_count: int
+    river_path_players: set[Player]
+    damage_halving_players: set[Player]  # Only players that can ever halve damage - it still depends on the clearing
+    defenseless_capable_players: set[Player]
+
+    def __init__(self, game: Game) -> None:
+        self.game = game
+        self.discarded_card_taker = None
+        self.ruin_explorer_count = 0
+        self.river_path_players = set()
+        self.damage_halving_players = set()
+        self.defenseless_capable_players = set()
+
+    def refresh(self) -> None:
+        self.discarded_card_taker = None
+        self.ruin_explorer_count = 0
+        self.river_path_players.clear()
+        self.damage_halving_players.clear()
+        self.defenseless_capable_players.clear()
+        for player in self.game.players:
+            self.add_player(player)
+
+    def add_player(self, player: Player) -> None:
+        if self.discarded_card_taker is None and player.takes_discarded_cards():
+            self.discarded_card_taker = player
+        if player.faction.is_ruin_exploring_faction():
+            self.ruin_explorer_count += 1
+        if player.treats_rivers_as_paths():
+            self.river_path_players.add(player)
+        if player.can_halve_damage:
+            self.damage_halving_players.add(player)
+        if player.can_be_defenseless:
+            self.defenseless_capable_players.add(player)
+
+    # Re-resolves one player's capabilities, such as after they craft
+    def update_player(self, player: Player) -> None:
+        if self.discarded_card_taker is player or (self.discarded_card_taker is None and
+                                                   player.takes_discarded_cards()):
+            # The first player in seat order that takes discarded cards is the one who gets them
+            self.discarded_card_taker = next((seated_player for seated_player in self.game.players
+                                              if seated_player.takes_discarded_cards()), None)
+        for capable_players, has_capability in [(self.river_path_players, player.treats_rivers_as_paths()),
+                                                (self.damage_halving_players, player.can_halve_damage),
+                                                (self.defenseless_capable_players, player.can_be_defenseless)]:
+            if has_capability:
+                capable_players.add(player)
+            else:
+                capable_players.discard(player)
+
+    def treats_rivers_as_paths(self, player: Player) -> bool:
+        return player in self.river_path_players
+
+    def halves_damage(self, player: Player, battle_clearing: Clearing) -> bool:
+        return player in self.damage_halving_players and player.halves_damage(battle_clearing)
+
+    def is_defenseless(self, player: Player, clearing: Clearing) -> bool:
+        return player in self.defenseless_capable_players and player.is_defenseless(clearing)
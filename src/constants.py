@@ -15,6 +15,10 @@ class Faction(Enum):
     def is_ruin_exploring_faction(self) -> bool:
         return self == Faction.VAGABOT
 
+    # A faction can only be played once per game, so each faction's bit identifies its player in presence bitmasks
+    def get_presence_bit(self) -> int:
+        return 1 << list(Faction).index(self)
+
 
 class Suit(Enum):
     FOX = 'Fox'
@@ -29,6 +33,13 @@ class Suit(Enum):
         return this.value == other.value or other == Suit.BIRD
 
 
+class PieceKind(Enum):
+    WARRIOR = 'Warrior'
+    BUILDING = 'Building'
+    TOKEN = 'Token'
+    OTHER = 'Other'
+
+
 class Item(Enum):
     BAG = 'Bag'
     BOOT = 'Boot'
@@ -1,55 +1,151 @@
 from __future__ import annotations
+from array import array
 from typing import TYPE_CHECKING
 
 from deck.cards.ambush_card import generate_all_ambush_cards
 import deck.cards.crafting_card_list
 from deck.cards.dominance_card import generate_all_dominance_cards
 from deck.cards.item_card_list import generate_all_item_cards
-from deck.deck import Deck
+from deck.deck import Deck, get_draw_pile_feature, get_pile_feature
+from deck.deck_tracker import count_cards, PileCounts
 
 if TYPE_CHECKING:
+    from deck.cards.card import Card
     from game import Game
 
 
+def generate_all_base_cards() -> list[Card]:
+    cards = [
+        # Persistent Fox cards
+        deck.cards.crafting_card_list.StandAndDeliver(),
+        deck.cards.crafting_card_list.StandAndDeliver(),
+        deck.cards.crafting_card_list.TaxCollector(),
+        deck.cards.crafting_card_list.TaxCollector(),
+        deck.cards.crafting_card_list.TaxCollector(),
+        # Persistent Rabbit cards
+        deck.cards.crafting_card_list.Cobbler(),
+        deck.cards.crafting_card_list.Cobbler(),
+        deck.cards.crafting_card_list.CommandWarren(),
+        deck.cards.crafting_card_list.CommandWarren(),
+        deck.cards.crafting_card_list.BetterBurrowBank(),
+        deck.cards.crafting_card_list.BetterBurrowBank(),
+        # Persistent Mouse cards
+        deck.cards.crafting_card_list.Codebreakers(),
+        deck.cards.crafting_card_list.Codebreakers(),
+        deck.cards.crafting_card_list.ScoutingParty(),
+        deck.cards.crafting_card_list.ScoutingParty(),
+        # Persistent Bird cards
+        deck.cards.crafting_card_list.Sappers(),
+        deck.cards.crafting_card_list.Sappers(),
+        deck.cards.crafting_card_list.Armorers(),
+        deck.cards.crafting_card_list.Armorers(),
+        deck.cards.crafting_card_list.BrutalTactics(),
+        deck.cards.crafting_card_list.BrutalTactics(),
+        deck.cards.crafting_card_list.RoyalClaim(),
+        # Immediate effect cards
+        deck.cards.crafting_card_list.FavorOfTheFoxes(),
+        deck.cards.crafting_card_list.FavorOfTheRabbits(),
+        deck.cards.crafting_card_list.FavorOfTheMice()
+    ]
+    cards.extend(generate_all_item_cards())
+    cards.extend(generate_all_dominance_cards())
+    cards.extend(generate_all_ambush_cards())
+    return cards
+
+
+# Cards never change during a game, so every game shares one table of them, and each deck is only a few small arrays
+# of indices into this table. Setting up a deck is an array copy, shuffling is a permutation of the array, and a
+# snapshot of the whole deck is a few bytes
+BASE_CARD_TABLE: tuple[Card, ...] = tuple(generate_all_base_cards())
+BASE_CARD_INDICES: dict[Card, int] = {card: index for index, card in enumerate(BASE_CARD_TABLE)}
+BASE_CARD_TABLE_INDICES: array = array('B', range(len(BASE_CARD_TABLE)))
+BASE_CARD_TABLE_COUNTS: PileCounts = count_cards(BASE_CARD_TABLE)
+
+
 class BaseDeck(Deck):
+    drawable_cards: array  # Indices into card_table, the top of the pile last
+    discarded_cards: array
+    # BASE_CARD_TABLE, followed by any other cards put in this deck (such as from tests or expansions), which are
+    # indexed after the base cards. Until there are any, this is the shared table itself
+    card_table: tuple[Card, ...]
+
     def __init__(self, game: Game) -> None:
+        self.card_table = BASE_CARD_TABLE
         super().__init__(game)
 
-    def initialize_cards(self) -> None:
-        self.cards = [
-            # Persistent Fox cards
-            deck.cards.crafting_card_list.StandAndDeliver(),
-            deck.cards.crafting_card_list.StandAndDeliver(),
-            deck.cards.crafting_card_list.TaxCollector(),
-            deck.cards.crafting_card_list.TaxCollector(),
-            deck.cards.crafting_card_list.TaxCollector(),
-            # Persistent Rabbit cards
-            deck.cards.crafting_card_list.Cobbler(),
-            deck.cards.crafting_card_list.Cobbler(),
-            deck.cards.crafting_card_list.CommandWarren(),
-            deck.cards.crafting_card_list.CommandWarren(),
-            deck.cards.crafting_card_list.BetterBurrowBank(),
-            deck.cards.crafting_card_list.BetterBurrowBank(),
-            # Persistent Mouse cards
-            deck.cards.crafting_card_list.Codebreakers(),
-            deck.cards.crafting_card_list.Codebreakers(),
-            deck.cards.crafting_card_list.ScoutingParty(),
-            deck.cards.crafting_card_list.ScoutingParty(),
-            # Persistent Bird cards
-            deck.cards.crafting_card_list.Sappers(),
-            deck.cards.crafting_card_list.Sappers(),
-            deck.cards.crafting_card_list.Armorers(),
-            deck.cards.crafting_card_list.Armorers(),
-            deck.cards.crafting_card_list.BrutalTactics(),
-            deck.cards.crafting_card_list.BrutalTactics(),
-            deck.cards.crafting_card_list.RoyalClaim(),
-            # Immediate effect cards
-            deck.cards.crafting_card_list.FavorOfTheFoxes(),
-            deck.cards.crafting_card_list.FavorOfTheRabbits(),
-            deck.cards.crafting_card_list.FavorOfTheMice()
-        ]
-        self.cards.extend(generate_all_item_cards())
-        self.cards.extend(generate_all_dominance_cards())
-        self.cards.extend(generate_all_ambush_cards())
+    def get_card_index(self, card: Card) -> int:
+        index = BASE_CARD_INDICES.get(card)
+        if index is not None:
+            return index
+        for index in range(len(BASE_CARD_TABLE), len(self.card_table)):
+            if self.card_table[index] is card:
+                return index
+        if len(self.card_table) > 0xFF:
+            raise ValueError(f'Too many cards outside the base card table to add {card.name}')
+        self.card_table += (card,)
+        return len(self.card_table) - 1
 
+    def initialize_cards(self) -> None:
+        self.drawable_cards = array('B', BASE_CARD_TABLE_INDICES)
+        self.discarded_cards = array('B')
+        self.tracker.draw_pile = BASE_CARD_TABLE_COUNTS.copy()
+        self.game.zobrist_hash.add_features(self.get_draw_pile_features())
         self.shuffle_deck()
+
+    @property
+    def cards(self) -> list[Card]:
+        return [self.card_table[index] for index in self.drawable_cards]
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        self.game.zobrist_hash.remove_features(self.get_draw_pile_features())
+        self.drawable_cards = array('B', (self.get_card_index(card) for card in cards))
+        self.tracker.rebuild_draw_pile(cards)
+        self.game.zobrist_hash.add_features(self.get_draw_pile_features())
+
+    @property
+    def discard_pile(self) -> list[Card]:
+        return [self.card_table[index] for index in self.discarded_cards]
+
+    @discard_pile.setter
+    def discard_pile(self, cards: list[Card]) -> None:
+        self.game.zobrist_hash.remove_features(self.get_discard_pile_features())
+        self.discarded_cards = array('B', (self.get_card_index(card) for card in cards))
+        self.tracker.rebuild_discard_pile(cards)
+        self.game.zobrist_hash.add_features(self.get_discard_pile_features())
+
+    def pop_card_from_draw_pile(self) -> Card:
+        card = self.card_table[self.drawable_cards.pop()]
+        self.tracker.draw_pile.remove_card(card)
+        self.game.zobrist_hash.remove_feature(get_draw_pile_feature(len(self.drawable_cards), card))
+        return card
+
+    def add_card_to_discard_pile(self, card: Card) -> None:
+        self.discarded_cards.append(self.get_card_index(card))
+        self.tracker.discard_pile.add_card(card)
+        self.game.zobrist_hash.add_feature(get_pile_feature('Discard pile', card))
+
+    ##################
+    #                #
+    # Deck snapshots #
+    #                #
+    ##################
+
+    # The draw pile, discard pile and dominance region as bytes: the three pile sizes, then each pile's indices
+    # Cards outside the base card table are only known to this deck, so only this deck can restore them
+    def get_snapshot(self) -> bytes:
+        dominance_region_indices = bytes(self.get_card_index(card) for card in self.dominance_region)
+        return (bytes([len(self.drawable_cards), len(self.discarded_cards), len(dominance_region_indices)]) +
+                self.drawable_cards.tobytes() + self.discarded_cards.tobytes() + dominance_region_indices)
+
+    def restore_snapshot(self, snapshot: bytes) -> None:
+        self.game.zobrist_hash.remove_features(self.get_features())
+        draw_pile_size, discard_pile_size = snapshot[0], snapshot[1]
+        discard_pile_start = 3 + draw_pile_size
+        dominance_region_start = discard_pile_start + discard_pile_size
+        self.drawable_cards = array('B', snapshot[3:discard_pile_start])
+        self.discarded_cards = array('B', snapshot[discard_pile_start:dominance_region_start])
+        self.dominance_region = [self.card_table[index] for index in snapshot[dominance_region_start:]]
+        self.tracker.rebuild_draw_pile(self.cards)
+        self.tracker.rebuild_discard_pile(self.discard_pile)
+        self.game.zobrist_hash.add_features(self.get_features())
@@ -10,10 +10,19 @@ if TYPE_CHECKING:
 class Card(ABC):
     name: str
     suit: Suit
+    card_classes: tuple[type[Card], ...]
 
     def __init__(self, name: str, suit: Suit) -> None:
         self.name = name
         self.suit = suit
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every Card class this class is an instance of, for counting cards by type without isinstance scans
+        cls.card_classes = tuple(card_class for card_class in cls.__mro__ if issubclass(card_class, Card))
+
     def can_be_crafted(self, player: Player) -> bool:
         return False
+
+
+Card.card_classes = (Card,)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-import random
 from typing import Optional, TYPE_CHECKING
 
+from deck.deck_tracker import DeckTracker
+
 if TYPE_CHECKING:
     from deck.cards.card import Card
     from game import Game
@@ -10,35 +11,86 @@ if TYPE_CHECKING:
 
 class Deck(ABC):
     game: Game
-    cards: list[Card]
-    discard_pile: list[Card]
+    drawable_cards: list[Card]
+    discarded_cards: list[Card]
     dominance_region: list[Card]
+    tracker: DeckTracker
 
     def __init__(self, game: Game) -> None:
         self.game = game
-        self.cards = []
-        self.discard_pile = []
+        self.tracker = DeckTracker()
+        self.drawable_cards = []
+        self.discarded_cards = []
         self.dominance_region = []
         self.initialize_cards()
 
+    # The draw pile and discard pile should only be changed through the methods below (or by replacing them outright),
+    # so that the tracker's counts stay accurate
+    @property
+    def cards(self) -> list[Card]:
+        return self.drawable_cards
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        self.game.zobrist_hash.remove_features(self.get_draw_pile_features())
+        self.drawable_cards = cards
+        self.tracker.rebuild_draw_pile(cards)
+        self.game.zobrist_hash.add_features(self.get_draw_pile_features())
+
+    @property
+    def discard_pile(self) -> list[Card]:
+        return self.discarded_cards
+
+    @discard_pile.setter
+    def discard_pile(self, cards: list[Card]) -> None:
+        self.game.zobrist_hash.remove_features(self.get_discard_pile_features())
+        self.discarded_cards = cards
+        self.tracker.rebuild_discard_pile(cards)
+        self.game.zobrist_hash.add_features(self.get_discard_pile_features())
+
     def shuffle_deck(self) -> None:
-        random.shuffle(self.cards)
+        self.game.zobrist_hash.remove_features(self.get_draw_pile_features())
+        self.game.random.deck_shuffle.shuffle(self.drawable_cards)
+        self.game.zobrist_hash.add_features(self.get_draw_pile_features())
+
+    def pop_card_from_draw_pile(self) -> Card:
+        card = self.drawable_cards.pop()
+        self.tracker.draw_pile.remove_card(card)
+        self.game.zobrist_hash.remove_feature(get_draw_pile_feature(len(self.drawable_cards), card))
+        return card
+
+    def add_card_to_discard_pile(self, card: Card) -> None:
+        self.discarded_cards.append(card)
+        self.tracker.discard_pile.add_card(card)
+        self.game.zobrist_hash.add_feature(get_pile_feature('Discard pile', card))
+
+    def add_cards_to_discard_pile(self, cards: list[Card]) -> None:
+        for card in cards:
+            self.add_card_to_discard_pile(card)
+
+    def add_card_to_dominance_region(self, card: Card) -> None:
+        self.dominance_region.append(card)
+        self.game.zobrist_hash.add_feature(get_pile_feature('Dominance region', card))
 
     def draw_card(self) -> Optional[Card]:
-        if self.cards:
-            drawn_card = self.cards.pop()
-            if not self.cards:
+        if self.drawable_cards:
+            drawn_card = self.pop_card_from_draw_pile()
+            if not self.drawable_cards:
                 self.reshuffle_discard_pile_into_deck()
             return drawn_card
-        elif self.discard_pile:
+        elif self.discarded_cards:
             self.reshuffle_discard_pile_into_deck()
-            return self.cards.pop()
+            return self.pop_card_from_draw_pile()
 
     def reshuffle_discard_pile_into_deck(self) -> None:
-        if self.cards:
+        if self.drawable_cards:
             return
-        self.cards = self.discard_pile
-        self.discard_pile = []
+        self.game.zobrist_hash.remove_features(self.get_discard_pile_features())
+        self.drawable_cards = self.discarded_cards
+        # An empty pile of the same kind as the discard pile
+        self.discarded_cards = self.discarded_cards[:0]
+        self.tracker.move_discard_pile_into_draw_pile()
+        self.game.zobrist_hash.add_features(self.get_draw_pile_features())
         self.shuffle_deck()
 
     def draw_cards(self, number_of_cards: int = 1) -> list[Card]:
@@ -52,3 +104,26 @@ class Deck(ABC):
     @abstractmethod
     def initialize_cards(self) -> None:
         pass
+
+    # The draw pile's order is part of the game state, so its cards are hashed by position. The discard pile and
+    # dominance region are hashed by their contents alone
+    def get_draw_pile_features(self) -> list[tuple]:
+        return [get_draw_pile_feature(position, card) for position, card in enumerate(self.cards)]
+
+    def get_discard_pile_features(self) -> list[tuple]:
+        return [get_pile_feature('Discard pile', card) for card in self.discard_pile]
+
+    def get_dominance_region_features(self) -> list[tuple]:
+        return [get_pile_feature('Dominance region', card) for card in self.dominance_region]
+
+    def get_features(self) -> list[tuple]:
+        return self.get_draw_pile_features() + self.get_discard_pile_features() + self.get_dominance_region_features()
+
+
+# Cards of the same name and suit are interchangeable
+def get_draw_pile_feature(position: int, card: Card) -> tuple:
+    return 'Draw pile', position, card.name, card.suit
+
+
+def get_pile_feature(pile_name: str, card: Card) -> tuple:
+    return pile_name, card.name, card.suit
@@ -0,0 +1,113 @@
+from __future__ import annotations
+from math import comb
+from typing import Iterable, TYPE_CHECKING
+
+from constants import Suit
+
+if TYPE_CHECKING:
+    from deck.cards.card import Card
+
+
+# Running counts of the cards in one pile, by suit and by card type (including parent types, so ItemCard counts every
+# item card whatever its subclass)
+class PileCounts:
+    card_count: int
+    suit_counts: dict[Suit, int]
+    type_counts: dict[type[Card], int]
+
+    def __init__(self) -> None:
+        self.card_count = 0
+        self.suit_counts = {suit: 0 for suit in Suit}
+        self.type_counts = {}
+
+    def add_card(self, card: Card) -> None:
+        self.card_count += 1
+        self.suit_counts[card.suit] += 1
+        for card_class in card.card_classes:
+            self.type_counts[card_class] = self.type_counts.get(card_class, 0) + 1
+
+    def remove_card(self, card: Card) -> None:
+        self.card_count -= 1
+        self.suit_counts[card.suit] -= 1
+        for card_class in card.card_classes:
+            self.type_counts[card_class] -= 1
+
+    def copy(self) -> PileCounts:
+        pile_counts = PileCounts()
+        pile_counts.card_count = self.card_count
+        pile_counts.suit_counts = dict(self.suit_counts)
+        pile_counts.type_counts = dict(self.type_counts)
+        return pile_counts
+
+    def get_count_of_suit(self, suit: Suit) -> int:
+        return self.suit_counts[suit]
+
+    def get_count_of_type(self, card_class: type[Card]) -> int:
+        return self.type_counts.get(card_class, 0)
+
+
+def count_cards(cards: Iterable[Card]) -> PileCounts:
+    pile_counts = PileCounts()
+    for card in cards:
+        pile_counts.add_card(card)
+    return pile_counts
+
+
+# Tracks what's left in the draw pile and discard pile as the deck is drawn from, discarded to and reshuffled, so
+# questions like 'what are the odds the next order card is a Fox card?' don't need to look through the piles
+class DeckTracker:
+    draw_pile: PileCounts
+    discard_pile: PileCounts
+
+    def __init__(self) -> None:
+        self.draw_pile = PileCounts()
+        self.discard_pile = PileCounts()
+
+    def rebuild_draw_pile(self, cards: Iterable[Card]) -> None:
+        self.draw_pile = count_cards(cards)
+
+    def rebuild_discard_pile(self, cards: Iterable[Card]) -> None:
+        self.discard_pile = count_cards(cards)
+
+    def move_discard_pile_into_draw_pile(self) -> None:
+        self.draw_pile = self.discard_pile
+        self.discard_pile = PileCounts()
+
+    ###########
+    #         #
+    # Queries #
+    #         #
+    ###########
+
+    def get_draw_pile_card_count(self) -> int:
+        return self.draw_pile.card_count
+
+    def get_draw_pile_count_of_type(self, card_class: type[Card]) -> int:
+        return self.draw_pile.get_count_of_type(card_class)
+
+    def get_discard_pile_count_of_type(self, card_class: type[Card]) -> int:
+        return self.discard_pile.get_count_of_type(card_class)
+
+    # The chance the next card drawn is of the given suit. An empty draw pile is reshuffled from the discard pile first
+    def get_next_card_suit_probability(self, suit: Suit) -> float:
+        pile = self.draw_pile if self.draw_pile.card_count else self.discard_pile
+        if not pile.card_count:
+            return 0.0
+        return pile.get_count_of_suit(suit) / pile.card_count
+
+    def get_next_card_suit_distribution(self) -> dict[Suit, float]:
+        return {suit: self.get_next_card_suit_probability(suit) for suit in Suit}
+
+    # Hypergeometric lookahead: the chance that exactly hit_count of the next draw_count cards are of the given suit
+    # Only looks at the current draw pile, so draw_count is capped at the number of cards left in it
+    def get_probability_of_drawing_suit_exactly(self, suit: Suit, draw_count: int, hit_count: int) -> float:
+        pile_size = self.draw_pile.card_count
+        draw_count = min(draw_count, pile_size)
+        suit_count = self.draw_pile.get_count_of_suit(suit)
+        if not pile_size or hit_count > draw_count or hit_count > suit_count:
+            return float(hit_count == 0 and draw_count == 0)
+        ways_to_draw_hits = comb(suit_count, hit_count) * comb(pile_size - suit_count, draw_count - hit_count)
+        return ways_to_draw_hits / comb(pile_size, draw_count)
+
+    def get_probability_of_drawing_suit_within(self, suit: Suit, draw_count: int) -> float:
+        return 1 - self.get_probability_of_drawing_suit_exactly(suit, draw_count, 0)
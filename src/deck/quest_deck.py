@@ -1,5 +1,5 @@
 from __future__ import annotations
-import random
+from random import Random
 from typing import Optional
 
 from constants import Suit
@@ -8,12 +8,15 @@ from constants import Suit
 class QuestDeck:
     cards: list[QuestCard]
 
-    def __init__(self) -> None:
+    def __init__(self, deck_shuffle_random: Random = None) -> None:
+        if deck_shuffle_random is None:
+            deck_shuffle_random = Random()
+
         self.cards = []
         for _ in range(5):
             for suit in [Suit.FOX, Suit.RABBIT, Suit.MOUSE]:
                 self.cards.append(QuestCard(suit))
-        random.shuffle(self.cards)
+        deck_shuffle_random.shuffle(self.cards)
 
     def draw_quest_card(self) -> Optional[QuestCard]:
         if not self.cards:
@@ -2,11 +2,15 @@ from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 
 from board_map.autumn_board_map import AutumnBoardMap
+from capability_registry import CapabilityRegistry
 from constants import Item
 from deck.base_deck import BaseDeck
 from deck.cards.dominance_card import DominanceCard
 from deck.quest_deck import QuestDeck
+from game_random import GameRandom
 from pieces.item_token import ItemToken
+from query_cache import QueryCache
+from zobrist_hash import ZobristHash
 
 if TYPE_CHECKING:
     from board_map.board_map import BoardMap
@@ -20,17 +24,30 @@ if TYPE_CHECKING:
 class Game:
     deck: Deck
     quest_deck: QuestDeck
-    players: list[Player]
+    seated_players: list[Player]
     board_map: BoardMap
     item_supply: list[ItemToken]
     turn_order: list[Player]
     turn_player: Optional[Player]
+    winner: Optional[Player]
+    query_cache: QueryCache
+    zobrist_hash: ZobristHash
+    capabilities: CapabilityRegistry
+    random: GameRandom
 
-    def __init__(self, players: list[Player] = None) -> None:
+    def __init__(self, players: list[Player] = None, game_random: GameRandom = None) -> None:
         if players is None:
             players = []
+        if game_random is None:
+            game_random = GameRandom()
+
+        self.random = game_random
+        self.query_cache = QueryCache()
+        self.zobrist_hash = ZobristHash()
         self.deck = BaseDeck(self)
-        self.quest_deck = QuestDeck()
+        self.quest_deck = QuestDeck(self.random.deck_shuffle)
+        # Resolved before the board map is built, as setting up the ruins needs the number of ruin explorers
+        self.capabilities = CapabilityRegistry(self)
         self.players = players
         self.board_map = AutumnBoardMap(self)
         self.item_supply = []
@@ -40,15 +57,31 @@ class Game:
             self.turn_player = players[0]
         else:
             self.turn_player = None
+        self.winner = None
 
         self.initialize_item_supply()
 
+    # The players should only be changed through add_player or by replacing them outright, so that the capability
+    # registry always knows every player
+    @property
+    def players(self) -> list[Player]:
+        return self.seated_players
+
+    @players.setter
+    def players(self, players: list[Player]) -> None:
+        self.seated_players = players
+        self.capabilities.refresh()
+
     def clearings(self) -> list[Clearing]:
         return self.board_map.clearings
 
     def get_clearings_of_suit(self, suit: Suit) -> list[Clearing]:
         return self.board_map.get_clearings_of_suit(suit)
 
+    # Clearings with a piece belonging to any of the players whose presence bits are set in the mask
+    def get_clearings_with_presence(self, presence_mask: int) -> list[Clearing]:
+        return [clearing for clearing in self.clearings() if clearing.player_presence_mask & presence_mask]
+
     def initialize_item_supply(self) -> None:
         for item in [Item.BAG, Item.BOOT, Item.COIN, Item.SWORD, Item.TEAPOT]:
             for _ in range(2):
@@ -56,38 +89,63 @@ class Game:
         self.item_supply.append(ItemToken(Item.CROSSBOW))
         self.item_supply.append(ItemToken(item.HAMMER))
 
+    def add_player(self, player: Player) -> None:
+        self.players.append(player)
+        self.capabilities.add_player(player)
+
     def get_number_of_items_per_ruin(self) -> int:
-        ruin_explorers_playing = 0
-        for player in self.players:
-            if player.faction.is_ruin_exploring_faction():
-                ruin_explorers_playing += 1
-        return ruin_explorers_playing
+        return self.capabilities.ruin_explorer_count
 
     def get_item_if_available(self, item: Item) -> Optional[ItemToken]:
         for item_token in self.item_supply:
             if item_token.item == item:
                 return item_token
 
-    # TODO: Implement
+    # The Zobrist hash worked out from scratch, to check the one kept up to date as the game is played
+    def compute_zobrist_hash(self) -> int:
+        zobrist_hash = ZobristHash()
+        zobrist_hash.add_features(self.deck.get_features())
+        for location in [*self.clearings(), *self.board_map.forests]:
+            for player, piece_map in location.pieces.items():
+                zobrist_hash.add_features(location.get_piece_feature(player, piece)
+                                          for piece in piece_map.get_all_pieces())
+        for player in self.players:
+            zobrist_hash.add_features(player.get_zobrist_features())
+        return zobrist_hash.value
+
+    # TODO: Coalitions, dominance victories
     def win(self, player: Player) -> None:
-        pass
+        if not self.winner:
+            self.winner = player
 
     def draw_card(self) -> Optional[Card]:
         return self.deck.draw_card()
 
     def discard_card(self, card: Card) -> None:
-        for player in self.players:
-            if player.takes_discarded_cards():
-                player.handle_discarded_card(card)
-                return
+        discarded_card_taker = self.capabilities.discarded_card_taker
+        if discarded_card_taker:
+            discarded_card_taker.handle_discarded_card(card)
+            return
         self.send_card_to_discard_pile(card)
 
+    def discard_cards(self, cards: list[Card]) -> None:
+        discarded_card_taker = self.capabilities.discarded_card_taker
+        if discarded_card_taker:
+            for card in cards:
+                discarded_card_taker.handle_discarded_card(card)
+            return
+        self.send_cards_to_discard_pile(cards)
+
     # Skips things like Lost Souls - used to empty the Lost Souls
     def send_card_to_discard_pile(self, card: Card) -> None:
         if isinstance(card, DominanceCard):
-            self.deck.dominance_region.append(card)
+            self.deck.add_card_to_dominance_region(card)
         else:
-            self.deck.discard_pile.append(card)
+            self.deck.add_card_to_discard_pile(card)
+
+    def send_cards_to_discard_pile(self, cards: list[Card]) -> None:
+        for card in cards:
+            self.send_card_to_discard_pile(card)
 
     def craft_item(self, item: Item, player: Player, score_points: int) -> None:
         item_token = self.get_item_if_available(item)
@@ -95,3 +153,4 @@ class Game:
             self.item_supply.remove(item_token)
             player.get_item(item_token)
             player.add_victory_points(score_points)
+            self.capabilities.update_player(player)
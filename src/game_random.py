@@ -0,0 +1,44 @@
+from __future__ import annotations
+from random import Random
+from typing import Hashable, Optional
+
+
+# Each source of chance in the rules draws from its own stream, so how often one is used never shifts what another
+# produces. Two games with the same streams seed start with the same deck order, ruin contents and corner homeland
+# choices, and roll the same sequence of battle dice, however differently their bots play
+# Every stream is seeded from the streams seed and its own name, so streams seeds can be any hashable (such as a seed
+# and a matchup key) and still give the same streams in every process. Without a streams seed, the streams are unseeded
+# Bot decisions that break ties at random still use the global random generator
+class GameRandom:
+    streams_seed: Optional[Hashable]
+    deck_shuffle: Random
+    ruin_items: Random
+    corner_homeland: Random
+    battle_dice: Random
+
+    def __init__(self, streams_seed: Optional[Hashable] = None) -> None:
+        self.streams_seed = streams_seed
+        self.deck_shuffle = self.create_stream('deck_shuffle')
+        self.ruin_items = self.create_stream('ruin_items')
+        self.corner_homeland = self.create_stream('corner_homeland')
+        self.battle_dice = self.create_stream('battle_dice')
+
+    def create_stream(self, stream_name: str) -> Random:
+        if self.streams_seed is None:
+            return Random()
+        # Seeding with a string is stable across processes, unlike hash() of most objects
+        return Random(f'{self.streams_seed!r}:{stream_name}')
+
+    def roll_battle_dice(self) -> tuple[int, int]:
+        return self.battle_dice.randint(0, 3), self.battle_dice.randint(0, 3)
+
+    # Where each stream is up to, so drawing from the streams can be undone
+    def get_snapshot(self) -> tuple:
+        return tuple(stream.getstate() for stream in self.get_streams())
+
+    def restore_snapshot(self, snapshot: tuple) -> None:
+        for stream, stream_state in zip(self.get_streams(), snapshot):
+            stream.setstate(stream_state)
+
+    def get_streams(self) -> list[Random]:
+        return [self.deck_shuffle, self.ruin_items, self.corner_homeland, self.battle_dice]
@@ -2,6 +2,7 @@ from __future__ import annotations
 from collections import deque
 from typing import Optional, TYPE_CHECKING
 
+from board_map.board_topology import ClearingTopology
 from locations.location import Location
 from pieces.building import Building
 
@@ -14,29 +15,39 @@ if TYPE_CHECKING:
     from player_resources.player import Player
 
 
+# The clearing's building slots and corner are read from its topology, which clearings on a board map share with every
+# other game on that map. Its neighbours are this game's own clearings and forests, linked by the board map from the
+# topology once the board is set up
 class Clearing(Location):
+    topology: ClearingTopology
     suit: Suit
     priority: int
-    total_building_slots: int
-    path_connected_clearings: set[Clearing]
-    river_connected_clearings: set[Clearing]
-    adjacent_forests: set[Forest]
-    ruin: Optional[Ruin]
-    is_corner_clearing: bool
+    path_connected_clearings: tuple[Clearing, ...]
+    river_connected_clearings: tuple[Clearing, ...]
+    adjacent_forests: tuple[Forest, ...]
     opposite_corner_clearing: Optional[Clearing]
+    ruin: Optional[Ruin]
+    location_bit: int  # This clearing's bit in each player's clearing presence mask
 
     def __init__(self, game: Game, suit: Suit, priority: int, total_building_slots: int,
-                 is_corner_clearing: bool = False) -> None:
+                 is_corner_clearing: bool = False, topology: ClearingTopology = None) -> None:
+        if topology is None:
+            # A clearing that isn't part of a board map's layout has no neighbours
+            topology = ClearingTopology(priority, suit, total_building_slots, is_corner_clearing,
+                                        opposite_corner_priority=None, has_ruin=False, path_connected_priorities=(),
+                                        river_connected_priorities=(), adjacent_forest_indices=())
+
         super().__init__(game)
+        self.topology = topology
         self.suit = suit
         self.priority = priority
-        self.total_building_slots = total_building_slots
-        self.path_connected_clearings = set()
-        self.river_connected_clearings = set()
-        self.adjacent_forests = set()
-        self.ruin = None
-        self.is_corner_clearing = is_corner_clearing
+        self.path_connected_clearings = ()
+        self.river_connected_clearings = ()
+        self.adjacent_forests = ()
         self.opposite_corner_clearing = None
+        self.ruin = None
+        self.location_bit = 1 << (priority - 1)
+        self.location_key = ('Clearing', priority)
 
     # TODO: Remove after testing
     def __repr__(self):
@@ -51,30 +62,32 @@ class Clearing(Location):
     def __hash__(self):
         return hash(self.priority)
 
-    ###########################################
-    #                                         #
-    # Initial connections + adjacency + setup #
-    #                                         #
-    ###########################################
+    ######################
+    #                    #
+    # Layout + adjacency #
+    #                    #
+    ######################
 
-    def connect_clearing_by_path(self, other_clearing: Clearing) -> None:
-        self.path_connected_clearings.add(other_clearing)
-        other_clearing.path_connected_clearings.add(self)
+    @property
+    def total_building_slots(self) -> int:
+        return self.topology.total_building_slots
 
-    def connect_clearing_by_river(self, other_clearing: Clearing) -> None:
-        self.river_connected_clearings.add(other_clearing)
-        other_clearing.river_connected_clearings.add(self)
+    @property
+    def is_corner_clearing(self) -> bool:
+        return self.topology.is_corner_clearing
 
-    def mark_forest_as_adjacent_to_self(self, forest: Forest) -> None:
-        self.adjacent_forests.add(forest)
-        forest.adjacent_clearings.add(self)
+    def add_player_presence(self, player: Player) -> None:
+        super().add_player_presence(player)
+        player.clearing_presence_mask |= self.location_bit
 
-    def mark_corner_clearings_as_opposite(self, opposing_clearing: Clearing) -> None:
-        self.opposite_corner_clearing = opposing_clearing
-        opposing_clearing.opposite_corner_clearing = self
+    def remove_player_presence(self, player: Player) -> None:
+        super().remove_player_presence(player)
+        player.clearing_presence_mask &= ~self.location_bit
 
     def add_ruin(self, ruin: Ruin) -> None:
         self.ruin = ruin
+        # A ruin takes up a building slot
+        self.game.query_cache.bump_board_version()
 
     ##################################################################
     #                                                                #
@@ -86,8 +99,7 @@ class Clearing(Location):
     def can_place_piece(self, player: Player, piece: Piece, ignore_building_slots: bool = False) -> bool:
         if isinstance(piece, Building) and self.get_open_building_slot_count() == 0 and not ignore_building_slots:
             return False
-        pieces_in_clearing = self.get_pieces()
-        for piece_already_in_clearing in pieces_in_clearing:
+        for piece_already_in_clearing in self.placement_restricting_pieces:
             # Keep, Snare, limits on Sympathy/Roost/Trade Post
             if piece_already_in_clearing.prevents_piece_being_placed_by_player(player, piece):
                 return False
@@ -95,8 +107,7 @@ class Clearing(Location):
 
     # Only CC can move out of Snare clearings
     def can_move_piece_out_of(self, player: Player, piece: Piece) -> bool:
-        pieces_in_clearing = self.get_pieces()
-        for piece_already_in_clearing in pieces_in_clearing:
+        for piece_already_in_clearing in self.movement_restricting_pieces:
             # Snare
             if piece_already_in_clearing.prevents_piece_being_moved_out_by_player(player, piece):
                 return False
@@ -131,6 +142,7 @@ class Clearing(Location):
         self.ruin.items.remove(item_gained)
         if not self.ruin.items:
             self.ruin = None
+            self.game.query_cache.bump_board_version()
 
     ###################################
     #                                 #
@@ -179,7 +191,7 @@ class Clearing(Location):
     def get_players_with_defenseless_pieces(self) -> list[Player]:
         players_with_defenseless_pieces = []
         for player in self.pieces:
-            if player.is_defenseless(self):
+            if self.game.capabilities.is_defenseless(player, self):
                 players_with_defenseless_pieces.append(player)
         return players_with_defenseless_pieces
         # players_with_defenseless_pieces = []
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from collections import deque
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from constants import Faction
 from locations.location import Location
@@ -12,23 +12,22 @@ if TYPE_CHECKING:
     from player_resources.player import Player
 
 
+# Like clearings, forests are linked to their neighbours by the board map, from its topology
 class Forest(Location):
-    adjacent_clearings: set[Clearing]
-    adjacent_forests: set[Forest]
+    index: Optional[int]
+    adjacent_clearings: tuple[Clearing, ...]
+    adjacent_forests: tuple[Forest, ...]
 
-    def __init__(self, game) -> None:
+    # Forests are told their index on the board map, which identifies them in the topology and the game's Zobrist hash
+    # A forest without an index isn't part of a board map's layout, and has no neighbours
+    def __init__(self, game, index: Optional[int] = None) -> None:
         super().__init__(game)
-        self.adjacent_clearings = set()
-        self.adjacent_forests = set()
+        self.index = index
+        self.adjacent_clearings = ()
+        self.adjacent_forests = ()
         self.name = ''
-
-    def mark_forest_as_adjacent_to_self(self, forest: Forest) -> None:
-        self.adjacent_forests.add(forest)
-        forest.adjacent_forests.add(self)
-
-    def mark_clearing_as_adjacent_to_self(self, clearing: Clearing) -> None:
-        self.adjacent_clearings.add(clearing)
-        clearing.adjacent_forests.add(self)
+        if index is not None:
+            self.location_key = ('Forest', index)
 
     def initialize_name(self) -> None:
         sorted_adjacent_clearings = sort_clearings_by_priority([clearing for clearing in self.adjacent_clearings])
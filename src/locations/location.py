@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from player_resources.player_piece_map import PlayerPieceMap
 
@@ -15,10 +15,23 @@ if TYPE_CHECKING:
 class Location:
     game: Game
     pieces: dict[Player, PlayerPieceMap]
+    placement_restricting_pieces: dict[Piece, None]
+    movement_restricting_pieces: dict[Piece, None]
+    placement_effect_pieces: dict[Piece, None]
+    movement_effect_pieces: dict[Piece, None]
+    player_presence_mask: int  # The presence bits of every player with a piece in this location
+    location_key: Optional[tuple]  # Identifies the location's pieces in the game's Zobrist hash, None if not hashed
 
     def __init__(self, game: Game) -> None:
         self.game = game
         self.pieces = {}
+        self.player_presence_mask = 0
+        self.location_key = None
+        # Insertion-ordered registries of the few pieces in this location that can restrict or react to others
+        self.placement_restricting_pieces = {}
+        self.movement_restricting_pieces = {}
+        self.placement_effect_pieces = {}
+        self.movement_effect_pieces = {}
 
     #################################
     #                               #
@@ -38,6 +51,57 @@ class Location:
     def get_piece_map_for_player(self, player: Player) -> PlayerPieceMap:
         return self.piece_map(player)
 
+    # All changes to the pieces in a location go through these two methods, so that anything derived from the state of
+    # the board (such as the game's query cache) can be kept up to date
+    def add_piece_to_piece_map(self, player: Player, piece: Piece) -> None:
+        piece_map = self.piece_map(player)
+        previous_piece_count = piece_map.get_count_of_pieces()
+        piece_map.add_piece(piece)
+        piece_count = piece_map.get_count_of_pieces()
+        if piece_count == 1:
+            self.add_player_presence(player)
+        if piece.restricts_placement:
+            self.placement_restricting_pieces[piece] = None
+        if piece.restricts_movement_out:
+            self.movement_restricting_pieces[piece] = None
+        if piece.has_placement_effect:
+            self.placement_effect_pieces[piece] = None
+        if piece.has_movement_effect:
+            self.movement_effect_pieces[piece] = None
+        # Adding a piece that's already here (or removing one that isn't) changes nothing
+        if self.location_key and piece_count != previous_piece_count:
+            self.game.zobrist_hash.add_feature(self.get_piece_feature(player, piece))
+        self.game.query_cache.bump_board_version()
+
+    def remove_piece_from_piece_map(self, player: Player, piece: Piece) -> None:
+        piece_map = self.piece_map(player)
+        previous_piece_count = piece_map.get_count_of_pieces()
+        piece_map.remove_piece(piece)
+        piece_count = piece_map.get_count_of_pieces()
+        if not piece_count:
+            self.remove_player_presence(player)
+        if piece.restricts_placement:
+            self.placement_restricting_pieces.pop(piece, None)
+        if piece.restricts_movement_out:
+            self.movement_restricting_pieces.pop(piece, None)
+        if piece.has_placement_effect:
+            self.placement_effect_pieces.pop(piece, None)
+        if piece.has_movement_effect:
+            self.movement_effect_pieces.pop(piece, None)
+        if self.location_key and piece_count != previous_piece_count:
+            self.game.zobrist_hash.remove_feature(self.get_piece_feature(player, piece))
+        self.game.query_cache.bump_board_version()
+
+    # Pieces of the same player, class and name are interchangeable, so they share a feature
+    def get_piece_feature(self, player: Player, piece: Piece) -> tuple:
+        return 'Piece', self.location_key, player.faction, type(piece).__name__, piece.name
+
+    def add_player_presence(self, player: Player) -> None:
+        self.player_presence_mask |= player.presence_bit
+
+    def remove_player_presence(self, player: Player) -> None:
+        self.player_presence_mask &= ~player.presence_bit
+
     ##################################################################
     #                                                                #
     # Permission checks for placing or moving pieces in the location #
@@ -87,7 +151,10 @@ class Location:
     # or movement
     def add_piece(self, player: Player, piece: Piece, trigger_placement_effects: bool = False,
                   trigger_movement_effects: bool = False) -> None:
-        self.piece_map(player).add_piece(piece)
+        # Adding a piece where it already is changes nothing (removing it from its old location would remove it here)
+        if piece.location is self:
+            return
+        self.add_piece_to_piece_map(player, piece)
         if piece.location:
             piece.location.remove_pieces_without_side_effects(player, [piece])
         piece.update_location(self)
@@ -140,7 +207,7 @@ class Location:
     # This doesn't cause side effects or move the pieces anywhere - it strictly removes them from this spot
     def remove_pieces_without_side_effects(self, player: Player, pieces: list[Piece]) -> None:
         for piece in pieces:
-            self.piece_map(player).remove_piece(piece)
+            self.remove_piece_from_piece_map(player, piece)
 
     # Returning pieces to the supply when removed outside of battle: Revolt, Marksman, returning Funds,
     # spending Acolytes, Convert/Sanctify, Price of Failure (Should be overridden to destroy the piece), Bomb
@@ -151,7 +218,7 @@ class Location:
             if piece.cannot_be_removed:
                 piece.resolve_effects_on_attempting_to_remove_self()  # For Vagabot 'Big Damage'
             else:
-                self.piece_map(player).remove_piece(piece)
+                self.remove_piece_from_piece_map(player, piece)
                 removed_pieces.append(piece)
         # It's up to the owners of pieces that cannot be removed to override this method
         player.move_removed_pieces_into_supply(pieces, self)
@@ -167,17 +234,22 @@ class Location:
     def remove_pieces_in_battle_to_supply(self, player: Player, pieces: list[Piece], is_attacker: bool = True) -> None:
         # Remove piece from this clearing
         for piece in pieces:
-            self.piece_map(player).remove_piece(piece)
+            self.remove_piece_from_piece_map(player, piece)
         player.move_removed_pieces_into_supply_from_battle(pieces, self, is_attacker)
 
     # Unsure of any offhand?
+    # Iterate over a copy, since resolving an effect may remove pieces from this location
     def trigger_placement_effects(self, player: Player, pieces: list[Piece]) -> None:
-        for piece in self.get_pieces():
+        if not self.placement_effect_pieces:
+            return
+        for piece in list(self.placement_effect_pieces):
             piece.resolve_placement_effect(player, pieces)
 
     # Automated Outrage - any others?
     def trigger_movement_effects(self, player: Player, pieces: list[Piece]) -> None:
-        for piece in self.get_pieces():
+        if not self.movement_effect_pieces:
+            return
+        for piece in list(self.movement_effect_pieces):
             piece.resolve_movement_effect(player, pieces)
 
     ##############################
@@ -193,16 +265,16 @@ class Location:
         return piece_map.get_all_pieces()
 
     def get_warriors_for_player(self, player: Player) -> list[Warrior]:
-        return self.piece_map(player).warriors
+        return list(self.piece_map(player).warriors)
 
     def get_buildings_for_player(self, player: Player) -> list[Building]:
-        return self.piece_map(player).buildings
+        return list(self.piece_map(player).buildings)
 
     def get_tokens_for_player(self, player: Player) -> list[Token]:
-        return self.piece_map(player).tokens
+        return list(self.piece_map(player).tokens)
 
     def get_other_pieces_for_player(self, player: Player) -> list[Piece]:
-        return self.piece_map(player).other
+        return list(self.piece_map(player).other)
 
     # FOR ALL PLAYERS, AS A MAPPING #
 
@@ -215,25 +287,25 @@ class Location:
     def get_warriors_for_all_players(self) -> dict[Player, list[Warrior]]:
         warriors_for_players = {}
         for player, piece_map in self.pieces.items():
-            warriors_for_players[player] = piece_map.warriors
+            warriors_for_players[player] = list(piece_map.warriors)
         return warriors_for_players
 
     def get_buildings_for_all_players(self) -> dict[Player, list[Building]]:
         buildings_for_players = {}
         for player, piece_map in self.pieces.items():
-            buildings_for_players[player] = piece_map.buildings
+            buildings_for_players[player] = list(piece_map.buildings)
         return buildings_for_players
 
     def get_tokens_for_all_players(self) -> dict[Player, list[Token]]:
         tokens_for_players = {}
         for player, piece_map in self.pieces.items():
-            tokens_for_players[player] = piece_map.tokens
+            tokens_for_players[player] = list(piece_map.tokens)
         return tokens_for_players
 
     def get_other_pieces_for_all_players(self) -> dict[Player, list[Piece]]:
         other_pieces_for_players = {}
         for player, piece_map in self.pieces.items():
-            other_pieces_for_players[player] = piece_map.other
+            other_pieces_for_players[player] = list(piece_map.other)
         return other_pieces_for_players
 
     # FOR ALL PLAYERS, AS AN ITERABLE #
@@ -404,27 +476,20 @@ class Location:
     #####################################
 
     def is_player_in_location(self, player: Player) -> bool:
-        return self.get_piece_count_for_player(player) > 0
+        return bool(self.player_presence_mask & player.presence_bit)
 
     def is_player_warriors_in_location(self, player: Player) -> bool:
         return self.get_warrior_count_for_player(player) > 0
 
     def is_any_other_player_in_location(self, active_player: Player) -> bool:
-        return self.get_total_piece_count() - self.get_piece_count_for_player(active_player) > 0
+        return bool(self.player_presence_mask & ~active_player.presence_bit)
 
     def get_all_players_in_location(self) -> list[Player]:
-        players_in_location = []
-        for player in self.pieces:
-            if self.get_piece_count_for_player(player) > 0:
-                players_in_location.append(player)
-        return players_in_location
+        return [player for player in self.pieces if self.player_presence_mask & player.presence_bit]
 
     def get_all_other_players_in_location(self, active_player: Player) -> list[Player]:
-        players_in_location = []
-        for player in self.pieces:
-            if self.get_piece_count_for_player(player) > 0 and not player == active_player:
-                players_in_location.append(player)
-        return players_in_location
+        other_players_mask = self.player_presence_mask & ~active_player.presence_bit
+        return [player for player in self.pieces if other_players_mask & player.presence_bit]
 
     #####################################################
     #                                                   #
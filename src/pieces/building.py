@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from constants import PieceKind
 from pieces.piece import Piece
 
 if TYPE_CHECKING:
@@ -8,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class Building(Piece):
+    kind = PieceKind.BUILDING
+
     def __init__(self, player: Player, name: str) -> None:
         super().__init__(player, name)
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 
+from constants import PieceKind
+
 if TYPE_CHECKING:
     from locations.location import Location
     from player_resources.player import Player
@@ -11,6 +13,12 @@ class Piece:
     name: str
     location: Optional[Location]
     cannot_be_removed: bool
+    kind: PieceKind = PieceKind.OTHER
+    piece_classes: tuple[type[Piece], ...]
+    restricts_placement: bool = False
+    restricts_movement_out: bool = False
+    has_placement_effect: bool = False
+    has_movement_effect: bool = False
 
     # Item Tokens do not have players, all other pieces do
     # cannot_be_removed == Vagabond Pawn
@@ -20,6 +28,19 @@ class Piece:
         self.location = None
         self.cannot_be_removed = cannot_be_removed
 
+    # Only a handful of piece classes (Keep, Roost, Sympathy, Snare, Automated Outrage) can restrict or react to other
+    # pieces, so this is worked out once per class. Locations then only need to check the pieces that actually can
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every Piece class this class is an instance of, for indexing pieces by type without isinstance scans
+        cls.piece_classes = tuple(piece_class for piece_class in cls.__mro__ if issubclass(piece_class, Piece))
+        cls.restricts_placement = (cls.prevents_piece_being_placed_by_player is not
+                                   Piece.prevents_piece_being_placed_by_player)
+        cls.restricts_movement_out = (cls.prevents_piece_being_moved_out_by_player is not
+                                      Piece.prevents_piece_being_moved_out_by_player)
+        cls.has_placement_effect = cls.resolve_placement_effect is not Piece.resolve_placement_effect
+        cls.has_movement_effect = cls.resolve_movement_effect is not Piece.resolve_movement_effect
+
     # Keep, Snare, limits on Sympathy/Roost/Trade Post
     def prevents_piece_being_placed_by_player(self, player: Player, piece: Piece) -> bool:
         return False
@@ -48,3 +69,6 @@ class Piece:
 
     def get_score_for_removal(self) -> int:
         return 0
+
+
+Piece.piece_classes = (Piece,)
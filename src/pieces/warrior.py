@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from constants import PieceKind
 from pieces.piece import Piece
 
 if TYPE_CHECKING:
@@ -8,5 +9,7 @@ if TYPE_CHECKING:
 
 
 class Warrior(Piece):
+    kind = PieceKind.WARRIOR
+
     def __init__(self, player: Player) -> None:
         super().__init__(player, 'Warrior')
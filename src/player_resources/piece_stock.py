@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pieces.building import Building
@@ -15,6 +15,7 @@ class PieceStock:
     buildings: list[Building]
     tokens: list[Token]
     other_pieces: list[Piece]
+    pieces_by_type: dict[Type[Piece], list[Piece]]
 
     def __init__(self, player: Player, warriors: list[Warrior] = None, buildings: list[Building] = None,
                  tokens: list[Token] = None, other_pieces: list[Piece] = None) -> None:
@@ -33,7 +34,16 @@ class PieceStock:
         self.tokens = tokens
         self.other_pieces = other_pieces
 
+        # A piece stock never changes after it's created, so it's bucketed by type once up front
+        self.pieces_by_type = {}
+        for piece in self.pieces:
+            for piece_class in piece.piece_classes:
+                self.pieces_by_type.setdefault(piece_class, []).append(piece)
+
     @property
     def pieces(self) -> list[Piece]:
         return [piece for piece_list in (self.warriors, self.buildings, self.tokens, self.other_pieces)
                 for piece in piece_list]
+
+    def get_pieces_of_type(self, class_name: Type[Piece]) -> list[Piece]:
+        return list(self.pieces_by_type.get(class_name, []))
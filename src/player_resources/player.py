@@ -4,21 +4,22 @@ import random
 from typing import Optional, TYPE_CHECKING, Union
 
 from battle_utils import DamageResult, RollResult
+from constants import Suit
 from locations.clearing import Clearing
-from pieces.building import Building
-from pieces.warrior import Warrior
 from player_resources.piece_stock import PieceStock
 from player_resources.supply import Supply
 
 if TYPE_CHECKING:
-    from constants import Faction, Suit
+    from constants import Faction
     from deck.cards.card import Card
     from game import Game
     from locations.forest import Forest
     from locations.location import Location
+    from pieces.building import Building
     from pieces.item_token import ItemToken
     from pieces.piece import Piece
     from pieces.token import Token
+    from pieces.warrior import Warrior
 
 
 class Player(ABC):
@@ -30,6 +31,14 @@ class Player(ABC):
     hand: list[Card]
     revealed_cards: list[Card]
     crafted_items: list[ItemToken]
+    presence_bit: int
+    clearing_presence_mask: int  # The location bits of every clearing this player has a piece in
+    can_halve_damage: bool = False
+    can_be_defenseless: bool = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.can_halve_damage = cls.halves_damage is not Player.halves_damage
 
     def __init__(self, game: Game, faction: Faction, piece_stock: PieceStock = None) -> None:
         if piece_stock is None:
@@ -38,6 +47,8 @@ class Player(ABC):
         self.victory_points = 0
         self.game = game
         self.faction = faction
+        self.presence_bit = faction.get_presence_bit()
+        self.clearing_presence_mask = 0
 
         self.piece_stock = piece_stock
         self.supply = Supply(game, self)
@@ -50,6 +61,8 @@ class Player(ABC):
         self.supply.add_pieces(self, self.piece_stock.pieces)
 
     def take_turn(self) -> None:
+        # Cached queries are scoped to a single turn
+        self.game.query_cache.clear()
         self.birdsong()
         self.daylight()
         self.evening()
@@ -74,10 +87,24 @@ class Player(ABC):
         pass
 
     def add_victory_points(self, victory_points: int) -> None:
-        self.victory_points = max(0, self.victory_points + victory_points)
+        self.set_victory_points(max(0, self.victory_points + victory_points))
         if self.victory_points >= 30:
             self.game.win(self)
 
+    # Doesn't check for a win. Zero VP has no feature in the game's Zobrist hash, so new players don't need one
+    def set_victory_points(self, victory_points: int) -> None:
+        if self.victory_points:
+            self.game.zobrist_hash.remove_feature(('VictoryPoints', self.faction, self.victory_points))
+        self.victory_points = victory_points
+        if self.victory_points:
+            self.game.zobrist_hash.add_feature(('VictoryPoints', self.faction, self.victory_points))
+
+    # This player's features in the game's Zobrist hash, other than their pieces on the board
+    def get_zobrist_features(self) -> list[tuple]:
+        if not self.victory_points:
+            return []
+        return [('VictoryPoints', self.faction, self.victory_points)]
+
     def get_unplaced_pieces(self) -> list[Piece]:
         return self.supply.get_pieces()
 
@@ -93,6 +120,15 @@ class Player(ABC):
     def get_unplaced_other_pieces(self) -> list[Piece]:
         return self.supply.get_other_pieces()
 
+    def get_unplaced_warrior_count(self) -> int:
+        return self.supply.get_warrior_count()
+
+    def get_unplaced_building_count(self) -> int:
+        return self.supply.get_building_count()
+
+    def get_unplaced_token_count(self) -> int:
+        return self.supply.get_token_count()
+
     ################
     #              #
     # Rule methods #
@@ -110,6 +146,10 @@ class Player(ABC):
         return True
 
     def get_ruled_clearings(self) -> list[Clearing]:
+        # Return a copy, so callers can't modify the cached list
+        return list(self.game.query_cache.get(('ruled_clearings', self), self.find_ruled_clearings))
+
+    def find_ruled_clearings(self) -> list[Clearing]:
         ruled_clearings = []
         for clearing in self.game.clearings():
             if self.does_rule_clearing(clearing):
@@ -117,18 +157,10 @@ class Player(ABC):
         return ruled_clearings
 
     def get_ruled_suited_clearings(self, suit: Suit) -> list[Clearing]:
-        ruled_suited_clearings = []
-        for clearing in self.game.get_clearings_of_suit(suit):
-            if self.does_rule_clearing(clearing):
-                ruled_suited_clearings.append(clearing)
-        return ruled_suited_clearings
+        return [clearing for clearing in self.get_ruled_clearings() if Suit.are_suits_equal(clearing.suit, suit)]
 
     def get_rule_value(self, clearing: Clearing) -> int:
-        rule_value = 0
-        for piece in clearing.get_pieces_for_player(self):
-            if isinstance(piece, Warrior) or isinstance(piece, Building):
-                rule_value += 1
-        return rule_value
+        return clearing.get_warrior_count_for_player(self) + clearing.get_building_count_for_player(self)
 
     ##################
     #                #
@@ -137,7 +169,7 @@ class Player(ABC):
     ##################
 
     def battle(self, clearing: Clearing, defender: Player) -> None:
-        random_rolls = (random.randint(0, 3), random.randint(0, 3))
+        random_rolls = self.game.random.roll_battle_dice()
         # Defender allocates the rolls - high roll to attacker, low roll to defender, except in the case of Veterans
         roll_result = defender.allocate_rolls_as_defender(random_rolls)
         # Each battler caps their hits and adds their relevant bonus hits
@@ -195,7 +227,8 @@ class Player(ABC):
 
     def get_bonus_hits(self, clearing: Clearing, opponent: Player, is_attacker: bool = True) -> int:
         bonus_hits = 0
-        if clearing.get_warrior_count_for_player(self) > 0 and opponent.is_defenseless(clearing):
+        if (clearing.get_warrior_count_for_player(self) > 0 and
+                self.game.capabilities.is_defenseless(opponent, clearing)):
             bonus_hits += 1
         return bonus_hits
 
@@ -258,7 +291,7 @@ class Player(ABC):
     def get_adjacent_clearings(self, origin: Union[Clearing, Forest]) -> list[Clearing]:
         if isinstance(origin, Clearing):
             adjacent_clearings = set(origin.path_connected_clearings)
-            if self.treats_rivers_as_paths():
+            if self.game.capabilities.treats_rivers_as_paths(self):
                 adjacent_clearings.update(origin.river_connected_clearings)
         else:
             adjacent_clearings = origin.adjacent_clearings
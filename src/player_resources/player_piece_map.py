@@ -1,83 +1,67 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from pieces.building import Building
-from pieces.token import Token
-from pieces.warrior import Warrior
+from constants import PieceKind
 
 if TYPE_CHECKING:
     from locations.location import Location
+    from pieces.building import Building
     from pieces.piece import Piece
+    from pieces.token import Token
+    from pieces.warrior import Warrior
     from player_resources.player import Player
 
 
+# Pieces are stored in insertion-ordered dicts (used as ordered sets), so removal is O(1) while iteration order stays
+# the order the pieces were added in. Battle damage and movement (e.g. 'all but the first three warriors') rely on that
 class PlayerPieceMap:
     def __init__(self, player: Player, location: Location) -> None:
         self.player: Player = player
         self.location: Location = location
-        self.warriors: list[Warrior] = []
-        self.buildings: list[Building] = []
-        self.tokens: list[Token] = []
-        self.other: list[Piece] = []  # Pawn for Vagabond
+        self.warriors: dict[Warrior, None] = {}
+        self.buildings: dict[Building, None] = {}
+        self.tokens: dict[Token, None] = {}
+        self.other: dict[Piece, None] = {}  # Pawn for Vagabond
+        self.pieces_by_kind: dict[PieceKind, dict[Piece, None]] = {
+            PieceKind.WARRIOR: self.warriors,
+            PieceKind.BUILDING: self.buildings,
+            PieceKind.TOKEN: self.tokens,
+            PieceKind.OTHER: self.other
+        }
 
     def add_piece(self, piece: Piece) -> None:
-        if isinstance(piece, Warrior):
-            self.add_warrior(piece)
-        elif isinstance(piece, Building):
-            self.add_building(piece)
-        elif isinstance(piece, Token):
-            self.add_token(piece)
-        else:
-            self.add_other(piece)
+        self.pieces_by_kind[piece.kind][piece] = None
 
     def add_warrior(self, warrior: Warrior) -> None:
-        self.warriors.append(warrior)
+        self.warriors[warrior] = None
 
     def add_building(self, building: Building) -> None:
-        self.buildings.append(building)
+        self.buildings[building] = None
 
     def add_token(self, token: Token) -> None:
-        self.tokens.append(token)
+        self.tokens[token] = None
 
     def add_other(self, piece: Piece) -> None:
-        self.other.append(piece)
+        self.other[piece] = None
 
+    # Removing a piece that isn't in the map is a no-op
     def remove_piece(self, piece: Piece) -> None:
-        if isinstance(piece, Warrior):
-            self.remove_warrior(piece)
-        elif isinstance(piece, Building):
-            self.remove_building(piece)
-        elif isinstance(piece, Token):
-            self.remove_token(piece)
-        else:
-            self.remove_other(piece)
+        self.pieces_by_kind[piece.kind].pop(piece, None)
 
     def remove_warrior(self, warrior: Warrior) -> None:
-        try:
-            self.warriors.remove(warrior)
-        except ValueError:
-            pass
+        self.warriors.pop(warrior, None)
 
     def remove_building(self, building: Building) -> None:
-        try:
-            self.buildings.remove(building)
-        except ValueError:
-            pass
+        self.buildings.pop(building, None)
 
     def remove_token(self, token: Token) -> None:
-        try:
-            self.tokens.remove(token)
-        except ValueError:
-            pass
+        self.tokens.pop(token, None)
 
     def remove_other(self, piece: Piece) -> None:
-        try:
-            self.other.remove(piece)
-        except ValueError:
-            pass
+        self.other.pop(piece, None)
 
     def get_count_of_pieces(self) -> int:
-        return len(self.get_all_pieces())
+        return len(self.warriors) + len(self.buildings) + len(self.tokens) + len(self.other)
 
     def get_all_pieces(self) -> list[Piece]:
         return [piece for piece_list in (self.warriors, self.buildings, self.tokens, self.other)
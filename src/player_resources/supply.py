@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import Type, TYPE_CHECKING
+from typing import Optional, Type, TYPE_CHECKING
 
 from locations.location import Location
 
 if TYPE_CHECKING:
+    from constants import Suit
     from game import Game
     from pieces.building import Building
     from pieces.piece import Piece
@@ -13,9 +14,33 @@ if TYPE_CHECKING:
 
 
 class Supply(Location):
+    player: Player
+    pieces_by_type: dict[Type[Piece], dict[Piece, None]]
+    pieces_by_suit: dict[Suit, dict[Piece, None]]
+
     def __init__(self, game: Game, player: Player) -> None:
         super().__init__(game)
         self.player = player
+        # Insertion-ordered buckets of the unplaced pieces, so bots can count or take pieces of a given type or suit
+        # without scanning the whole supply
+        self.pieces_by_type = {}
+        self.pieces_by_suit = {}
+
+    def add_piece_to_piece_map(self, player: Player, piece: Piece) -> None:
+        super().add_piece_to_piece_map(player, piece)
+        for piece_class in piece.piece_classes:
+            self.pieces_by_type.setdefault(piece_class, {})[piece] = None
+        suit = getattr(piece, 'suit', None)
+        if suit:
+            self.pieces_by_suit.setdefault(suit, {})[piece] = None
+
+    def remove_piece_from_piece_map(self, player: Player, piece: Piece) -> None:
+        super().remove_piece_from_piece_map(player, piece)
+        for piece_class in piece.piece_classes:
+            self.pieces_by_type.get(piece_class, {}).pop(piece, None)
+        suit = getattr(piece, 'suit', None)
+        if suit:
+            self.pieces_by_suit.get(suit, {}).pop(piece, None)
 
     def get_pieces(self) -> list[Piece]:
         return self.get_pieces_for_player(self.player)
@@ -32,5 +57,31 @@ class Supply(Location):
     def get_other_pieces(self) -> list[Piece]:
         return self.get_other_pieces_for_player(self.player)
 
+    def get_warrior_count(self) -> int:
+        return self.get_warrior_count_for_player(self.player)
+
+    def get_building_count(self) -> int:
+        return self.get_building_count_for_player(self.player)
+
+    def get_token_count(self) -> int:
+        return self.get_token_count_for_player(self.player)
+
+    # TYPE AND SUIT BUCKETS #
+
     def get_pieces_of_type(self, class_name: Type[Piece]) -> list[Piece]:
-        return [x for x in self.get_pieces() if isinstance(x, class_name)]
+        return list(self.pieces_by_type.get(class_name, {}))
+
+    def get_count_of_pieces_of_type(self, class_name: Type[Piece]) -> int:
+        return len(self.pieces_by_type.get(class_name, {}))
+
+    def get_first_piece_of_type(self, class_name: Type[Piece]) -> Optional[Piece]:
+        return next(iter(self.pieces_by_type.get(class_name, {})), None)
+
+    def get_pieces_of_suit(self, suit: Suit) -> list[Piece]:
+        return list(self.pieces_by_suit.get(suit, {}))
+
+    def get_count_of_pieces_of_suit(self, suit: Suit) -> int:
+        return len(self.pieces_by_suit.get(suit, {}))
+
+    def get_first_piece_of_suit(self, suit: Suit) -> Optional[Piece]:
+        return next(iter(self.pieces_by_suit.get(suit, {})), None)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import Any, Callable, Hashable
+
+
+# Memoizes derived board queries (ruled clearings, sorted destinations, ...) for as long as the board is unchanged
+# Every piece added to or removed from a location bumps the board version, which lazily invalidates all cached results
+class QueryCache:
+    board_version: int
+    cached_version: int
+    cached_results: dict[Hashable, Any]
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self.board_version = 0
+        self.cached_version = 0
+        self.cached_results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def bump_board_version(self) -> None:
+        self.board_version += 1
+
+    # Keys should include everything the query depends on other than the board itself, such as the acting player
+    def get(self, key: Hashable, compute_result: Callable[[], Any]) -> Any:
+        if self.cached_version != self.board_version:
+            self.cached_results.clear()
+            self.cached_version = self.board_version
+        if key in self.cached_results:
+            self.hits += 1
+            return self.cached_results[key]
+        self.misses += 1
+        result = compute_result()
+        self.cached_results[key] = result
+        return result
+
+    def clear(self) -> None:
+        self.cached_results.clear()
+
+    def get_hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+    def reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
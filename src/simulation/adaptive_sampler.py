@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+from simulation.result_aggregator import ResultAggregator
+
+if TYPE_CHECKING:
+    from simulation.game_config import GameConfig, GameResult
+
+# The z score for a 95% confidence interval
+Z_95 = 1.96
+
+
+# Decides which games to play next when sampling matchups until their results are precise enough, instead of playing a
+# fixed number of games of each
+# A matchup is finished once every seat's win rate (and, if a target is given, mean VP) confidence interval is narrower
+# than the target half width, or once it hits max_games. Until then, each new chunk of games goes to whichever
+# unfinished matchup has the fewest games scheduled, so the games that finished matchups would have had are spread over
+# the ones that still need them
+# Each matchup is given as a config, whose seed is the first of the consecutive seeds its games are played with
+class AdaptiveSampler:
+    matchup_configs: dict[tuple, GameConfig]
+    aggregator: ResultAggregator
+    target_win_rate_half_width: float
+    target_victory_point_half_width: Optional[float]
+    z: float
+    min_games: int
+    max_games: int
+    chunk_size: int
+    scheduled_game_counts: dict[tuple, int]
+
+    def __init__(self, matchup_configs: list[GameConfig], target_win_rate_half_width: float = 0.02,
+                 target_victory_point_half_width: Optional[float] = None, z: float = Z_95, min_games: int = 100,
+                 max_games: int = 100000, chunk_size: int = 16, aggregator: ResultAggregator = None) -> None:
+        if aggregator is None:
+            aggregator = ResultAggregator()
+
+        self.matchup_configs = {config.get_matchup_key(): config for config in matchup_configs}
+        self.aggregator = aggregator
+        self.target_win_rate_half_width = target_win_rate_half_width
+        self.target_victory_point_half_width = target_victory_point_half_width
+        self.z = z
+        self.min_games = min_games
+        self.max_games = max_games
+        self.chunk_size = chunk_size
+        # Games already in the aggregator (such as from a checkpoint) count as scheduled, and are never replayed
+        self.scheduled_game_counts = {matchup_key: self.get_completed_game_count(matchup_key)
+                                      for matchup_key in self.matchup_configs}
+
+    def get_completed_game_count(self, matchup_key: tuple) -> int:
+        matchup_stats = self.aggregator.matchup_stats.get(matchup_key)
+        return matchup_stats.game_count if matchup_stats else 0
+
+    def is_matchup_finished(self, matchup_key: tuple) -> bool:
+        matchup_stats = self.aggregator.matchup_stats.get(matchup_key)
+        if not matchup_stats or matchup_stats.game_count < self.min_games:
+            return False
+        if matchup_stats.game_count >= self.max_games:
+            return True
+        for seat in range(len(matchup_stats.win_counts)):
+            if matchup_stats.get_win_rate_half_width(seat, self.z) > self.target_win_rate_half_width:
+                return False
+            if (self.target_victory_point_half_width is not None and
+                    matchup_stats.get_victory_point_half_width(seat, self.z) > self.target_victory_point_half_width):
+                return False
+        return True
+
+    def is_finished(self) -> bool:
+        return all(self.is_matchup_finished(matchup_key) for matchup_key in self.matchup_configs)
+
+    # None if every unfinished matchup already has max_games scheduled, in which case only the games still being played
+    # can change anything
+    def get_next_chunk(self) -> Optional[list[GameConfig]]:
+        unfinished_matchup_keys = [matchup_key for matchup_key in self.matchup_configs
+                                   if self.scheduled_game_counts[matchup_key] < self.max_games and
+                                   not self.is_matchup_finished(matchup_key)]
+        if not unfinished_matchup_keys:
+            return None
+        matchup_key = min(unfinished_matchup_keys, key=lambda key: self.scheduled_game_counts[key])
+        config = self.matchup_configs[matchup_key]
+        scheduled_game_count = self.scheduled_game_counts[matchup_key]
+        chunk_game_count = min(self.chunk_size, self.max_games - scheduled_game_count)
+        self.scheduled_game_counts[matchup_key] += chunk_game_count
+        return [config.with_seed(config.seed + game_number) for game_number in
+                range(scheduled_game_count, scheduled_game_count + chunk_game_count)]
+
+    def add_results(self, results: list[GameResult]) -> None:
+        self.aggregator.add_results(results)
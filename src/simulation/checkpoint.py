@@ -0,0 +1,132 @@
+from __future__ import annotations
+from bisect import bisect_right
+import json
+import os
+import tempfile
+from typing import Any, Optional, TYPE_CHECKING
+
+from simulation.result_aggregator import matchup_key_from_dict, matchup_key_to_dict, ResultAggregator
+
+if TYPE_CHECKING:
+    from simulation.game_config import GameConfig
+
+CHECKPOINT_VERSION = 3
+
+
+# The seeds played so far for one matchup, as sorted, non-overlapping [start, end) ranges. Sweeps play consecutive
+# seeds, so this stays a handful of ranges however many games are played
+class SeedRanges:
+    ranges: list[list[int]]
+
+    def __init__(self, ranges: list[list[int]] = None) -> None:
+        if ranges is None:
+            ranges = []
+
+        self.ranges = ranges
+
+    def __contains__(self, seed: int) -> bool:
+        index = bisect_right(self.ranges, [seed, float('inf')]) - 1
+        return index >= 0 and self.ranges[index][0] <= seed < self.ranges[index][1]
+
+    def add(self, seed: int) -> None:
+        self.add_range(seed, seed + 1)
+
+    def add_range(self, start: int, end: int) -> None:
+        index = bisect_right(self.ranges, [start, float('inf')])
+        # Merge with the range before if it touches or overlaps, then absorb every following range this one reaches
+        if index > 0 and self.ranges[index - 1][1] >= start:
+            index -= 1
+            start = self.ranges[index][0]
+            end = max(end, self.ranges[index][1])
+            del self.ranges[index]
+        while index < len(self.ranges) and self.ranges[index][0] <= end:
+            end = max(end, self.ranges[index][1])
+            del self.ranges[index]
+        self.ranges.insert(index, [start, end])
+
+    def merge(self, other: SeedRanges) -> None:
+        for start, end in other.ranges:
+            self.add_range(start, end)
+
+    def overlaps(self, other: SeedRanges) -> bool:
+        for start, end in other.ranges:
+            # Only the last range starting before end can reach into [start, end), since the ranges don't overlap
+            index = bisect_right(self.ranges, [end - 1, float('inf')]) - 1
+            if index >= 0 and self.ranges[index][1] > start:
+                return True
+        return False
+
+    def get_seed_count(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+
+# Everything a sweep needs to pick up where it left off: the totals so far, and which seeds of each matchup they cover
+# Games are seeded by their config, so the completed seeds are also the position of every game's random stream
+class SweepCheckpoint:
+    aggregator: ResultAggregator
+    completed_seeds: dict[tuple, SeedRanges]
+
+    def __init__(self, aggregator: ResultAggregator = None) -> None:
+        if aggregator is None:
+            aggregator = ResultAggregator()
+
+        self.aggregator = aggregator
+        self.completed_seeds = {}
+
+    def is_completed(self, config: GameConfig) -> bool:
+        seed_ranges = self.completed_seeds.get(config.get_matchup_key())
+        return seed_ranges is not None and config.seed in seed_ranges
+
+    def mark_completed(self, configs: list[GameConfig]) -> None:
+        for config in configs:
+            self.completed_seeds.setdefault(config.get_matchup_key(), SeedRanges()).add(config.seed)
+
+    # Checkpoints of separate parts of a sweep (such as different seed ranges run on different machines) can be
+    # combined, as long as they don't overlap. Overlapping checkpoints would count the games they share twice
+    def merge(self, other: SweepCheckpoint) -> None:
+        for matchup_key, seed_ranges in other.completed_seeds.items():
+            if matchup_key in self.completed_seeds and self.completed_seeds[matchup_key].overlaps(seed_ranges):
+                raise ValueError(f'Cannot merge checkpoints that both cover seeds of the matchup {matchup_key}')
+        self.aggregator.merge(other.aggregator)
+        for matchup_key, seed_ranges in other.completed_seeds.items():
+            self.completed_seeds.setdefault(matchup_key, SeedRanges()).merge(seed_ranges)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'version': CHECKPOINT_VERSION,
+            'aggregator': self.aggregator.to_dict(),
+            'completed_seeds': [{'matchup': matchup_key_to_dict(matchup_key), 'ranges': seed_ranges.ranges}
+                                for matchup_key, seed_ranges in self.completed_seeds.items()]
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> SweepCheckpoint:
+        if data['version'] != CHECKPOINT_VERSION:
+            raise ValueError(f'Cannot read checkpoint version {data["version"]}')
+        checkpoint = SweepCheckpoint(ResultAggregator.from_dict(data['aggregator']))
+        for completed_seed_data in data['completed_seeds']:
+            checkpoint.completed_seeds[matchup_key_from_dict(completed_seed_data['matchup'])] = \
+                SeedRanges(completed_seed_data['ranges'])
+        return checkpoint
+
+    # Written to a temporary file in the same directory and then moved over the old checkpoint, so a crash part way
+    # through leaves the previous checkpoint intact
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w') as temporary_file:
+                json.dump(self.to_dict(), temporary_file)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    @staticmethod
+    def load(path: str) -> Optional[SweepCheckpoint]:
+        if not os.path.exists(path):
+            return None
+        with open(path) as checkpoint_file:
+            return SweepCheckpoint.from_dict(json.load(checkpoint_file))
@@ -0,0 +1,305 @@
+from __future__ import annotations
+import struct
+from typing import Optional, TYPE_CHECKING
+
+from bot_resources.bot_constants import BotDifficulty
+from bot_resources.bot_factions.automated_alliance.automated_alliance_player import AutomatedAlliancePlayer
+from bot_resources.bot_factions.electric_eyrie.electric_eyrie_player import ElectricEyriePlayer
+from bot_resources.bot_factions.electric_eyrie.loyal_vizier import LoyalVizier
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from constants import Faction, Item, Suit
+from deck.base_deck import BASE_CARD_INDICES, BASE_CARD_TABLE
+from deck.quest_deck import QuestCard
+from game import Game
+from game_random import GameRandom
+from pieces.item_token import ItemToken
+from pieces.ruin import Ruin
+from simulation.game_config import FACTION_TRAITS
+from simulation.game_runner import FACTION_BOT_CLASSES
+
+if TYPE_CHECKING:
+    from bot_resources.bot import Bot
+    from bot_resources.bot_factions.electric_eyrie.decree import Decree
+    from deck.cards.card import Card
+    from locations.location import Location
+    from pieces.piece import Piece
+
+# A game is written as a flat sequence of small integers: players are referred to by seat, pieces by their index in
+# their owner's piece stock, locations by their index in get_locations, and cards by their index in BASE_CARD_TABLE
+# Everything derived from those (piece registries, presence masks, the deck tracker, the sympathy frontier, ...) is
+# rebuilt by placing the pieces and cards back where they were, in the order they were added
+GAME_CODEC_VERSION = 1
+NO_INDEX = 0xFF
+# Loyal Viziers aren't in the card table, so the decree refers to them by their index counting down from here
+LOYAL_VIZIER_INDEX = 0xFE
+FACTIONS = list(Faction)
+DIFFICULTIES = list(BotDifficulty)
+SUITS = list(Suit)
+ITEMS = list(Item)
+
+
+class ByteWriter:
+    data: bytearray
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def write_byte(self, value: int) -> None:
+        self.data.append(value)
+
+    def write_short(self, value: int) -> None:
+        self.data += struct.pack('<H', value)
+
+    def write_bool(self, value: bool) -> None:
+        self.data.append(int(value))
+
+    def write_bytes(self, value: bytes) -> None:
+        self.write_short(len(value))
+        self.data += value
+
+    def write_byte_list(self, values: list[int]) -> None:
+        self.write_byte(len(values))
+        self.data += bytes(values)
+
+
+class ByteReader:
+    data: bytes
+    position: int
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.position = 0
+
+    def read_byte(self) -> int:
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def read_short(self) -> int:
+        value = struct.unpack_from('<H', self.data, self.position)[0]
+        self.position += 2
+        return value
+
+    def read_bool(self) -> bool:
+        return bool(self.read_byte())
+
+    def read_bytes(self) -> bytes:
+        length = self.read_short()
+        value = self.data[self.position:self.position + length]
+        self.position += length
+        return value
+
+    def read_byte_list(self) -> list[int]:
+        length = self.read_byte()
+        values = list(self.data[self.position:self.position + length])
+        self.position += length
+        return values
+
+
+# Each player's supply (in seat order), then the clearings by priority, then the forests
+def get_locations(game: Game) -> list[Location]:
+    return [*(player.supply for player in game.players), *game.clearings(), *game.board_map.forests]
+
+
+def get_seat(game: Game, player: Optional[Bot]) -> int:
+    return game.players.index(player) if player else NO_INDEX
+
+
+def get_card_index(card: Optional[Card]) -> int:
+    if not card:
+        return NO_INDEX
+    if card not in BASE_CARD_INDICES:
+        raise ValueError(f'Cannot write {card.name}, which is not in the base card table')
+    return BASE_CARD_INDICES[card]
+
+
+def get_card(card_index: int) -> Optional[Card]:
+    return BASE_CARD_TABLE[card_index] if card_index != NO_INDEX else None
+
+
+def get_item_token_code(item_token: ItemToken) -> int:
+    return (ITEMS.index(item_token.item) | item_token.is_starting_item << 4 | item_token.is_ruin_item << 5 |
+            item_token.is_exhausted << 6)
+
+
+def get_item_token(item_token_code: int) -> ItemToken:
+    item_token = ItemToken(ITEMS[item_token_code & 0xF], is_starting_item=bool(item_token_code & 1 << 4),
+                           is_ruin_item=bool(item_token_code & 1 << 5))
+    item_token.is_exhausted = bool(item_token_code & 1 << 6)
+    return item_token
+
+
+def get_decree_card_index(decree: Decree, card: Card) -> int:
+    if isinstance(card, LoyalVizier):
+        return LOYAL_VIZIER_INDEX - decree.viziers.index(card)
+    return get_card_index(card)
+
+
+def get_decree_card(decree: Decree, card_index: int) -> Card:
+    if card_index > LOYAL_VIZIER_INDEX - len(decree.viziers):
+        return decree.viziers[LOYAL_VIZIER_INDEX - card_index]
+    return get_card(card_index)
+
+
+#################
+#               #
+# Writing games #
+#               #
+#################
+
+def game_to_bytes(game: Game) -> bytes:
+    writer = ByteWriter()
+    writer.write_byte(GAME_CODEC_VERSION)
+    writer.write_byte(len(game.players))
+    for player in game.players:
+        write_player_header(writer, player)
+    writer.write_byte(get_seat(game, game.turn_player))
+    writer.write_byte(get_seat(game, game.winner))
+    if game.deck.card_table is not BASE_CARD_TABLE:
+        raise ValueError('Cannot write a deck with cards that are not in the base card table')
+    writer.write_bytes(game.deck.get_snapshot())
+    writer.write_byte_list([SUITS.index(quest_card.suit) for quest_card in game.quest_deck.cards])
+    writer.write_byte_list([get_item_token_code(item_token) for item_token in game.item_supply])
+    for clearing in game.clearings():
+        write_ruin(writer, clearing.ruin)
+    for player in game.players:
+        write_player_state(writer, game, player)
+    write_piece_placements(writer, game)
+    return bytes(writer.data)
+
+
+def write_player_header(writer: ByteWriter, player: Bot) -> None:
+    if player.faction not in FACTION_BOT_CLASSES:
+        raise ValueError(f'Cannot write a game with {player.faction.value}')
+    trait_names = list(FACTION_TRAITS[player.faction])
+    writer.write_byte(FACTIONS.index(player.faction))
+    writer.write_byte(DIFFICULTIES.index(player.difficulty))
+    writer.write_byte_list([trait_names.index(trait.name) for trait in player.traits])
+
+
+def write_ruin(writer: ByteWriter, ruin: Optional[Ruin]) -> None:
+    writer.write_bool(ruin is not None)
+    if ruin:
+        writer.write_byte_list([get_item_token_code(item_token) for item_token in ruin.items])
+
+
+def write_player_state(writer: ByteWriter, game: Game, player: Bot) -> None:
+    writer.write_short(player.victory_points)
+    writer.write_byte_list([get_card_index(card) for card in player.hand])
+    writer.write_byte_list([get_card_index(card) for card in player.revealed_cards])
+    writer.write_byte(get_card_index(player.order_card))
+    writer.write_byte_list([get_item_token_code(item_token) for item_token in player.crafted_items])
+    if isinstance(player, MechanicalMarquiseV2Player):
+        writer.write_bool(player.built_building_this_turn)
+    elif isinstance(player, ElectricEyriePlayer):
+        # Columns are written in the decree's own order, which is the order they're purged in
+        for column in player.decree.columns.values():
+            writer.write_byte_list([get_decree_card_index(player.decree, card) for card in column])
+        writer.write_bool(player.turmoil)
+        writer.write_bool(player.deal_extra_hit)
+    elif isinstance(player, AutomatedAlliancePlayer):
+        writer.write_bool(player.has_revolted)
+        writer.write_byte_list([get_seat(game, other_player) for other_player in
+                                player.players_who_have_removed_sympathy_since_last_turn])
+
+
+# For each location, each player with a piece map there (in the order they were added), then their pieces in the order
+# they were added
+def write_piece_placements(writer: ByteWriter, game: Game) -> None:
+    piece_indices = {player: {piece: index for index, piece in enumerate(player.piece_stock.pieces)}
+                     for player in game.players}
+    for location in get_locations(game):
+        writer.write_byte(len(location.pieces))
+        for player, piece_map in location.pieces.items():
+            writer.write_byte(get_seat(game, player))
+            writer.write_byte_list([piece_indices[player][piece] for piece in piece_map.get_all_pieces()])
+
+
+#################
+#               #
+# Reading games #
+#               #
+#################
+
+# The random streams aren't part of the encoding, so the restored game draws from game_random, which is left where it
+# was (such as a GameRandom made from the game config's streams seed, or the original game's own streams)
+# Without one, the restored game's streams are unseeded
+def game_from_bytes(data: bytes, game_random: GameRandom = None) -> Game:
+    if game_random is None:
+        game_random = GameRandom()
+
+    reader = ByteReader(data)
+    version = reader.read_byte()
+    if version != GAME_CODEC_VERSION:
+        raise ValueError(f'Cannot read game data of version {version}')
+    # Setting up a new game shuffles the decks and ruins, which would otherwise move the streams on
+    random_snapshot = game_random.get_snapshot()
+    game = Game(game_random=game_random)
+    for _ in range(reader.read_byte()):
+        game.add_player(read_player_header(reader, game))
+    game_random.restore_snapshot(random_snapshot)
+
+    game.turn_player = read_player(reader, game)
+    game.winner = read_player(reader, game)
+    game.deck.restore_snapshot(reader.read_bytes())
+    game.quest_deck.cards = [QuestCard(SUITS[suit_index]) for suit_index in reader.read_byte_list()]
+    game.item_supply = [get_item_token(item_token_code) for item_token_code in reader.read_byte_list()]
+    for clearing in game.clearings():
+        clearing.ruin = read_ruin(reader)
+    for player in game.players:
+        read_player_state(reader, game, player)
+    read_piece_placements(reader, game)
+    return game
+
+
+def read_player_header(reader: ByteReader, game: Game) -> Bot:
+    faction = FACTIONS[reader.read_byte()]
+    player = FACTION_BOT_CLASSES[faction](game)
+    faction_traits = list(FACTION_TRAITS[faction].values())
+    player.difficulty = DIFFICULTIES[reader.read_byte()]
+    player.traits = [faction_traits[trait_index] for trait_index in reader.read_byte_list()]
+    return player
+
+
+def read_player(reader: ByteReader, game: Game) -> Optional[Bot]:
+    seat = reader.read_byte()
+    return game.players[seat] if seat != NO_INDEX else None
+
+
+def read_ruin(reader: ByteReader) -> Optional[Ruin]:
+    if not reader.read_bool():
+        return None
+    return Ruin([get_item_token(item_token_code) for item_token_code in reader.read_byte_list()])
+
+
+def read_player_state(reader: ByteReader, game: Game, player: Bot) -> None:
+    player.set_victory_points(reader.read_short())
+    player.hand = [get_card(card_index) for card_index in reader.read_byte_list()]
+    player.revealed_cards = [get_card(card_index) for card_index in reader.read_byte_list()]
+    player.order_card = get_card(reader.read_byte())
+    player.crafted_items = [get_item_token(item_token_code) for item_token_code in reader.read_byte_list()]
+    if isinstance(player, MechanicalMarquiseV2Player):
+        player.built_building_this_turn = reader.read_bool()
+    elif isinstance(player, ElectricEyriePlayer):
+        # A new decree has its columns in the same order as the one that was written
+        player.decree.restore_columns({suit: [get_decree_card(player.decree, card_index) for card_index in
+                                              reader.read_byte_list()] for suit in player.decree.columns})
+        player.turmoil = reader.read_bool()
+        player.deal_extra_hit = reader.read_bool()
+    elif isinstance(player, AutomatedAlliancePlayer):
+        player.has_revolted = reader.read_bool()
+        player.players_who_have_removed_sympathy_since_last_turn = {game.players[seat] for seat in
+                                                                    reader.read_byte_list()}
+
+
+def read_piece_placements(reader: ByteReader, game: Game) -> None:
+    stock_pieces = {player: player.piece_stock.pieces for player in game.players}
+    for location in get_locations(game):
+        for _ in range(reader.read_byte()):
+            player = game.players[reader.read_byte()]
+            pieces: list[Piece] = [stock_pieces[player][piece_index] for piece_index in reader.read_byte_list()]
+            # Creates the piece map even if it's empty, so the players in the location keep their order
+            location.piece_map(player)
+            for piece in pieces:
+                location.add_piece(player, piece)
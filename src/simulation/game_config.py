@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import Hashable, Optional, TYPE_CHECKING
+
+from bot_resources.bot_factions.automated_alliance.automated_alliance_trait import TRAIT_INFORMANTS, \
+    TRAIT_POPULARITY, TRAIT_VETERANS, TRAIT_WILDFIRE
+from bot_resources.bot_factions.electric_eyrie.electric_eyrie_trait import TRAIT_NOBILITY, TRAIT_RELENTLESS, \
+    TRAIT_SWOOP, TRAIT_WAR_TAX
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_trait import TRAIT_BLITZ, \
+    TRAIT_FORTIFIED, TRAIT_HOSPITALS, TRAIT_IRON_WILL
+from constants import Faction
+
+if TYPE_CHECKING:
+    from bot_resources.bot_constants import BotDifficulty
+
+# Traits are compared by identity, so bots must be given these exact objects rather than copies
+FACTION_TRAITS = {
+    Faction.MECHANICAL_MARQUISE_2_0: {trait.name: trait for trait in [TRAIT_BLITZ, TRAIT_FORTIFIED, TRAIT_HOSPITALS,
+                                                                      TRAIT_IRON_WILL]},
+    Faction.ELECTRIC_EYRIE: {trait.name: trait for trait in [TRAIT_NOBILITY, TRAIT_RELENTLESS, TRAIT_SWOOP,
+                                                             TRAIT_WAR_TAX]},
+    Faction.AUTOMATED_ALLIANCE: {trait.name: trait for trait in [TRAIT_INFORMANTS, TRAIT_POPULARITY, TRAIT_VETERANS,
+                                                                 TRAIT_WILDFIRE]}
+}
+
+
+# Everything needed to play one simulated game. Seats are in setup order, and traits are given by name so that configs
+# can be sent to worker processes and still resolve to the shared Trait objects there
+class GameConfig:
+    seed: int
+    factions: tuple[Faction, ...]
+    difficulties: tuple[BotDifficulty, ...]
+    trait_names: tuple[tuple[str, ...], ...]
+    max_rounds: int
+    use_common_random_numbers: bool
+
+    def __init__(self, seed: int, factions: tuple[Faction, ...], difficulties: tuple[BotDifficulty, ...],
+                 trait_names: tuple[tuple[str, ...], ...] = None, max_rounds: int = 100,
+                 use_common_random_numbers: bool = False) -> None:
+        if trait_names is None:
+            trait_names = tuple(() for _ in factions)
+        # Traits are put in the order their faction lists them, so the same trait set always has the same matchup key
+        trait_names = tuple(tuple(sorted(seat_trait_names, key=list(FACTION_TRAITS[faction]).index))
+                            if faction in FACTION_TRAITS else tuple(seat_trait_names)
+                            for faction, seat_trait_names in zip(factions, trait_names))
+
+        self.seed = seed
+        self.factions = factions
+        self.difficulties = difficulties
+        self.trait_names = trait_names
+        self.max_rounds = max_rounds
+        self.use_common_random_numbers = use_common_random_numbers
+
+    # Games with the same matchup key only differ by their seed. The round limit and the random streams are part of it,
+    # since games played under different ones can't be pooled together
+    def get_matchup_key(self) -> tuple:
+        return self.factions, self.difficulties, self.trait_names, self.max_rounds, self.use_common_random_numbers
+
+    def with_seed(self, seed: int, use_common_random_numbers: bool = None) -> GameConfig:
+        if use_common_random_numbers is None:
+            use_common_random_numbers = self.use_common_random_numbers
+
+        return GameConfig(seed, self.factions, self.difficulties, self.trait_names, self.max_rounds,
+                          use_common_random_numbers)
+
+    # With common random numbers, every config with the same seed gets the same deck order, ruins, corner homelands and
+    # battle dice, whatever its matchup. Otherwise each matchup's games draw from their own streams
+    def get_random_streams_seed(self) -> Hashable:
+        if self.use_common_random_numbers:
+            return self.seed
+        return self.seed, self.get_matchup_key()
+
+
+class GameResult:
+    seed: int
+    factions: tuple[Faction, ...]
+    difficulties: tuple[BotDifficulty, ...]
+    trait_names: tuple[tuple[str, ...], ...]
+    max_rounds: int
+    use_common_random_numbers: bool
+    victory_points: tuple[int, ...]
+    winner_seat: Optional[int]  # None if no player won before the round limit
+    turn_count: int
+
+    def __init__(self, config: GameConfig, victory_points: tuple[int, ...], winner_seat: Optional[int],
+                 turn_count: int) -> None:
+        self.seed = config.seed
+        self.factions = config.factions
+        self.difficulties = config.difficulties
+        self.trait_names = config.trait_names
+        self.max_rounds = config.max_rounds
+        self.use_common_random_numbers = config.use_common_random_numbers
+        self.victory_points = victory_points
+        self.winner_seat = winner_seat
+        self.turn_count = turn_count
+
+    def get_matchup_key(self) -> tuple:
+        return self.factions, self.difficulties, self.trait_names, self.max_rounds, self.use_common_random_numbers
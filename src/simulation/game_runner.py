@@ -0,0 +1,61 @@
+from __future__ import annotations
+import random
+from typing import TYPE_CHECKING
+
+from bot_resources.bot_factions.automated_alliance.automated_alliance_player import AutomatedAlliancePlayer
+from bot_resources.bot_factions.electric_eyrie.electric_eyrie_player import ElectricEyriePlayer
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from constants import Faction
+from game import Game
+from game_random import GameRandom
+from simulation.game_config import FACTION_TRAITS, GameResult
+
+if TYPE_CHECKING:
+    from bot_resources.bot import Bot
+    from simulation.game_config import GameConfig
+
+
+# TODO: Vagabot, once its modules can be imported without a circular import
+FACTION_BOT_CLASSES = {
+    Faction.MECHANICAL_MARQUISE_2_0: MechanicalMarquiseV2Player,
+    Faction.ELECTRIC_EYRIE: ElectricEyriePlayer,
+    Faction.AUTOMATED_ALLIANCE: AutomatedAlliancePlayer
+}
+
+
+def create_bots(game: Game, config: GameConfig) -> list[Bot]:
+    bots = []
+    for faction, difficulty, trait_names in zip(config.factions, config.difficulties, config.trait_names):
+        if faction not in FACTION_BOT_CLASSES:
+            raise ValueError(f'No simulated bot for {faction.value}')
+        bot = FACTION_BOT_CLASSES[faction](game)
+        bot.difficulty = difficulty
+        bot.traits = [FACTION_TRAITS[faction][trait_name] for trait_name in trait_names]
+        bots.append(bot)
+    return bots
+
+
+# Plays a full game of bots from the config. Must be a module level function so worker processes can run it
+def run_game(config: GameConfig) -> GameResult:
+    # The global generator only breaks ties in bot decisions, the rules' own chances come from the game's streams
+    random.seed(config.seed)
+    game = Game(game_random=GameRandom(config.get_random_streams_seed()))
+    for bot in create_bots(game, config):
+        game.add_player(bot)
+    for player in game.players:
+        player.setup()
+
+    turn_count = 0
+    for _ in range(config.max_rounds):
+        for player in game.players:
+            player.take_turn()
+            turn_count += 1
+            if game.winner:
+                break
+        if game.winner:
+            break
+
+    victory_points = tuple(player.victory_points for player in game.players)
+    winner_seat = game.players.index(game.winner) if game.winner else None
+    return GameResult(config, victory_points, winner_seat, turn_count)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from simulation.result_aggregator import get_mean_half_width
+
+if TYPE_CHECKING:
+    from simulation.game_config import GameConfig, GameResult
+
+
+# Both configs' games for each seed, using common random numbers so each pair shares its deck order, ruins, corner
+# homelands and battle dice. The two configs should only differ in what's being compared (such as one seat's traits)
+def create_paired_configs(first_config: GameConfig, second_config: GameConfig, pair_count: int,
+                          first_seed: int = 0) -> list[GameConfig]:
+    paired_configs = []
+    for seed in range(first_seed, first_seed + pair_count):
+        for config in [first_config, second_config]:
+            paired_configs.append(config.with_seed(seed, use_common_random_numbers=True))
+    return paired_configs
+
+
+# Compares one seat across two matchups by the difference within each pair of games played with the same seed, rather
+# than by the difference of two independent averages. With common random numbers the pair's luck mostly cancels out, so
+# the interval on the difference is much narrower for the same number of games
+# Results can arrive in any order, and each is held until the other game of its pair comes in
+class PairedComparison:
+    first_matchup_key: tuple
+    second_matchup_key: tuple
+    seat: int
+    unpaired_results: dict[tuple[tuple, int], GameResult]  # By matchup key and seed
+    pair_count: int
+    win_difference_total: int
+    win_difference_square_total: int
+    victory_point_difference_total: int
+    victory_point_difference_square_total: int
+
+    def __init__(self, first_config: GameConfig, second_config: GameConfig, seat: int) -> None:
+        # The pairs are played with common random numbers, however the given configs are set
+        self.first_matchup_key = first_config.with_seed(0, use_common_random_numbers=True).get_matchup_key()
+        self.second_matchup_key = second_config.with_seed(0, use_common_random_numbers=True).get_matchup_key()
+        self.seat = seat
+        self.unpaired_results = {}
+        self.pair_count = 0
+        self.win_difference_total = 0
+        self.win_difference_square_total = 0
+        self.victory_point_difference_total = 0
+        self.victory_point_difference_square_total = 0
+
+    # Results of any other matchup are ignored, so this can be given every result of a sweep
+    def add_result(self, result: GameResult) -> None:
+        matchup_key = result.get_matchup_key()
+        if matchup_key == self.first_matchup_key:
+            other_matchup_key = self.second_matchup_key
+        elif matchup_key == self.second_matchup_key:
+            other_matchup_key = self.first_matchup_key
+        else:
+            return
+        other_result = self.unpaired_results.pop((other_matchup_key, result.seed), None)
+        if not other_result:
+            self.unpaired_results[(matchup_key, result.seed)] = result
+        elif matchup_key == self.first_matchup_key:
+            self.add_pair(result, other_result)
+        else:
+            self.add_pair(other_result, result)
+
+    def add_pair(self, first_result: GameResult, second_result: GameResult) -> None:
+        win_difference = (first_result.winner_seat == self.seat) - (second_result.winner_seat == self.seat)
+        victory_point_difference = (first_result.victory_points[self.seat] -
+                                    second_result.victory_points[self.seat])
+        self.pair_count += 1
+        self.win_difference_total += win_difference
+        self.win_difference_square_total += win_difference * win_difference
+        self.victory_point_difference_total += victory_point_difference
+        self.victory_point_difference_square_total += victory_point_difference * victory_point_difference
+
+    # Positive if the seat does better in the first matchup
+    def get_win_rate_difference(self) -> float:
+        if not self.pair_count:
+            return 0.0
+        return self.win_difference_total / self.pair_count
+
+    def get_win_rate_difference_half_width(self, z: float) -> float:
+        return get_mean_half_width(self.pair_count, self.win_difference_total, self.win_difference_square_total, z)
+
+    def get_victory_point_difference(self) -> float:
+        if not self.pair_count:
+            return 0.0
+        return self.victory_point_difference_total / self.pair_count
+
+    def get_victory_point_difference_half_width(self, z: float) -> float:
+        return get_mean_half_width(self.pair_count, self.victory_point_difference_total,
+                                   self.victory_point_difference_square_total, z)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from simulation.game_config import GameResult
+
+INITIAL_RATING = 1500.0
+
+
+# Bots are rated by their configuration: faction, difficulty and trait names
+def get_bot_key(result: GameResult, seat: int) -> tuple:
+    return result.factions[seat], result.difficulties[seat], result.trait_names[seat]
+
+
+def get_bot_name(bot_key: tuple) -> str:
+    faction, difficulty, trait_names = bot_key
+    return f'{faction.value} ({", ".join([difficulty.name.title(), *trait_names])})'
+
+
+class BotRating:
+    rating: float
+    game_count: int  # Seats played, so a game against itself counts twice
+
+    def __init__(self, rating: float = INITIAL_RATING, game_count: int = 0) -> None:
+        self.rating = rating
+        self.game_count = game_count
+
+
+# The ratings at one point of the stream, and how many games they're based on
+class RatingSnapshot:
+    game_count: int
+    ratings: dict[tuple, BotRating]
+
+    def __init__(self, game_count: int, ratings: dict[tuple, BotRating]) -> None:
+        self.game_count = game_count
+        self.ratings = ratings
+
+    def get_ranked(self) -> list[tuple[tuple, BotRating]]:
+        return sorted(self.ratings.items(), key=lambda item: item[1].rating, reverse=True)
+
+
+# Multiplayer Elo over a stream of game results, one result at a time, so results never need to be kept around
+# A game is scored as a set of head to head matches between every pair of seats: the seat with more VP at the end wins
+# (the game's winner always places first), and equal VP is a draw. Each seat's rating moves by k_factor / (seats - 1)
+# times its total score over its expected score, so a game moves ratings as far as a two player game would. With at
+# most four seats, that's a fixed handful of updates per game
+# Every snapshot_interval games, a copy of the table is passed to handle_snapshot
+class RatingTable:
+    ratings: dict[tuple, BotRating]
+    k_factor: float
+    game_count: int
+    snapshot_interval: Optional[int]
+    handle_snapshot: Optional[Callable[[RatingSnapshot], None]]
+
+    def __init__(self, k_factor: float = 16.0, snapshot_interval: Optional[int] = None,
+                 handle_snapshot: Optional[Callable[[RatingSnapshot], None]] = None) -> None:
+        self.ratings = {}
+        self.k_factor = k_factor
+        self.game_count = 0
+        self.snapshot_interval = snapshot_interval
+        self.handle_snapshot = handle_snapshot
+
+    def get_rating(self, bot_key: tuple) -> BotRating:
+        if bot_key not in self.ratings:
+            self.ratings[bot_key] = BotRating()
+        return self.ratings[bot_key]
+
+    def add_result(self, result: GameResult) -> None:
+        seat_count = len(result.factions)
+        seat_ratings = [self.get_rating(get_bot_key(result, seat)) for seat in range(seat_count)]
+        placement_scores = get_placement_scores(result)
+        # Every expected score is worked out from the ratings before the game, so seat order doesn't matter
+        rating_changes = [0.0] * seat_count
+        for seat in range(seat_count):
+            for other_seat in range(seat + 1, seat_count):
+                expected_score = 1 / (1 + 10 ** ((seat_ratings[other_seat].rating - seat_ratings[seat].rating) / 400))
+                if placement_scores[seat] > placement_scores[other_seat]:
+                    score = 1.0
+                elif placement_scores[seat] < placement_scores[other_seat]:
+                    score = 0.0
+                else:
+                    score = 0.5
+                rating_changes[seat] += score - expected_score
+                rating_changes[other_seat] -= score - expected_score
+        if seat_count > 1:
+            for seat_rating, rating_change in zip(seat_ratings, rating_changes):
+                seat_rating.rating += self.k_factor * rating_change / (seat_count - 1)
+        for seat_rating in seat_ratings:
+            seat_rating.game_count += 1
+
+        self.game_count += 1
+        if self.handle_snapshot and self.snapshot_interval and self.game_count % self.snapshot_interval == 0:
+            self.handle_snapshot(self.get_snapshot())
+
+    # Results can come from anything that yields them, such as a generator that plays games as it goes
+    def add_results(self, results: Iterable[GameResult]) -> None:
+        for result in results:
+            self.add_result(result)
+
+    def get_snapshot(self) -> RatingSnapshot:
+        return RatingSnapshot(self.game_count, {bot_key: BotRating(bot_rating.rating, bot_rating.game_count)
+                                                for bot_key, bot_rating in self.ratings.items()})
+
+
+# Higher is better: the winner ranks above everyone, and the rest rank by VP
+def get_placement_scores(result: GameResult) -> list[tuple[bool, int]]:
+    return [(seat == result.winner_seat, victory_points) for seat, victory_points in enumerate(result.victory_points)]
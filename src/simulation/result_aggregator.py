@@ -0,0 +1,169 @@
+from __future__ import annotations
+from math import sqrt
+from typing import Any, TYPE_CHECKING
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+
+if TYPE_CHECKING:
+    from simulation.game_config import GameResult
+
+
+# Running totals for every game played with one matchup (the same factions, difficulties and traits in each seat, round
+# limit and random streams)
+class MatchupStats:
+    game_count: int
+    win_counts: list[int]  # By seat
+    victory_point_totals: list[int]  # By seat
+    victory_point_square_totals: list[int]  # By seat, for the variance of each seat's VP
+    turn_count_total: int
+    unfinished_game_count: int  # Games that hit the round limit without a winner
+
+    def __init__(self, seat_count: int) -> None:
+        self.game_count = 0
+        self.win_counts = [0] * seat_count
+        self.victory_point_totals = [0] * seat_count
+        self.victory_point_square_totals = [0] * seat_count
+        self.turn_count_total = 0
+        self.unfinished_game_count = 0
+
+    def add_result(self, result: GameResult) -> None:
+        self.game_count += 1
+        if result.winner_seat is None:
+            self.unfinished_game_count += 1
+        else:
+            self.win_counts[result.winner_seat] += 1
+        for seat, victory_points in enumerate(result.victory_points):
+            self.victory_point_totals[seat] += victory_points
+            self.victory_point_square_totals[seat] += victory_points * victory_points
+        self.turn_count_total += result.turn_count
+
+    # Totals from separate runs of the same matchup simply add up
+    def merge(self, other: MatchupStats) -> None:
+        self.game_count += other.game_count
+        self.win_counts = [win_count + other_win_count for win_count, other_win_count in
+                           zip(self.win_counts, other.win_counts)]
+        self.victory_point_totals = [victory_point_total + other_victory_point_total for
+                                     victory_point_total, other_victory_point_total in
+                                     zip(self.victory_point_totals, other.victory_point_totals)]
+        self.victory_point_square_totals = [victory_point_square_total + other_victory_point_square_total for
+                                            victory_point_square_total, other_victory_point_square_total in
+                                            zip(self.victory_point_square_totals,
+                                                other.victory_point_square_totals)]
+        self.turn_count_total += other.turn_count_total
+        self.unfinished_game_count += other.unfinished_game_count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'game_count': self.game_count,
+            'win_counts': self.win_counts,
+            'victory_point_totals': self.victory_point_totals,
+            'victory_point_square_totals': self.victory_point_square_totals,
+            'turn_count_total': self.turn_count_total,
+            'unfinished_game_count': self.unfinished_game_count
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> MatchupStats:
+        matchup_stats = MatchupStats(len(data['win_counts']))
+        matchup_stats.game_count = data['game_count']
+        matchup_stats.win_counts = list(data['win_counts'])
+        matchup_stats.victory_point_totals = list(data['victory_point_totals'])
+        matchup_stats.victory_point_square_totals = list(data['victory_point_square_totals'])
+        matchup_stats.turn_count_total = data['turn_count_total']
+        matchup_stats.unfinished_game_count = data['unfinished_game_count']
+        return matchup_stats
+
+    def get_win_rate(self, seat: int) -> float:
+        if not self.game_count:
+            return 0.0
+        return self.win_counts[seat] / self.game_count
+
+    def get_mean_victory_points(self, seat: int) -> float:
+        if not self.game_count:
+            return 0.0
+        return self.victory_point_totals[seat] / self.game_count
+
+    # Half the width of the Wilson score interval around the seat's win rate, which (unlike the normal approximation)
+    # stays meaningful for lopsided matchups where a seat almost always or almost never wins
+    def get_win_rate_half_width(self, seat: int, z: float) -> float:
+        if not self.game_count:
+            return float('inf')
+        win_rate = self.get_win_rate(seat)
+        return (z * sqrt(win_rate * (1 - win_rate) / self.game_count + z * z / (4 * self.game_count ** 2)) /
+                (1 + z * z / self.game_count))
+
+    def get_victory_point_half_width(self, seat: int, z: float) -> float:
+        return get_mean_half_width(self.game_count, self.victory_point_totals[seat],
+                                   self.victory_point_square_totals[seat], z)
+
+
+# Folds game results into per-matchup totals as they arrive, so results never need to be kept around
+class ResultAggregator:
+    matchup_stats: dict[tuple, MatchupStats]
+
+    def __init__(self) -> None:
+        self.matchup_stats = {}
+
+    def add_result(self, result: GameResult) -> None:
+        matchup_key = result.get_matchup_key()
+        if matchup_key not in self.matchup_stats:
+            self.matchup_stats[matchup_key] = MatchupStats(len(result.factions))
+        self.matchup_stats[matchup_key].add_result(result)
+
+    def add_results(self, results: list[GameResult]) -> None:
+        for result in results:
+            self.add_result(result)
+
+    def get_matchup_stats(self, matchup_key: tuple) -> MatchupStats:
+        return self.matchup_stats[matchup_key]
+
+    def get_game_count(self) -> int:
+        return sum(matchup_stats.game_count for matchup_stats in self.matchup_stats.values())
+
+    def merge(self, other: ResultAggregator) -> None:
+        for matchup_key, other_matchup_stats in other.matchup_stats.items():
+            if matchup_key not in self.matchup_stats:
+                self.matchup_stats[matchup_key] = MatchupStats(len(other_matchup_stats.win_counts))
+            self.matchup_stats[matchup_key].merge(other_matchup_stats)
+
+    # A JSON-friendly copy of the totals, for checkpoints
+    def to_dict(self) -> dict[str, Any]:
+        return {'matchups': [{'matchup': matchup_key_to_dict(matchup_key), 'stats': matchup_stats.to_dict()}
+                             for matchup_key, matchup_stats in self.matchup_stats.items()]}
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> ResultAggregator:
+        aggregator = ResultAggregator()
+        for matchup_data in data['matchups']:
+            aggregator.matchup_stats[matchup_key_from_dict(matchup_data['matchup'])] = \
+                MatchupStats.from_dict(matchup_data['stats'])
+        return aggregator
+
+
+# Half the width of the normal confidence interval around the mean of count samples, from their total and square total
+def get_mean_half_width(count: int, total: int, square_total: int, z: float) -> float:
+    if count < 2:
+        return float('inf')
+    # The totals are exact integers, so the variance doesn't suffer from cancellation until it's turned into a float
+    variance = (count * square_total - total * total) / (count * (count - 1))
+    return z * sqrt(variance / count)
+
+
+def matchup_key_to_dict(matchup_key: tuple) -> dict[str, Any]:
+    factions, difficulties, trait_names, max_rounds, use_common_random_numbers = matchup_key
+    return {
+        'factions': [faction.name for faction in factions],
+        'difficulties': [difficulty.name for difficulty in difficulties],
+        'trait_names': [list(seat_trait_names) for seat_trait_names in trait_names],
+        'max_rounds': max_rounds,
+        'use_common_random_numbers': use_common_random_numbers
+    }
+
+
+def matchup_key_from_dict(data: dict[str, Any]) -> tuple:
+    return (tuple(Faction[faction_name] for faction_name in data['factions']),
+            tuple(BotDifficulty[difficulty_name] for difficulty_name in data['difficulties']),
+            tuple(tuple(seat_trait_names) for seat_trait_names in data['trait_names']),
+            data['max_rounds'],
+            data['use_common_random_numbers'])
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from multiprocessing.shared_memory import SharedMemory
+import struct
+import time
+from typing import Callable, Optional, TYPE_CHECKING
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from simulation.game_config import FACTION_TRAITS, GameConfig, GameResult
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Lock
+
+MAX_SEATS = 4
+NO_SEAT = 0xFF
+FACTIONS = list(Faction)
+DIFFICULTIES = list(BotDifficulty)
+# Seed, then the matchup: per seat faction, difficulty and traits (a bitmask of the faction's traits), the round limit
+# and whether common random numbers were used. Then per seat final VP, the winning seat and the turn count
+# Unused seats have NO_SEAT as their faction
+RESULT_RECORD = struct.Struct(f'<Q{MAX_SEATS}B{MAX_SEATS}B{MAX_SEATS}BHB{MAX_SEATS}HBH')
+MATCHUP_VALUE_COUNT = 3 * MAX_SEATS + 2
+# The number of records ever written, then the number of records ever read
+RESULT_BUFFER_HEADER = struct.Struct('<QQ')
+
+
+def result_to_record_values(result: GameResult) -> tuple[int, ...]:
+    unused_seats = MAX_SEATS - len(result.factions)
+    faction_indices = [FACTIONS.index(faction) for faction in result.factions] + [NO_SEAT] * unused_seats
+    difficulty_indices = [DIFFICULTIES.index(difficulty) for difficulty in result.difficulties] + [0] * unused_seats
+    trait_masks = []
+    for faction, trait_names in zip(result.factions, result.trait_names):
+        faction_trait_names = list(FACTION_TRAITS[faction])
+        trait_masks.append(sum(1 << faction_trait_names.index(trait_name) for trait_name in trait_names))
+    trait_masks += [0] * unused_seats
+    victory_points = list(result.victory_points) + [0] * unused_seats
+    winner_seat = result.winner_seat if result.winner_seat is not None else NO_SEAT
+    return result.seed, *faction_indices, *difficulty_indices, *trait_masks, result.max_rounds, \
+        result.use_common_random_numbers, *victory_points, winner_seat, result.turn_count
+
+
+# Traits come back in the order their faction lists them in FACTION_TRAITS, the order GameConfig keeps them in
+def record_values_to_config(matchup_values: tuple[int, ...]) -> GameConfig:
+    faction_indices = matchup_values[:MAX_SEATS]
+    difficulty_indices = matchup_values[MAX_SEATS:2 * MAX_SEATS]
+    trait_masks = matchup_values[2 * MAX_SEATS:3 * MAX_SEATS]
+    max_rounds, use_common_random_numbers = matchup_values[3 * MAX_SEATS:]
+    seat_count = sum(1 for faction_index in faction_indices if faction_index != NO_SEAT)
+    factions = tuple(FACTIONS[faction_index] for faction_index in faction_indices[:seat_count])
+    trait_names = tuple(tuple(trait_name for trait_index, trait_name in enumerate(FACTION_TRAITS[faction])
+                              if trait_mask & 1 << trait_index)
+                        for faction, trait_mask in zip(factions, trait_masks))
+    return GameConfig(0, factions, tuple(DIFFICULTIES[index] for index in difficulty_indices[:seat_count]),
+                      trait_names, max_rounds, bool(use_common_random_numbers))
+
+
+# Records of the same matchup share a config (without its seed), so each matchup is only decoded once
+def record_values_to_result(values: tuple[int, ...], matchup_configs: dict[tuple[int, ...], GameConfig]) -> GameResult:
+    matchup_values = values[1:1 + MATCHUP_VALUE_COUNT]
+    config = matchup_configs.get(matchup_values)
+    if not config:
+        config = matchup_configs[matchup_values] = record_values_to_config(matchup_values)
+    seat_count = len(config.factions)
+    victory_points = values[1 + MATCHUP_VALUE_COUNT:1 + MATCHUP_VALUE_COUNT + seat_count]
+    winner_seat, turn_count = values[1 + MATCHUP_VALUE_COUNT + MAX_SEATS:]
+    result = GameResult(config, victory_points, winner_seat if winner_seat != NO_SEAT else None, turn_count)
+    result.seed = values[0]
+    return result
+
+
+# A ring buffer of fixed-width game result records in shared memory. Any number of workers write results into it, and
+# the coordinator (the only reader) drains them in bulk, so results never pass through a pipe
+# Writers take the lock to claim the next slot. The reader doesn't need it, since it only moves the read count forward
+class ResultRingBuffer:
+    shared_memory: SharedMemory
+    capacity: int
+    lock: Lock
+    is_owner: bool
+    matchup_configs: dict[tuple[int, ...], GameConfig]
+
+    def __init__(self, capacity: int, lock: Lock, name: Optional[str] = None) -> None:
+        self.capacity = capacity
+        self.lock = lock
+        self.matchup_configs = {}
+        self.is_owner = name is None
+        if self.is_owner:
+            size = RESULT_BUFFER_HEADER.size + capacity * RESULT_RECORD.size
+            self.shared_memory = SharedMemory(create=True, size=size)
+            RESULT_BUFFER_HEADER.pack_into(self.shared_memory.buf, 0, 0, 0)
+        else:
+            self.shared_memory = SharedMemory(name=name)
+
+    @property
+    def name(self) -> str:
+        return self.shared_memory.name
+
+    def get_counts(self) -> tuple[int, int]:
+        return RESULT_BUFFER_HEADER.unpack_from(self.shared_memory.buf, 0)
+
+    def get_record_offset(self, record_number: int) -> int:
+        return RESULT_BUFFER_HEADER.size + (record_number % self.capacity) * RESULT_RECORD.size
+
+    # Waits for the reader to make room if the buffer is full
+    def write_result(self, result: GameResult) -> None:
+        record_values = result_to_record_values(result)
+        with self.lock:
+            written_count, read_count = self.get_counts()
+            while written_count - read_count >= self.capacity:
+                time.sleep(0.001)
+                written_count, read_count = self.get_counts()
+            RESULT_RECORD.pack_into(self.shared_memory.buf, self.get_record_offset(written_count), *record_values)
+            # The record is complete before the reader can see it
+            struct.pack_into('<Q', self.shared_memory.buf, 0, written_count + 1)
+
+    def drain(self, handle_result: Callable[[GameResult], None]) -> int:
+        written_count, read_count = self.get_counts()
+        for record_number in range(read_count, written_count):
+            record_values = RESULT_RECORD.unpack_from(self.shared_memory.buf, self.get_record_offset(record_number))
+            handle_result(record_values_to_result(record_values, self.matchup_configs))
+        struct.pack_into('<Q', self.shared_memory.buf, 8, written_count)
+        return written_count - read_count
+
+    def close(self) -> None:
+        self.shared_memory.close()
+        if self.is_owner:
+            self.shared_memory.unlink()
+
+
+####################################
+#                                  #
+# Worker side of the shared buffer #
+#                                  #
+####################################
+
+# Each worker process attaches to the coordinator's buffer once, when the pool starts it
+WORKER_RESULT_BUFFER: Optional[ResultRingBuffer] = None
+
+
+def attach_worker_to_result_buffer(name: str, capacity: int, lock: Lock) -> None:
+    global WORKER_RESULT_BUFFER
+    WORKER_RESULT_BUFFER = ResultRingBuffer(capacity, lock, name=name)
+
+
+def run_game_into_result_buffer(game_runner: Callable[[GameConfig], GameResult], config: GameConfig) -> None:
+    WORKER_RESULT_BUFFER.write_result(game_runner(config))
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SearchObjective(Enum):
+    STRONGEST = 'Strongest'  # The highest win rate for the target seat
+    BALANCED = 'Balanced'  # Every seat's win rate as close to an even share as possible
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from functools import partial
+import multiprocessing
+from queue import Queue
+import time
+from typing import Callable, Iterable, TYPE_CHECKING
+
+from simulation.checkpoint import SweepCheckpoint
+from simulation.game_runner import run_game
+from simulation.result_aggregator import ResultAggregator
+from simulation.result_buffer import attach_worker_to_result_buffer, ResultRingBuffer, run_game_into_result_buffer
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+    from simulation.adaptive_sampler import AdaptiveSampler
+    from simulation.game_config import GameConfig, GameResult
+
+FORK_SERVER_PRELOAD_MODULES = ['simulation.warm_start']
+
+
+def run_games(game_runner: Callable[[GameConfig], GameResult], configs: list[GameConfig]) -> list[GameResult]:
+    return [game_runner(config) for config in configs]
+
+
+# Plays batches of games, either in this process (a single worker) or on a pool of worker processes
+# In fork server mode, one server process imports and warms everything in FORK_SERVER_PRELOAD_MODULES once, and every
+# worker is forked from it already warm, instead of each worker importing everything itself
+# With shared memory results, workers write each result as a fixed-width record into a shared ring buffer instead of
+# sending it back through the pool's pipes, and the runner drains the buffer into the aggregator in bulk
+class TournamentRunner:
+    game_runner: Callable[[GameConfig], GameResult]
+    worker_count: int
+    use_fork_server: bool
+    use_shared_memory_results: bool
+    chunk_size: int
+    result_buffer_capacity: int
+    context: multiprocessing.context.BaseContext
+
+    def __init__(self, game_runner: Callable[[GameConfig], GameResult] = run_game, worker_count: int = 1,
+                 use_fork_server: bool = False, use_shared_memory_results: bool = False, chunk_size: int = 16,
+                 result_buffer_capacity: int = 4096) -> None:
+        self.game_runner = game_runner
+        self.worker_count = worker_count
+        self.use_fork_server = use_fork_server
+        self.use_shared_memory_results = use_shared_memory_results
+        self.chunk_size = chunk_size
+        self.result_buffer_capacity = result_buffer_capacity
+        self.context = self.create_context()
+
+    # Configured once per runner, so every pool it creates shares one fork server
+    def create_context(self) -> multiprocessing.context.BaseContext:
+        if self.use_fork_server:
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(FORK_SERVER_PRELOAD_MODULES)
+            return context
+        return multiprocessing.get_context()
+
+    def create_pool(self) -> Pool:
+        return self.context.Pool(self.worker_count)
+
+    def run(self, configs: Iterable[GameConfig], aggregator: ResultAggregator = None) -> ResultAggregator:
+        if aggregator is None:
+            aggregator = ResultAggregator()
+
+        if self.worker_count <= 1:
+            for config in configs:
+                aggregator.add_result(self.game_runner(config))
+            return aggregator
+        if self.use_shared_memory_results:
+            return self.run_with_result_buffer(configs, aggregator)
+        with self.create_pool() as pool:
+            for result in pool.imap_unordered(self.game_runner, configs, chunksize=self.chunk_size):
+                aggregator.add_result(result)
+        return aggregator
+
+    def run_with_result_buffer(self, configs: Iterable[GameConfig], aggregator: ResultAggregator) -> ResultAggregator:
+        context = self.context
+        result_buffer = ResultRingBuffer(self.result_buffer_capacity, context.Lock())
+        try:
+            with context.Pool(self.worker_count, initializer=attach_worker_to_result_buffer,
+                              initargs=(result_buffer.name, result_buffer.capacity, result_buffer.lock)) as pool:
+                games_played = pool.map_async(partial(run_game_into_result_buffer, self.game_runner), configs,
+                                              chunksize=self.chunk_size)
+                # Keep draining while the workers play, so they never wait long on a full buffer
+                while not games_played.ready():
+                    if not result_buffer.drain(aggregator.add_result):
+                        time.sleep(0.01)
+                games_played.get()
+            result_buffer.drain(aggregator.add_result)
+        finally:
+            result_buffer.close()
+        return aggregator
+
+    # Plays the configs in batches, saving a checkpoint of everything finished so far whenever at least
+    # checkpoint_interval_seconds have passed since the last save, and once more at the end
+    # When resuming, configs the checkpoint already covers are skipped, and their results are kept from the checkpoint.
+    # Only whole batches are ever checkpointed, so the checkpoint's totals always match the seeds it marks completed
+    def run_sweep(self, configs: Iterable[GameConfig], checkpoint_path: str, resume: bool = False,
+                  checkpoint_interval_seconds: float = 60.0, batch_size: int = 256) -> SweepCheckpoint:
+        checkpoint = SweepCheckpoint.load(checkpoint_path) if resume else None
+        if checkpoint is None:
+            checkpoint = SweepCheckpoint()
+
+        remaining_configs = [config for config in configs if not checkpoint.is_completed(config)]
+        last_save_time = time.monotonic()
+        for batch_start in range(0, len(remaining_configs), batch_size):
+            batch_configs = remaining_configs[batch_start:batch_start + batch_size]
+            checkpoint.aggregator.merge(self.run(batch_configs))
+            checkpoint.mark_completed(batch_configs)
+            if time.monotonic() - last_save_time >= checkpoint_interval_seconds:
+                checkpoint.save(checkpoint_path)
+                last_save_time = time.monotonic()
+        checkpoint.save(checkpoint_path)
+        return checkpoint
+
+    # Plays the chunks the sampler asks for until every matchup is finished
+    # On a pool, each worker has up to two chunks queued at a time, and a new chunk is only chosen once another one
+    # comes back. So as soon as a matchup is precise enough, the workers move on to the matchups that aren't
+    def run_adaptive(self, sampler: AdaptiveSampler) -> ResultAggregator:
+        if self.worker_count <= 1:
+            chunk = sampler.get_next_chunk()
+            while chunk:
+                sampler.add_results(run_games(self.game_runner, chunk))
+                chunk = sampler.get_next_chunk()
+            return sampler.aggregator
+
+        finished_chunks = Queue()
+        running_chunk_count = 0
+        with self.create_pool() as pool:
+            while True:
+                while running_chunk_count < 2 * self.worker_count:
+                    chunk = sampler.get_next_chunk()
+                    if not chunk:
+                        break
+                    pool.apply_async(run_games, (self.game_runner, chunk), callback=finished_chunks.put,
+                                     error_callback=finished_chunks.put)
+                    running_chunk_count += 1
+                if not running_chunk_count:
+                    break
+                results = finished_chunks.get()
+                running_chunk_count -= 1
+                if isinstance(results, BaseException):
+                    raise results
+                sampler.add_results(results)
+        return sampler.aggregator
@@ -0,0 +1,159 @@
+from __future__ import annotations
+from random import Random
+from typing import Optional, TYPE_CHECKING
+
+from bot_resources.bot_constants import BotDifficulty
+from simulation.game_config import FACTION_TRAITS, GameConfig
+from simulation.simulation_constants import SearchObjective
+
+if TYPE_CHECKING:
+    from simulation.result_aggregator import MatchupStats
+    from simulation.tournament_runner import TournamentRunner
+
+DIFFICULTIES = list(BotDifficulty)
+
+
+# An evolutionary search over the traits (and optionally difficulties) of some seats of a fixed faction lineup
+# Each generation, every candidate that hasn't been seen before plays games_per_candidate games, all candidates in one
+# batch on the runner. Every candidate plays the same seeds with common random numbers, so candidates are compared on
+# the same luck. Fitness is cached by matchup, so candidates that survive or reappear never cost any more games
+# Candidates are configs (their seeds are ignored) that only differ from the base config in the evolved seats
+class TraitSearch:
+    runner: TournamentRunner
+    base_config: GameConfig
+    objective: SearchObjective
+    target_seat: int
+    evolved_seats: tuple[int, ...]
+    evolve_difficulties: bool
+    population_size: int
+    elite_count: int
+    games_per_candidate: int
+    mutation_rate: float
+    random: Random
+    fitness_cache: dict[tuple, float]
+    games_played: int
+
+    def __init__(self, runner: TournamentRunner, base_config: GameConfig,
+                 objective: SearchObjective = SearchObjective.STRONGEST, target_seat: int = 0,
+                 evolved_seats: tuple[int, ...] = None, evolve_difficulties: bool = False, population_size: int = 16,
+                 elite_count: int = 2, games_per_candidate: int = 200, mutation_rate: float = 0.2,
+                 seed: Optional[int] = None) -> None:
+        if evolved_seats is None:
+            if objective == SearchObjective.STRONGEST:
+                evolved_seats = (target_seat,)
+            else:
+                evolved_seats = tuple(range(len(base_config.factions)))
+
+        self.runner = runner
+        self.base_config = base_config
+        self.objective = objective
+        self.target_seat = target_seat
+        self.evolved_seats = evolved_seats
+        self.evolve_difficulties = evolve_difficulties
+        self.population_size = population_size
+        self.elite_count = elite_count
+        self.games_per_candidate = games_per_candidate
+        self.mutation_rate = mutation_rate
+        self.random = Random(seed)
+        self.fitness_cache = {}
+        self.games_played = 0
+
+    def run(self, generation_count: int) -> tuple[GameConfig, float]:
+        population = [self.base_config] + [self.create_random_candidate() for _ in range(self.population_size - 1)]
+        for generation in range(generation_count):
+            self.evaluate(population)
+            if generation < generation_count - 1:
+                population = self.breed(population)
+        best_candidate = self.get_ranked(population)[0]
+        return best_candidate, self.get_fitness(best_candidate)
+
+    def get_fitness(self, candidate: GameConfig) -> float:
+        return self.fitness_cache[candidate.get_matchup_key()]
+
+    def get_ranked(self, population: list[GameConfig]) -> list[GameConfig]:
+        return sorted(population, key=self.get_fitness, reverse=True)
+
+    ##############
+    #            #
+    # Evaluation #
+    #            #
+    ##############
+
+    def evaluate(self, population: list[GameConfig]) -> None:
+        unseen_candidates = {}
+        for candidate in population:
+            if candidate.get_matchup_key() not in self.fitness_cache:
+                unseen_candidates[candidate.get_matchup_key()] = candidate
+        if not unseen_candidates:
+            return
+        configs = [candidate.with_seed(seed, use_common_random_numbers=True)
+                   for candidate in unseen_candidates.values() for seed in range(self.games_per_candidate)]
+        aggregator = self.runner.run(configs)
+        self.games_played += len(configs)
+        for matchup_key, candidate in unseen_candidates.items():
+            # Candidates are always played with common random numbers, so their games are under that matchup key
+            played_matchup_key = candidate.with_seed(0, use_common_random_numbers=True).get_matchup_key()
+            self.fitness_cache[matchup_key] = self.get_matchup_fitness(aggregator.get_matchup_stats(played_matchup_key))
+
+    # Higher is better for either objective
+    def get_matchup_fitness(self, matchup_stats: MatchupStats) -> float:
+        if self.objective == SearchObjective.STRONGEST:
+            return matchup_stats.get_win_rate(self.target_seat)
+        seat_count = len(matchup_stats.win_counts)
+        return -sum(abs(matchup_stats.get_win_rate(seat) - 1 / seat_count) for seat in range(seat_count))
+
+    ############
+    #          #
+    # Breeding #
+    #          #
+    ############
+
+    # The best candidates carry over as they are, and the rest of the next generation are mutated children of parents
+    # chosen by tournament selection
+    def breed(self, population: list[GameConfig]) -> list[GameConfig]:
+        next_population = self.get_ranked(population)[:self.elite_count]
+        while len(next_population) < self.population_size:
+            child = self.crossover(self.select_parent(population), self.select_parent(population))
+            next_population.append(self.mutate(child))
+        return next_population
+
+    def select_parent(self, population: list[GameConfig]) -> GameConfig:
+        return max(self.random.sample(population, min(3, len(population))), key=self.get_fitness)
+
+    # Each evolved seat takes each trait, and its difficulty, from either parent at random
+    def crossover(self, first_parent: GameConfig, second_parent: GameConfig) -> GameConfig:
+        difficulties = list(first_parent.difficulties)
+        trait_names = list(first_parent.trait_names)
+        for seat in self.evolved_seats:
+            if self.random.random() < 0.5:
+                difficulties[seat] = second_parent.difficulties[seat]
+            trait_names[seat] = [trait_name for trait_name in FACTION_TRAITS[first_parent.factions[seat]]
+                                 if trait_name in self.random.choice([first_parent, second_parent]).trait_names[seat]]
+        return self.create_candidate(difficulties, trait_names)
+
+    # Each trait of each evolved seat is toggled with the mutation rate, and difficulties move up or down a step
+    def mutate(self, candidate: GameConfig) -> GameConfig:
+        difficulties = list(candidate.difficulties)
+        trait_names = list(candidate.trait_names)
+        for seat in self.evolved_seats:
+            if self.evolve_difficulties and self.random.random() < self.mutation_rate:
+                difficulty_index = DIFFICULTIES.index(difficulties[seat]) + self.random.choice([-1, 1])
+                difficulties[seat] = DIFFICULTIES[min(max(difficulty_index, 0), len(DIFFICULTIES) - 1)]
+            trait_names[seat] = [trait_name for trait_name in FACTION_TRAITS[candidate.factions[seat]]
+                                 if (trait_name in candidate.trait_names[seat]) != (self.random.random() <
+                                                                                    self.mutation_rate)]
+        return self.create_candidate(difficulties, trait_names)
+
+    def create_random_candidate(self) -> GameConfig:
+        difficulties = list(self.base_config.difficulties)
+        trait_names = list(self.base_config.trait_names)
+        for seat in self.evolved_seats:
+            if self.evolve_difficulties:
+                difficulties[seat] = self.random.choice(DIFFICULTIES)
+            trait_names[seat] = [trait_name for trait_name in FACTION_TRAITS[self.base_config.factions[seat]]
+                                 if self.random.random() < 0.5]
+        return self.create_candidate(difficulties, trait_names)
+
+    def create_candidate(self, difficulties: list[BotDifficulty], trait_names: list) -> GameConfig:
+        return GameConfig(0, self.base_config.factions, tuple(difficulties), tuple(trait_names),
+                          self.base_config.max_rounds, self.base_config.use_common_random_numbers)
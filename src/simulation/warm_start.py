@@ -0,0 +1,18 @@
+from __future__ import annotations
+import gc
+
+from game import Game
+# Imports every simulated bot faction
+import simulation.game_runner
+
+# Imported once by the fork server before it forks any workers. Everything a game needs that is built once per process
+# (every bot faction's modules, the base card table, the Autumn board topology) is built by these imports, so workers
+# inherit it instead of paying for it on start-up. Workers still build each game they play from scratch
+
+# Setting up one game (which is then thrown away) also fills the caches that are built on first use, such as the
+# Zobrist feature keys of the deck
+Game()
+
+# Move everything built so far out of the garbage collector's generations. Otherwise the first collection in each
+# worker touches (and so copies) every page of these shared objects
+gc.freeze()
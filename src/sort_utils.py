@@ -1,9 +1,13 @@
 from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
 
 from constants import FACTION_SETUP_ORDER, Suit
 from locations.clearing import Clearing
 from player_resources.player import Player
 
+if TYPE_CHECKING:
+    from board_summary import BoardSummary
+
 
 ##################
 #                #
@@ -58,6 +62,7 @@ def sort_players_by_cardboard_in_clearing(players: list[Player], clearing: Clear
 # By default, all clearing sorting methods go from 'most X' to 'least X'. Pass descending=False to reverse that
 # The exception is sorting by priority, since the majority of cases where we want priority, we want it from 1 to 12
 # If a sort method is binary (such as 'matching_suit' or 'any_free_building_slots'), it goes from 'is X' to 'not X'
+# Methods that count pieces can be passed a BoardSummary, so they read precomputed counts instead of recounting them
 def sort_clearings_by_priority(clearings: list[Clearing], descending: bool = False) -> list[Clearing]:
     return sorted(clearings, key=lambda c: c.priority, reverse=descending)
 
@@ -66,78 +71,121 @@ def sort_clearings_by_matching_suit(clearings: list[Clearing], suit: Suit, desce
     return sorted(clearings, key=lambda c: Suit.are_suits_equal(c.suit, suit), reverse=descending)
 
 
-def sort_clearings_by_enemy_pieces(clearings: list[Clearing], acting_player: Player,
-                                   descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_enemy_pieces(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                   board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_enemy_piece_count(
+            acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: c.get_total_piece_count_for_other_players(acting_player), reverse=descending)
 
 
-def sort_clearings_by_own_pieces(clearings: list[Clearing], acting_player: Player,
-                                 descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_own_pieces(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                 board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_piece_count_for_player(
+            acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: c.get_piece_count_for_player(acting_player), reverse=descending)
 
 
-def sort_clearings_by_enemy_warriors(clearings: list[Clearing], acting_player: Player,
-                                     descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_enemy_warriors(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                     board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_enemy_warrior_count(
+            acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: c.get_total_warrior_count_for_other_players(acting_player),
                   reverse=descending)
 
 
-def sort_clearings_by_own_warriors(clearings: list[Clearing], acting_player: Player,
-                                   descending: bool = True) -> list[Clearing]:
-    return sorted(clearings, key=lambda c: c.get_warrior_count_for_player(acting_player), reverse=descending)
+def sort_clearings_by_own_warriors(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                   board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    return sort_clearings_by_target_warriors(clearings, acting_player, descending, board_summary)
 
 
-def sort_clearings_by_target_warriors(clearings: list[Clearing], target_player: Player,
-                                      descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_target_warriors(clearings: list[Clearing], target_player: Player, descending: bool = True,
+                                      board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_warrior_count_for_player(
+            target_player), reverse=descending)
     return sorted(clearings, key=lambda c: c.get_warrior_count_for_player(target_player), reverse=descending)
 
 
-def sort_clearings_by_enemy_buildings(clearings: list[Clearing], acting_player: Player,
-                                      descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_enemy_buildings(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                      board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_enemy_building_count(
+            acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: c.get_total_building_count_for_other_players(acting_player),
                   reverse=descending)
 
 
-def sort_clearings_by_enemy_tokens(clearings: list[Clearing], acting_player: Player,
-                                   descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_enemy_tokens(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                   board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_enemy_token_count(
+            acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: c.get_total_token_count_for_other_players(acting_player),
                   reverse=descending)
 
 
-def sort_clearings_by_target_cardboard(clearings: list[Clearing], target_player: Player,
-                                       descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_target_cardboard(clearings: list[Clearing], target_player: Player, descending: bool = True,
+                                       board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: (
+            board_summary.get_clearing_summary(c).get_token_count_for_player(target_player) +
+            board_summary.get_clearing_summary(c).get_building_count_for_player(target_player)), reverse=descending)
     return sorted(clearings, key=lambda c: (c.get_token_count_for_player(target_player) +
                                             c.get_building_count_for_player(target_player)),
                   reverse=descending)
 
 
-def sort_clearings_by_any_own_buildings(clearings: list[Clearing], acting_player: Player,
-                                        descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_any_own_buildings(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                        board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).get_building_count_for_player(
+            acting_player) != 0, reverse=descending)
     return sorted(clearings, key=lambda c: c.get_building_count_for_player(acting_player) != 0, reverse=descending)
 
 
-def sort_clearings_by_martial_law(clearings: list[Clearing], acting_player: Player,
-                                  descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_martial_law(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                  board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).is_under_enemy_martial_law(
+            acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: any(count >= 3 and player != acting_player for (player, count) in
                                                c.get_warrior_count_for_all_players().items()),
                   reverse=descending)
 
 
-def sort_clearings_by_free_building_slots(clearings: list[Clearing], descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_free_building_slots(clearings: list[Clearing], descending: bool = True,
+                                          board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).open_building_slot_count,
+                      reverse=descending)
     return sorted(clearings, key=lambda c: c.get_open_building_slot_count(), reverse=descending)
 
 
-def sort_clearings_by_any_free_building_slots(clearings: list[Clearing], descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_any_free_building_slots(clearings: list[Clearing], descending: bool = True,
+                                              board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).open_building_slot_count != 0,
+                      reverse=descending)
     return sorted(clearings, key=lambda c: c.get_open_building_slot_count() != 0, reverse=descending)
 
 
-def sort_clearings_by_ruled_by_self(clearings: list[Clearing], acting_player: Player,
-                                    descending: bool = True) -> list[Clearing]:
+def sort_clearings_by_ruled_by_self(clearings: list[Clearing], acting_player: Player, descending: bool = True,
+                                    board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(c).ruler is acting_player,
+                      reverse=descending)
     return sorted(clearings, key=lambda c: acting_player.does_rule_clearing(c), reverse=descending)
 
 
 def sort_clearings_by_defenseless_enemy_buildings(clearings: list[Clearing], acting_player: Player,
-                                                  descending: bool = True) -> list[Clearing]:
+                                                  descending: bool = True,
+                                                  board_summary: Optional[BoardSummary] = None) -> list[Clearing]:
+    if board_summary:
+        return sorted(clearings, key=lambda c: board_summary.get_clearing_summary(
+            c).get_defenseless_enemy_building_count(acting_player), reverse=descending)
     return sorted(clearings, key=lambda c: get_defenseless_enemy_buildings_in_clearing(c, acting_player),
                   reverse=descending)
 
@@ -145,7 +193,7 @@ def sort_clearings_by_defenseless_enemy_buildings(clearings: list[Clearing], act
 def get_defenseless_enemy_buildings_in_clearing(clearing: Clearing, acting_player: Player) -> int:
     defenseless_buildings = 0
     for player in clearing.get_all_other_players_in_location(acting_player):
-        if player.is_defenseless(clearing):
+        if clearing.game.capabilities.is_defenseless(player, clearing):
             defenseless_buildings += clearing.get_building_count_for_player(player)
     return defenseless_buildings
 
@@ -0,0 +1,46 @@
+from __future__ import annotations
+from hashlib import blake2b
+from typing import Hashable, Iterable
+
+HASH_MASK = (1 << 64) - 1
+
+# Every feature's key, shared by every game in the process. Keys are derived from the feature itself rather than drawn
+# at random, so equal states hash the same in every process (and across runs)
+FEATURE_KEYS: dict[Hashable, int] = {}
+
+
+def get_feature_key(feature: Hashable) -> int:
+    key = FEATURE_KEYS.get(feature)
+    if key is None:
+        # Features are tuples of strings, numbers and enums, whose reprs don't change between processes
+        key = FEATURE_KEYS[feature] = int.from_bytes(blake2b(repr(feature).encode(), digest_size=8).digest(), 'little')
+    return key
+
+
+# A Zobrist-style hash of the game state, kept up to date as the state changes instead of being recomputed
+# The state is a multiset of features, such as ('Piece', location, faction, piece class, piece name) for each piece on
+# the board, and the hash is the sum of their keys modulo 2 ** 64. Keys are summed rather than XORed so that identical
+# features (two of a player's warriors in the same clearing) don't cancel each other out
+# Since only the resulting multiset matters, states reached by different sequences of moves hash the same
+class ZobristHash:
+    value: int
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def add_feature(self, feature: Hashable) -> None:
+        self.value = (self.value + get_feature_key(feature)) & HASH_MASK
+
+    def remove_feature(self, feature: Hashable) -> None:
+        self.value = (self.value - get_feature_key(feature)) & HASH_MASK
+
+    def add_features(self, features: Iterable[Hashable]) -> None:
+        for feature in features:
+            self.add_feature(feature)
+
+    def remove_features(self, features: Iterable[Hashable]) -> None:
+        for feature in features:
+            self.remove_feature(feature)
+
+    def replace_feature(self, old_feature: Hashable, new_feature: Hashable) -> None:
+        self.value = (self.value - get_feature_key(old_feature) + get_feature_key(new_feature)) & HASH_MASK
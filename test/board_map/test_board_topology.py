@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from board_map.autumn_board_map import AUTUMN_BOARD_TOPOLOGY
+from constants import Suit
+from game import Game
+
+
+class TestBoardTopology(TestCase):
+    def test_connections_are_symmetric(self):
+        clearing_topology = AUTUMN_BOARD_TOPOLOGY.get_clearing_topology(5)
+
+        self.assertEqual(clearing_topology.path_connected_priorities, (1, 2))
+        self.assertEqual(clearing_topology.river_connected_priorities, (10,))
+        self.assertEqual(AUTUMN_BOARD_TOPOLOGY.forest_adjacent_forest_indices[6], (3, 4))
+        self.assertEqual(AUTUMN_BOARD_TOPOLOGY.forest_adjacent_clearing_priorities[6], (4, 7, 8, 12))
+
+    def test_clearing_topology(self):
+        clearing_topology = AUTUMN_BOARD_TOPOLOGY.get_clearing_topology(1)
+
+        self.assertEqual(clearing_topology.suit, Suit.FOX)
+        self.assertEqual(clearing_topology.opposite_corner_priority, 3)
+        self.assertTrue(clearing_topology.is_corner_clearing)
+        self.assertFalse(clearing_topology.has_ruin)
+
+    def test_games_share_topology_but_not_clearings(self):
+        board_map1 = Game().board_map
+        board_map2 = Game().board_map
+
+        self.assertIs(board_map1.topology, board_map2.topology)
+        self.assertIs(board_map1.get_clearing(12).topology, board_map2.get_clearing(12).topology)
+        self.assertIsNot(board_map1.get_clearing(12), board_map2.get_clearing(12))
+
+    def test_neighbours_are_the_games_own(self):
+        board_map = Game().board_map
+        clearing = board_map.get_clearing(12)
+
+        self.assertEqual([clearing.priority for clearing in clearing.path_connected_clearings], [4, 7, 9, 10, 11])
+        self.assertTrue(all(path_connected_clearing is board_map.get_clearing(path_connected_clearing.priority)
+                            for path_connected_clearing in clearing.path_connected_clearings))
+        self.assertEqual(clearing.adjacent_forests, tuple(board_map.forests[index] for index in [1, 2, 3, 4, 6]))
+        self.assertIs(board_map.get_clearing(1).opposite_corner_clearing, board_map.get_clearing(3))
+        self.assertEqual(board_map.get_clearing(10).river_connected_clearings,
+                         (board_map.get_clearing(5), board_map.get_clearing(11)))
+        self.assertIn(clearing, board_map.forests[6].adjacent_clearings)
+        self.assertEqual(board_map.forests[6].adjacent_forests, (board_map.forests[3], board_map.forests[4]))
+        # Linked once per game rather than looked up on every call
+        self.assertIs(clearing.path_connected_clearings, clearing.path_connected_clearings)
@@ -0,0 +1,60 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from bot_resources.bot_factions.automated_alliance.automated_alliance_player import AutomatedAlliancePlayer
+from game import Game
+
+
+class TestAutomatedAlliancePlayer(TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.player = AutomatedAlliancePlayer(self.game)
+        self.game.add_player(self.player)
+        self.player.supply.add_pieces(self.player, self.player.piece_stock.pieces)
+        self.clearings = self.game.clearings()
+
+    def place_sympathy(self, clearing):
+        self.player.supply.relocate_pieces(self.player, self.player.get_unplaced_tokens()[:1], clearing)
+
+    def test_sympathy_frontier_is_every_clearing_without_sympathy(self):
+        self.assertEqual(self.player.get_sympathy_frontier(), self.clearings)
+
+    def test_sympathy_frontier_updates_on_placement(self):
+        self.place_sympathy(self.clearings[0])
+        self.place_sympathy(self.clearings[1])
+
+        expected_frontier = {*self.clearings[0].path_connected_clearings, *self.clearings[1].path_connected_clearings}
+        self.assertEqual(self.player.sympathetic_clearings, {self.clearings[0], self.clearings[1]})
+        self.assertEqual(set(self.player.get_sympathy_frontier()), expected_frontier)
+
+    def test_sympathy_frontier_updates_on_removal(self):
+        self.place_sympathy(self.clearings[0])
+        self.place_sympathy(self.clearings[1])
+        self.clearings[0].remove_all_pieces_of_player(self.player)
+
+        self.assertEqual(self.player.sympathetic_clearings, {self.clearings[1]})
+        self.assertEqual(set(self.player.get_sympathy_frontier()), set(self.clearings[1].path_connected_clearings))
+        self.clearings[1].remove_all_pieces_of_player(self.player)
+        self.assertEqual(self.player.sympathy_adjacency_counts, {})
+        self.assertEqual(self.player.get_sympathy_frontier(), self.clearings)
+
+    def test_rebuild_sympathy_frontier(self):
+        for clearing in self.clearings[:4]:
+            self.place_sympathy(clearing)
+        sympathy_adjacency_counts = dict(self.player.sympathy_adjacency_counts)
+        self.player.rebuild_sympathy_frontier()
+
+        self.assertEqual(self.player.sympathy_adjacency_counts, sympathy_adjacency_counts)
+        self.assertEqual(self.player.sympathetic_clearings, set(self.clearings[:4]))
+
+    def test_removing_sympathy_after_gaining_river_paths(self):
+        clearing = self.game.board_map.get_clearing(1)
+        river_clearing = self.game.board_map.get_clearing(7)
+        self.place_sympathy(clearing)
+        with patch.object(self.player, 'treats_rivers_as_paths', return_value=True):
+            self.game.capabilities.update_player(self.player)
+
+        self.assertIn(river_clearing, self.player.get_sympathy_frontier())
+        self.game.capabilities.update_player(self.player)
+        clearing.remove_all_pieces_of_player(self.player)
+        self.assertEqual(self.player.sympathy_adjacency_counts, {})
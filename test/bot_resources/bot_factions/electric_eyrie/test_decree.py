@@ -0,0 +1,40 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from bot_resources.bot_factions.electric_eyrie.decree import Decree
+from bot_resources.bot_factions.electric_eyrie.loyal_vizier import LoyalVizier
+from constants import Suit
+from deck.cards.card import Card
+
+
+class TestDecree(TestCase):
+    def setUp(self):
+        self.mock_player = Mock()
+        self.decree = Decree(self.mock_player)
+
+    def test_add_to_decree_updates_counts(self):
+        self.decree.add_to_decree(Card('Fox card', Suit.FOX))
+        self.assertEqual(self.decree.get_count_of_suited_cards_in_decree(Suit.FOX), 1)
+        self.assertEqual(self.decree.get_count_of_bird_cards_in_decree(), 2)
+        self.assertTrue(self.decree.column_has_most_cards(Suit.BIRD))
+        self.assertFalse(self.decree.column_has_most_cards(Suit.FOX))
+
+        self.decree.add_to_decree(Card('Fox card', Suit.FOX))
+        self.decree.add_to_decree(Card('Fox card', Suit.FOX))
+        self.assertTrue(self.decree.column_has_most_cards(Suit.FOX))
+        self.assertFalse(self.decree.column_has_most_cards(Suit.BIRD))
+
+    def test_purge_discards_everything_but_loyal_viziers(self):
+        fox_card = Card('Fox card', Suit.FOX)
+        bird_card = Card('Bird card', Suit.BIRD)
+        self.decree.add_to_decree(fox_card)
+        self.decree.add_to_decree(bird_card)
+        self.decree.purge()
+
+        self.mock_player.game.discard_cards.assert_called_once_with([fox_card, bird_card])
+        self.assertEqual(self.decree.columns[Suit.FOX], [])
+        self.assertEqual(self.decree.columns[Suit.BIRD], self.decree.viziers)
+        self.assertTrue(all(isinstance(card, LoyalVizier) for card in self.decree.columns[Suit.BIRD]))
+        self.assertEqual(self.decree.get_count_of_suited_cards_in_decree(Suit.FOX), 0)
+        self.assertEqual(self.decree.get_count_of_bird_cards_in_decree(), 2)
+        self.assertTrue(self.decree.column_has_most_cards(Suit.BIRD))
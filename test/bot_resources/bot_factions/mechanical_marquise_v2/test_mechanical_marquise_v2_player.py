@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from constants import Faction, Suit
+from deck.cards.card import Card
+from game import Game
+
+
+class TestMechanicalMarquiseV2Player(TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.player = MechanicalMarquiseV2Player(self.game)
+        self.game.add_player(self.player)
+        self.player.supply.add_pieces(self.player, self.player.piece_stock.pieces)
+        self.player.order_card = Card('Bird card', Suit.BIRD)
+
+    def place_warriors(self, clearing, warrior_count):
+        self.player.supply.relocate_pieces(self.player, self.player.get_unplaced_warriors()[:warrior_count], clearing)
+
+    def test_faction(self):
+        self.assertEqual(self.player.faction, Faction.MECHANICAL_MARQUISE_2_0)
+
+    def test_prepare_origin_movements_sorted_by_priority(self):
+        clearings = self.game.clearings()
+        self.place_warriors(clearings[5], 5)
+        self.place_warriors(clearings[0], 4)
+        self.place_warriors(clearings[2], 2)
+        planned_moves = self.player.prepare_origin_movements()
+
+        self.assertEqual([planned_move.origin for planned_move in planned_moves], [clearings[0], clearings[5]])
+        self.assertEqual([len(planned_move.pieces) for planned_move in planned_moves], [1, 2])
+
+    def test_move_step_leaves_three_warriors_behind(self):
+        origin = self.game.clearings()[0]
+        self.place_warriors(origin, 5)
+        self.player.move_step()
+
+        self.assertEqual(origin.get_warrior_count_for_player(self.player), 3)
+        self.assertEqual(sum(clearing.get_warrior_count_for_player(self.player)
+                             for clearing in self.player.get_adjacent_clearings(origin)), 2)
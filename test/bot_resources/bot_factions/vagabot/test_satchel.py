@@ -0,0 +1,54 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from bot_resources.bot_factions.vagabot.satchel import Satchel
+from constants import Item
+from pieces.item_token import ItemToken
+
+
+class TestSatchel(TestCase):
+    def setUp(self):
+        self.satchel = Satchel(Mock(), Mock())
+        self.items = [ItemToken(Item.BOOT) for _ in range(4)]
+        for item in self.items:
+            self.satchel.add_item(item)
+
+    def test_exhaust_items_if_possible(self):
+        self.assertTrue(self.satchel.exhaust_items_if_possible(item_count=3))
+        self.assertEqual(self.satchel.get_unexhausted_undamaged_item_count(), 1)
+        self.assertEqual(self.satchel.get_exhausted_undamaged_items(-1), self.items[:3])
+        self.assertTrue(all(item.is_exhausted for item in self.items[:3]))
+        self.assertFalse(self.satchel.exhaust_items_if_possible(item_count=2))
+        self.assertEqual(self.satchel.get_unexhausted_undamaged_item_count(), 1)
+
+    def test_refresh_item_prefers_undamaged_items(self):
+        self.satchel.exhaust_items_if_possible(item_count=2)
+        self.satchel.damage_specific_item(self.items[0])
+        self.satchel.refresh_item()
+
+        self.assertFalse(self.items[1].is_exhausted)
+        self.assertEqual(self.satchel.get_exhausted_damaged_items(), [self.items[0]])
+        self.satchel.refresh_item()
+        self.assertEqual(self.satchel.get_unexhausted_damaged_items(), [self.items[0]])
+
+    def test_damage_and_repair_keep_exhaustion(self):
+        self.satchel.exhaust_items_if_possible()
+        self.satchel.damage_specific_item(self.items[0])
+        self.satchel.damage_specific_item(self.items[1])
+
+        self.assertEqual(self.satchel.get_damaged_item_count(), 2)
+        self.assertEqual(self.satchel.damaged_items, [self.items[1], self.items[0]])
+        self.satchel.repair_item()
+        self.assertEqual(self.satchel.get_unexhausted_undamaged_items(-1), [self.items[2], self.items[3], self.items[1]])
+        self.satchel.repair_all_items()
+        self.assertEqual(self.satchel.get_exhausted_undamaged_items(), [self.items[0]])
+        self.assertEqual(self.satchel.get_damaged_item_count(), 0)
+
+    def test_sixth_item_goes_to_battle_track(self):
+        fifth_item, sixth_item = ItemToken(Item.SWORD), ItemToken(Item.SWORD)
+        self.satchel.add_item(fifth_item)
+        self.satchel.add_item(sixth_item)
+
+        self.assertEqual(self.satchel.battle_track, [sixth_item])
+        self.assertEqual(self.satchel.get_undamaged_item_count(), 5)
+        self.assertEqual(self.satchel.get_total_item_count(), 6)
@@ -0,0 +1,64 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from bot_resources.move_planner import MovePlanner
+from constants import Suit
+from locations.clearing import Clearing
+from pieces.token import Token
+from pieces.warrior import Warrior
+
+
+class SnareToken(Token):
+    def prevents_piece_being_moved_out_by_player(self, player, piece):
+        return player is not self.player
+
+
+class TestMovePlanner(TestCase):
+    def setUp(self):
+        mock_game = Mock()
+        self.player = Mock(presence_bit=1, clearing_presence_mask=0)
+        self.clearings = [Clearing(mock_game, Suit.FOX, priority=i, total_building_slots=1) for i in range(1, 5)]
+        self.player.get_ruled_clearings.return_value = self.clearings[:2]
+        self.rank_destinations = Mock(side_effect=lambda origin: [clearing for clearing in self.clearings
+                                                                  if clearing != origin])
+        self.move_planner = MovePlanner(self.player, self.rank_destinations)
+
+    def test_ranked_destinations_computed_once_per_origin(self):
+        self.move_planner.get_ranked_destinations(self.clearings[0])
+        self.move_planner.get_ranked_destinations(self.clearings[0])
+        self.move_planner.plan_move_from_origin(self.clearings[0], [Warrior(self.player)])
+
+        self.assertEqual(self.rank_destinations.call_count, 1)
+        self.assertEqual(self.player.get_ruled_clearings.call_count, 1)
+
+    def test_plan_move_from_origin_respects_rule(self):
+        warriors = [Warrior(self.player)]
+        planned_move = self.move_planner.plan_move_from_origin(self.clearings[2], warriors)
+        self.assertEqual(planned_move.destination, self.clearings[0])
+
+        self.player.get_ruled_clearings.return_value = []
+        move_planner = MovePlanner(self.player, self.rank_destinations)
+        self.assertIsNone(move_planner.plan_move_from_origin(self.clearings[2], warriors))
+        planned_move = move_planner.plan_move_from_origin(self.clearings[2], warriors, requires_rule=False)
+        self.assertEqual(planned_move.destination, self.clearings[0])
+
+    def test_rule_only_looked_up_when_required(self):
+        self.move_planner.plan_move_from_origin(self.clearings[2], [Warrior(self.player)], requires_rule=False)
+
+        self.assertEqual(self.player.get_ruled_clearings.call_count, 0)
+
+    def test_plan_move_returns_blocked_move_as_fallback(self):
+        enemy = Mock(presence_bit=2, clearing_presence_mask=0)
+        self.clearings[0].add_piece(enemy, SnareToken(enemy, 'Snare'))
+        planned_move, blocked_move = self.move_planner.plan_move(self.clearings[:2],
+                                                                 lambda origin: [Warrior(self.player)])
+
+        self.assertEqual(planned_move.origin, self.clearings[1])
+        self.assertEqual(planned_move.destination, self.clearings[0])
+        self.assertEqual(blocked_move.origin, self.clearings[0])
+        self.assertTrue(blocked_move.is_blocked_from_leaving)
+
+        planned_move, blocked_move = self.move_planner.plan_move(self.clearings[:1],
+                                                                 lambda origin: [Warrior(self.player)])
+        self.assertIsNone(planned_move)
+        self.assertEqual(blocked_move.destination, self.clearings[1])
@@ -0,0 +1,64 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from constants import Suit
+from deck.base_deck import BASE_CARD_TABLE, BaseDeck
+from deck.cards.card import Card
+from deck.cards.dominance_card import DominanceCard
+from deck.cards.item_card import ItemCard
+
+
+class TestBaseDeck(TestCase):
+    def test_decks_share_the_card_table(self):
+        deck1 = BaseDeck(Mock())
+        deck2 = BaseDeck(Mock())
+
+        self.assertEqual(len(deck1.drawable_cards), len(BASE_CARD_TABLE))
+        self.assertEqual(set(deck1.cards), set(BASE_CARD_TABLE))
+        self.assertEqual(set(deck2.cards), set(BASE_CARD_TABLE))
+        self.assertEqual(deck1.tracker.get_draw_pile_card_count(), len(BASE_CARD_TABLE))
+        self.assertEqual(deck1.tracker.get_draw_pile_count_of_type(ItemCard),
+                         len([card for card in BASE_CARD_TABLE if isinstance(card, ItemCard)]))
+
+    def test_draw_discard_and_reshuffle(self):
+        deck = BaseDeck(Mock())
+        drawn_cards = deck.draw_cards(len(BASE_CARD_TABLE))
+
+        self.assertEqual(set(drawn_cards), set(BASE_CARD_TABLE))
+        self.assertIsNone(deck.draw_card())
+        deck.add_card_to_discard_pile(drawn_cards[0])
+        self.assertEqual(deck.discard_pile, [drawn_cards[0]])
+        self.assertEqual(deck.tracker.get_next_card_suit_probability(drawn_cards[0].suit), 1.0)
+        self.assertEqual(deck.draw_card(), drawn_cards[0])
+        self.assertEqual(deck.tracker.get_draw_pile_card_count(), 0)
+
+    def test_snapshot_round_trip(self):
+        deck = BaseDeck(Mock())
+        drawn_cards = deck.draw_cards(3)
+        deck.add_card_to_discard_pile(drawn_cards[0])
+        dominance_card = next(card for card in BASE_CARD_TABLE if isinstance(card, DominanceCard))
+        deck.add_card_to_dominance_region(dominance_card)
+        snapshot = deck.get_snapshot()
+        cards, discard_pile = deck.cards, deck.discard_pile
+
+        self.assertIsInstance(snapshot, bytes)
+        deck.draw_cards(10)
+        deck.restore_snapshot(snapshot)
+        self.assertEqual(deck.cards, cards)
+        self.assertEqual(deck.discard_pile, discard_pile)
+        self.assertEqual(deck.dominance_region, [dominance_card])
+        self.assertEqual(deck.tracker.get_draw_pile_card_count(), len(cards))
+        self.assertEqual(sum(deck.tracker.discard_pile.suit_counts[suit] for suit in Suit), 1)
+
+    def test_cards_outside_the_card_table(self):
+        deck = BaseDeck(Mock())
+        other_deck = BaseDeck(Mock())
+        card = Card('Card', Suit.MOUSE)
+        deck.add_card_to_discard_pile(card)
+        deck.add_card_to_discard_pile(card)
+        deck.cards = [card, *deck.cards]
+
+        self.assertEqual(deck.discard_pile, [card, card])
+        self.assertIs(deck.cards[0], card)
+        self.assertEqual(len(deck.card_table), len(BASE_CARD_TABLE) + 1)
+        self.assertIs(other_deck.card_table, BASE_CARD_TABLE)
@@ -0,0 +1,48 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from constants import Item, Suit
+from deck.cards.card import Card
+from deck.cards.item_card import ItemCard
+from deck.deck import Deck
+from deck.deck_tracker import DeckTracker
+
+
+@patch('deck.deck.Deck.__abstractmethods__', set())
+class TestDeckTracker(TestCase):
+    def test_counts_follow_draws_discards_and_reshuffles(self):
+        deck = Deck(Mock())
+        fox_card = Card('Fox Card', Suit.FOX)
+        item_card = ItemCard('Item Card', Suit.MOUSE, Item.SWORD, 1)
+        deck.cards = [fox_card, item_card]
+
+        self.assertEqual(deck.tracker.get_draw_pile_card_count(), 2)
+        self.assertEqual(deck.tracker.get_draw_pile_count_of_type(ItemCard), 1)
+        self.assertEqual(deck.tracker.get_draw_pile_count_of_type(Card), 2)
+        self.assertEqual(deck.draw_card(), item_card)
+        self.assertEqual(deck.tracker.get_draw_pile_count_of_type(ItemCard), 0)
+        self.assertEqual(deck.tracker.get_next_card_suit_probability(Suit.FOX), 1.0)
+
+        deck.add_card_to_discard_pile(item_card)
+        self.assertEqual(deck.tracker.get_discard_pile_count_of_type(ItemCard), 1)
+        deck.draw_card()
+        self.assertEqual(deck.cards, [item_card])
+        self.assertEqual(deck.tracker.get_draw_pile_count_of_type(ItemCard), 1)
+        self.assertEqual(deck.tracker.get_discard_pile_count_of_type(ItemCard), 0)
+
+    def test_next_card_distribution_uses_discard_pile_when_draw_pile_empty(self):
+        deck = Deck(Mock())
+        deck.discard_pile = [Card('Fox Card', Suit.FOX), Card('Bird Card', Suit.BIRD)]
+
+        self.assertEqual(deck.tracker.get_next_card_suit_distribution(),
+                         {Suit.FOX: 0.5, Suit.RABBIT: 0.0, Suit.MOUSE: 0.0, Suit.BIRD: 0.5})
+
+    def test_hypergeometric_lookahead(self):
+        tracker = DeckTracker()
+        tracker.rebuild_draw_pile([Card('Fox Card', Suit.FOX)] * 2 + [Card('Mouse Card', Suit.MOUSE)] * 3)
+
+        self.assertAlmostEqual(tracker.get_probability_of_drawing_suit_exactly(Suit.FOX, 2, 1), 0.6)
+        self.assertAlmostEqual(tracker.get_probability_of_drawing_suit_exactly(Suit.FOX, 2, 2), 0.1)
+        self.assertAlmostEqual(tracker.get_probability_of_drawing_suit_within(Suit.FOX, 2), 0.7)
+        self.assertAlmostEqual(tracker.get_probability_of_drawing_suit_within(Suit.FOX, 10), 1.0)
+        self.assertEqual(tracker.get_probability_of_drawing_suit_within(Suit.RABBIT, 3), 0.0)
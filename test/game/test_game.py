@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch
 
 from board_map.board_map import BoardMap
 from constants import Suit
+from deck.cards.card import Card
+from deck.cards.dominance_card import DominanceCard
 from game import Game
 from locations.clearing import Clearing
 
@@ -35,6 +37,26 @@ class TestGame(TestCase):
 
         self.assertEqual(game.get_clearings_of_suit(Suit.BIRD), [clearing1, clearing2, clearing3])
 
+    def test_discard_cards_to_discard_pile(self):
+        game = Game()
+        game.deck.discard_pile = []
+        dominance_card = DominanceCard(Suit.FOX)
+        card = Card('Card', Suit.MOUSE)
+        game.discard_cards([card, dominance_card])
+
+        self.assertEqual(game.deck.discard_pile, [card])
+        self.assertIn(dominance_card, game.deck.dominance_region)
+
+    def test_discard_cards_to_player_taking_discarded_cards(self):
+        player = Mock()
+        game = Game([player])
+        game.deck.discard_pile = []
+        cards = [Card('Card', Suit.MOUSE), Card('Card', Suit.FOX)]
+        game.discard_cards(cards)
+
+        self.assertEqual(player.handle_discarded_card.call_count, 2)
+        self.assertEqual(game.deck.discard_pile, [])
+
     # TODO: All below
     # discard card
     # send card to discard pile (with and without Cultesque player; with or without Dom card)
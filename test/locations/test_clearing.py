@@ -0,0 +1,83 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from bot_resources.bot_factions.automated_alliance.automated_alliance_player import AutomatedAlliancePlayer
+from bot_resources.bot_factions.automated_alliance.sympathy import Sympathy
+from bot_resources.bot_factions.mechanical_marquise_v2.keep import Keep
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from constants import Faction, Suit
+from game import Game
+from locations.clearing import Clearing
+from pieces.warrior import Warrior
+from player_resources.player import Player
+
+
+@patch('player_resources.player.Player.__abstractmethods__', set())
+class TestClearing(TestCase):
+    def test_can_place_piece_blocked_by_keep(self):
+        mock_game = Mock()
+        player1 = Player(mock_game, Faction.MECHANICAL_MARQUISE_2_0)
+        player2 = Player(mock_game, Faction.ELECTRIC_EYRIE)
+        clearing = Clearing(mock_game, Suit.FOX, priority=1, total_building_slots=1)
+        keep = Keep(player1)
+        clearing.add_piece(player1, keep)
+
+        self.assertEqual(clearing.placement_restricting_pieces, {keep: None})
+        self.assertTrue(clearing.can_place_piece(player1, Warrior(player1)))
+        self.assertFalse(clearing.can_place_piece(player2, Warrior(player2)))
+
+    def test_can_place_piece_after_restricting_piece_removed(self):
+        mock_game = Mock()
+        player1 = AutomatedAlliancePlayer(mock_game)
+        clearing = Clearing(mock_game, Suit.FOX, priority=1, total_building_slots=1)
+        sympathy = Sympathy(player1)
+        clearing.add_piece(player1, sympathy)
+
+        self.assertFalse(clearing.can_place_piece(player1, Sympathy(player1)))
+        clearing.remove_pieces_without_side_effects(player1, [sympathy])
+        self.assertEqual(clearing.placement_restricting_pieces, {})
+        self.assertTrue(clearing.can_place_piece(player1, Sympathy(player1)))
+
+    def test_warriors_are_not_registered_as_restricting(self):
+        mock_game = Mock()
+        player1 = Player(mock_game, Faction.MECHANICAL_MARQUISE_2_0)
+        clearing = Clearing(mock_game, Suit.FOX, priority=1, total_building_slots=1)
+        clearing.add_piece(player1, Warrior(player1))
+
+        self.assertEqual(clearing.placement_restricting_pieces, {})
+        self.assertEqual(clearing.movement_restricting_pieces, {})
+
+    def test_presence_masks_follow_pieces(self):
+        mock_game = Mock()
+        player1 = Player(mock_game, Faction.MECHANICAL_MARQUISE_2_0)
+        player2 = Player(mock_game, Faction.ELECTRIC_EYRIE)
+        clearing = Clearing(mock_game, Suit.FOX, priority=3, total_building_slots=1)
+        warriors = [Warrior(player1), Warrior(player1)]
+        clearing.add_pieces(player1, warriors)
+        clearing.add_piece(player2, Warrior(player2))
+
+        self.assertEqual(clearing.get_all_players_in_location(), [player1, player2])
+        self.assertEqual(clearing.get_all_other_players_in_location(player1), [player2])
+        self.assertEqual(player1.clearing_presence_mask, 0b100)
+        clearing.remove_pieces_without_side_effects(player1, warriors[:1])
+        self.assertTrue(clearing.is_player_in_location(player1))
+        clearing.remove_pieces_without_side_effects(player1, warriors[1:])
+        self.assertFalse(clearing.is_player_in_location(player1))
+        self.assertTrue(clearing.is_any_other_player_in_location(player1))
+        self.assertFalse(clearing.is_any_other_player_in_location(player2))
+        self.assertEqual(player1.clearing_presence_mask, 0)
+
+    def test_adding_piece_where_it_already_is(self):
+        game = Game()
+        marquise = MechanicalMarquiseV2Player(game)
+        game.add_player(marquise)
+        marquise.supply.add_pieces(marquise, marquise.piece_stock.pieces)
+        clearing = game.board_map.get_clearing(1)
+        warrior = marquise.get_unplaced_warriors()[0]
+        clearing.add_piece(marquise, warrior)
+        clearing.add_piece(marquise, warrior)
+
+        self.assertEqual(clearing.get_warrior_count_for_player(marquise), 1)
+        self.assertIs(warrior.location, clearing)
+        self.assertEqual(clearing.player_presence_mask, marquise.presence_bit)
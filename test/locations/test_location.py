@@ -0,0 +1,57 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from constants import Faction
+from locations.location import Location
+from pieces.piece import Piece
+from pieces.warrior import Warrior
+from player_resources.player import Player
+
+
+class OutragePiece(Piece):
+    def __init__(self, player: Player) -> None:
+        super().__init__(player, 'Outrage')
+        self.triggered_by = []
+
+    def resolve_movement_effect(self, moving_player: Player, moving_pieces: list[Piece]) -> None:
+        self.triggered_by.append(moving_player)
+
+
+@patch('player_resources.player.Player.__abstractmethods__', set())
+class TestLocation(TestCase):
+    def test_movement_effects_only_registered_for_overriding_pieces(self):
+        mock_game = Mock()
+        player1 = Player(mock_game, Faction.AUTOMATED_ALLIANCE)
+        location = Location(mock_game)
+        outrage_piece = OutragePiece(player1)
+        location.add_piece(player1, outrage_piece)
+        location.add_piece(player1, Warrior(player1))
+
+        self.assertEqual(location.movement_effect_pieces, {outrage_piece: None})
+        self.assertEqual(location.placement_effect_pieces, {})
+
+    def test_trigger_movement_effects(self):
+        mock_game = Mock()
+        player1 = Player(mock_game, Faction.AUTOMATED_ALLIANCE)
+        player2 = Player(mock_game, Faction.MECHANICAL_MARQUISE_2_0)
+        origin = Location(mock_game)
+        destination = Location(mock_game)
+        outrage_piece = OutragePiece(player1)
+        destination.add_piece(player1, outrage_piece)
+        warrior = Warrior(player2)
+        origin.add_piece(player2, warrior)
+
+        origin.move_pieces(player2, [warrior], destination)
+        self.assertEqual(outrage_piece.triggered_by, [player2])
+
+    def test_removed_piece_no_longer_triggers_movement_effects(self):
+        mock_game = Mock()
+        player1 = Player(mock_game, Faction.AUTOMATED_ALLIANCE)
+        player2 = Player(mock_game, Faction.MECHANICAL_MARQUISE_2_0)
+        location = Location(mock_game)
+        outrage_piece = OutragePiece(player1)
+        location.add_piece(player1, outrage_piece)
+        location.remove_pieces_without_side_effects(player1, [outrage_piece])
+
+        location.add_piece(player2, Warrior(player2), trigger_movement_effects=True)
+        self.assertEqual(outrage_piece.triggered_by, [])
@@ -0,0 +1,45 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pieces.building import Building
+from pieces.piece import Piece
+from pieces.token import Token
+from pieces.warrior import Warrior
+from player_resources.player_piece_map import PlayerPieceMap
+
+
+class TestPlayerPieceMap(TestCase):
+    def test_add_piece_dispatches_by_kind(self):
+        mock_player = Mock()
+        piece_map = PlayerPieceMap(mock_player, Mock())
+        warrior = Warrior(mock_player)
+        building = Building(mock_player, 'Building')
+        token = Token(mock_player, 'Token')
+        other = Piece(mock_player, 'Pawn')
+        for piece in (warrior, building, token, other):
+            piece_map.add_piece(piece)
+
+        self.assertEqual(list(piece_map.warriors), [warrior])
+        self.assertEqual(list(piece_map.buildings), [building])
+        self.assertEqual(list(piece_map.tokens), [token])
+        self.assertEqual(list(piece_map.other), [other])
+        self.assertEqual(piece_map.get_count_of_pieces(), 4)
+        self.assertEqual(piece_map.get_all_pieces(), [warrior, building, token, other])
+
+    def test_remove_piece_keeps_insertion_order(self):
+        mock_player = Mock()
+        piece_map = PlayerPieceMap(mock_player, Mock())
+        warriors = [Warrior(mock_player) for _ in range(5)]
+        for warrior in warriors:
+            piece_map.add_piece(warrior)
+
+        piece_map.remove_piece(warriors[1])
+        self.assertEqual(list(piece_map.warriors), [warriors[0], warriors[2], warriors[3], warriors[4]])
+        piece_map.add_piece(warriors[1])
+        self.assertEqual(list(piece_map.warriors)[3:], [warriors[4], warriors[1]])
+
+    def test_remove_piece_not_in_map(self):
+        mock_player = Mock()
+        piece_map = PlayerPieceMap(mock_player, Mock())
+        piece_map.remove_piece(Warrior(mock_player))
+        self.assertEqual(piece_map.get_count_of_pieces(), 0)
@@ -0,0 +1,45 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from bot_resources.bot_factions.mechanical_marquise_v2.recruiter import Recruiter
+from bot_resources.bot_factions.mechanical_marquise_v2.sawmill import Sawmill
+from bot_resources.bot_factions.mechanical_marquise_v2.workshop import Workshop
+from constants import Suit
+from pieces.building import Building
+from pieces.warrior import Warrior
+from player_resources.supply import Supply
+
+
+class TestSupply(TestCase):
+    def setUp(self):
+        self.mock_player = Mock(presence_bit=1)
+        self.supply = Supply(Mock(), self.mock_player)
+        self.sawmills = [Sawmill(self.mock_player) for _ in range(2)]
+        self.workshop = Workshop(self.mock_player)
+        self.recruiter = Recruiter(self.mock_player)
+        self.warriors = [Warrior(self.mock_player) for _ in range(3)]
+        self.supply.add_pieces(self.mock_player, [*self.sawmills, self.workshop, self.recruiter, *self.warriors])
+
+    def test_counts_by_kind(self):
+        self.assertEqual(self.supply.get_warrior_count(), 3)
+        self.assertEqual(self.supply.get_building_count(), 4)
+        self.assertEqual(self.supply.get_token_count(), 0)
+
+    def test_pieces_bucketed_by_type(self):
+        self.assertEqual(self.supply.get_pieces_of_type(Sawmill), self.sawmills)
+        self.assertEqual(self.supply.get_count_of_pieces_of_type(Building), 4)
+        self.assertEqual(self.supply.get_first_piece_of_type(Workshop), self.workshop)
+
+    def test_pieces_bucketed_by_suit(self):
+        self.assertEqual(self.supply.get_pieces_of_suit(Suit.FOX), self.sawmills)
+        self.assertEqual(self.supply.get_count_of_pieces_of_suit(Suit.RABBIT), 1)
+        self.assertEqual(self.supply.get_first_piece_of_suit(Suit.MOUSE), self.recruiter)
+
+    def test_removing_pieces_updates_buckets(self):
+        self.supply.remove_pieces_without_side_effects(self.mock_player, [self.sawmills[0], self.recruiter])
+
+        self.assertEqual(self.supply.get_pieces_of_type(Sawmill), [self.sawmills[1]])
+        self.assertEqual(self.supply.get_first_piece_of_type(Recruiter), None)
+        self.assertEqual(self.supply.get_first_piece_of_suit(Suit.FOX), self.sawmills[1])
+        self.assertEqual(self.supply.get_count_of_pieces_of_suit(Suit.MOUSE), 0)
+        self.assertEqual(self.supply.get_building_count(), 2)
@@ -0,0 +1,106 @@
+import random
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from simulation.adaptive_sampler import AdaptiveSampler
+from simulation.game_config import GameConfig, GameResult
+from simulation.result_aggregator import MatchupStats
+from simulation.tournament_runner import TournamentRunner
+
+FACTIONS = (Faction.MECHANICAL_MARQUISE_2_0, Faction.ELECTRIC_EYRIE)
+LOPSIDED_DIFFICULTIES = (BotDifficulty.MASTER, BotDifficulty.BEGINNER)
+CLOSE_DIFFICULTIES = (BotDifficulty.EXPERT, BotDifficulty.EXPERT)
+
+
+# Stands in for a full game: the master beats the beginner almost every time, and equal difficulties are a coin flip
+def run_biased_fake_game(config: GameConfig) -> GameResult:
+    game_random = random.Random(config.seed)
+    first_seat_win_chance = 0.97 if config.difficulties == LOPSIDED_DIFFICULTIES else 0.5
+    winner_seat = 0 if game_random.random() < first_seat_win_chance else 1
+    victory_points = tuple(30 if seat == winner_seat else game_random.randint(5, 25) for seat in range(2))
+    return GameResult(config, victory_points, winner_seat, turn_count=10)
+
+
+class TestMatchupStatsIntervals(TestCase):
+    def test_win_rate_half_width(self):
+        matchup_stats = MatchupStats(2)
+        matchup_stats.game_count = 100
+        matchup_stats.win_counts = [50, 50]
+
+        self.assertAlmostEqual(matchup_stats.get_win_rate_half_width(0, 1.96), 0.0962, places=4)
+
+    def test_win_rate_half_width_of_a_seat_that_always_wins(self):
+        matchup_stats = MatchupStats(2)
+        matchup_stats.game_count = 100
+        matchup_stats.win_counts = [100, 0]
+
+        self.assertGreater(matchup_stats.get_win_rate_half_width(0, 1.96), 0)
+        self.assertLess(matchup_stats.get_win_rate_half_width(0, 1.96), 0.02)
+
+    def test_victory_point_half_width(self):
+        matchup_stats = MatchupStats(1)
+        for victory_points in [10, 20, 30, 40]:
+            matchup_stats.add_result(GameResult(GameConfig(0, (Faction.ELECTRIC_EYRIE,), (BotDifficulty.EXPERT,)),
+                                                (victory_points,), 0, turn_count=1))
+
+        # The sample standard deviation is sqrt(500 / 3)
+        self.assertAlmostEqual(matchup_stats.get_victory_point_half_width(0, 2), 2 * (500 / 3) ** 0.5 / 2)
+
+    def test_no_games(self):
+        self.assertEqual(MatchupStats(2).get_win_rate_half_width(0, 1.96), float('inf'))
+        self.assertEqual(MatchupStats(2).get_victory_point_half_width(0, 1.96), float('inf'))
+
+
+class TestAdaptiveSampler(TestCase):
+    def setUp(self):
+        self.lopsided_config = GameConfig(0, FACTIONS, LOPSIDED_DIFFICULTIES)
+        self.close_config = GameConfig(1000000, FACTIONS, CLOSE_DIFFICULTIES)
+
+    def create_sampler(self, **kwargs) -> AdaptiveSampler:
+        return AdaptiveSampler([self.lopsided_config, self.close_config], target_win_rate_half_width=0.05,
+                               min_games=32, chunk_size=8, **kwargs)
+
+    def assert_sampling_finished(self, sampler: AdaptiveSampler):
+        lopsided_stats = sampler.aggregator.get_matchup_stats(self.lopsided_config.get_matchup_key())
+        close_stats = sampler.aggregator.get_matchup_stats(self.close_config.get_matchup_key())
+
+        self.assertTrue(sampler.is_finished())
+        self.assertLessEqual(close_stats.get_win_rate_half_width(0, sampler.z), 0.05)
+        self.assertLess(lopsided_stats.game_count, close_stats.game_count)
+
+    def test_close_matchups_get_more_games(self):
+        sampler = self.create_sampler()
+        TournamentRunner(run_biased_fake_game).run_adaptive(sampler)
+
+        self.assert_sampling_finished(sampler)
+
+    def test_run_adaptive_on_worker_pool(self):
+        sampler = self.create_sampler()
+        TournamentRunner(run_biased_fake_game, worker_count=2).run_adaptive(sampler)
+
+        self.assert_sampling_finished(sampler)
+
+    def test_victory_point_target(self):
+        sampler = self.create_sampler(target_victory_point_half_width=0.5)
+        TournamentRunner(run_biased_fake_game).run_adaptive(sampler)
+        close_stats = sampler.aggregator.get_matchup_stats(self.close_config.get_matchup_key())
+
+        self.assertLessEqual(close_stats.get_victory_point_half_width(1, sampler.z), 0.5)
+
+    def test_max_games(self):
+        sampler = self.create_sampler(max_games=40)
+        TournamentRunner(run_biased_fake_game).run_adaptive(sampler)
+
+        self.assertEqual(sampler.aggregator.get_game_count(), 80)
+        self.assertTrue(sampler.is_finished())
+
+    def test_seeds_are_consecutive_per_matchup(self):
+        sampler = self.create_sampler()
+        first_chunk = sampler.get_next_chunk()
+        second_chunk = sampler.get_next_chunk()
+        third_chunk = sampler.get_next_chunk()
+
+        self.assertEqual([config.seed for config in first_chunk], list(range(8)))
+        self.assertEqual([config.seed for config in second_chunk], list(range(1000000, 1000008)))
+        self.assertEqual([config.seed for config in third_chunk], list(range(8, 16)))
@@ -0,0 +1,131 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from simulation.checkpoint import SeedRanges, SweepCheckpoint
+from simulation.game_config import GameConfig, GameResult
+from simulation.tournament_runner import TournamentRunner
+from test.simulation.test_tournament_runner import DIFFICULTIES, FACTIONS, run_fake_game
+
+
+class CountingGameRunner:
+    played_seeds: list[int]
+
+    def __init__(self) -> None:
+        self.played_seeds = []
+
+    def __call__(self, config: GameConfig) -> GameResult:
+        self.played_seeds.append(config.seed)
+        return run_fake_game(config)
+
+
+class TestSeedRanges(TestCase):
+    def test_adjacent_seeds_merge_into_one_range(self):
+        seed_ranges = SeedRanges()
+        for seed in [3, 1, 2, 7, 0]:
+            seed_ranges.add(seed)
+
+        self.assertEqual(seed_ranges.ranges, [[0, 4], [7, 8]])
+        self.assertIn(3, seed_ranges)
+        self.assertNotIn(4, seed_ranges)
+        self.assertEqual(seed_ranges.get_seed_count(), 5)
+
+    def test_range_bridging_several_ranges(self):
+        seed_ranges = SeedRanges([[0, 2], [4, 5], [8, 10]])
+        seed_ranges.add_range(1, 8)
+
+        self.assertEqual(seed_ranges.ranges, [[0, 10]])
+
+    def test_overlaps(self):
+        seed_ranges = SeedRanges([[0, 5], [10, 15]])
+
+        self.assertTrue(seed_ranges.overlaps(SeedRanges([[4, 6]])))
+        self.assertTrue(seed_ranges.overlaps(SeedRanges([[6, 20]])))
+        self.assertFalse(seed_ranges.overlaps(SeedRanges([[5, 10], [15, 16]])))
+
+
+class TestSweepCheckpoint(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, 'sweep.json')
+        self.configs = [GameConfig(seed, FACTIONS, DIFFICULTIES) for seed in range(40)]
+        self.matchup_key = self.configs[0].get_matchup_key()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        checkpoint = TournamentRunner(run_fake_game).run_sweep(self.configs[:10], self.checkpoint_path)
+        loaded_checkpoint = SweepCheckpoint.load(self.checkpoint_path)
+
+        self.assertEqual(loaded_checkpoint.completed_seeds[self.matchup_key].ranges, [[0, 10]])
+        self.assertEqual(loaded_checkpoint.aggregator.get_matchup_stats(self.matchup_key).to_dict(),
+                         checkpoint.aggregator.get_matchup_stats(self.matchup_key).to_dict())
+        self.assertEqual(os.listdir(self.directory.name), ['sweep.json'])
+
+    def test_load_missing_checkpoint(self):
+        self.assertIsNone(SweepCheckpoint.load(self.checkpoint_path))
+
+    def test_resume_skips_completed_seeds(self):
+        TournamentRunner(run_fake_game).run_sweep(self.configs[:25], self.checkpoint_path)
+        game_runner = CountingGameRunner()
+        checkpoint = TournamentRunner(game_runner).run_sweep(self.configs, self.checkpoint_path, resume=True,
+                                                             batch_size=4)
+        matchup_stats = checkpoint.aggregator.get_matchup_stats(self.matchup_key)
+
+        self.assertEqual(game_runner.played_seeds, list(range(25, 40)))
+        self.assertEqual(matchup_stats.game_count, 40)
+        self.assertEqual(matchup_stats.win_counts, [20, 20])
+
+    def test_without_resume_starts_over(self):
+        TournamentRunner(run_fake_game).run_sweep(self.configs[:25], self.checkpoint_path)
+        game_runner = CountingGameRunner()
+        TournamentRunner(game_runner).run_sweep(self.configs, self.checkpoint_path)
+
+        self.assertEqual(len(game_runner.played_seeds), 40)
+
+    def test_checkpoint_saved_between_batches(self):
+        # The sweep dies after its second batch, but the first two batches were already saved
+        def run_failing_game(config: GameConfig) -> GameResult:
+            if config.seed == 8:
+                raise RuntimeError
+            return run_fake_game(config)
+
+        with self.assertRaises(RuntimeError):
+            TournamentRunner(run_failing_game).run_sweep(self.configs, self.checkpoint_path,
+                                                         checkpoint_interval_seconds=0, batch_size=4)
+        checkpoint = SweepCheckpoint.load(self.checkpoint_path)
+
+        self.assertEqual(checkpoint.completed_seeds[self.matchup_key].ranges, [[0, 8]])
+        self.assertEqual(checkpoint.aggregator.get_game_count(), 8)
+
+    def test_merge_partial_sweeps(self):
+        first_checkpoint = TournamentRunner(run_fake_game).run_sweep(self.configs[:15], self.checkpoint_path)
+        second_checkpoint = TournamentRunner(run_fake_game).run_sweep(self.configs[15:], self.checkpoint_path)
+        first_checkpoint.merge(second_checkpoint)
+        whole_sweep_stats = TournamentRunner(run_fake_game).run(self.configs).get_matchup_stats(self.matchup_key)
+
+        self.assertEqual(first_checkpoint.completed_seeds[self.matchup_key].ranges, [[0, 40]])
+        self.assertEqual(first_checkpoint.aggregator.get_matchup_stats(self.matchup_key).to_dict(),
+                         whole_sweep_stats.to_dict())
+
+    def test_merge_overlapping_sweeps(self):
+        first_checkpoint = TournamentRunner(run_fake_game).run_sweep(self.configs[:15], self.checkpoint_path)
+        second_checkpoint = TournamentRunner(run_fake_game).run_sweep(self.configs[10:], self.checkpoint_path)
+
+        with self.assertRaises(ValueError):
+            first_checkpoint.merge(second_checkpoint)
+        self.assertEqual(first_checkpoint.aggregator.get_game_count(), 15)
+
+    def test_common_random_numbers_sweep_kept_apart(self):
+        TournamentRunner(run_fake_game).run_sweep(self.configs[:10], self.checkpoint_path)
+        common_random_numbers_configs = [config.with_seed(config.seed, use_common_random_numbers=True)
+                                         for config in self.configs[:10]]
+        game_runner = CountingGameRunner()
+        checkpoint = TournamentRunner(game_runner).run_sweep(common_random_numbers_configs, self.checkpoint_path,
+                                                             resume=True)
+
+        self.assertEqual(game_runner.played_seeds, list(range(10)))
+        self.assertEqual(checkpoint.aggregator.get_matchup_stats(self.matchup_key).game_count, 10)
+        self.assertEqual(checkpoint.aggregator.get_matchup_stats(
+            common_random_numbers_configs[0].get_matchup_key()).game_count, 10)
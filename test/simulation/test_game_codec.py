@@ -0,0 +1,92 @@
+import random
+from unittest import TestCase
+
+from bot_resources.bot_factions.automated_alliance.automated_alliance_player import AutomatedAlliancePlayer
+from bot_resources.bot_factions.electric_eyrie.electric_eyrie_player import ElectricEyriePlayer
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_trait import TRAIT_HOSPITALS
+from constants import Suit
+from game import Game
+from game_random import GameRandom
+from simulation.game_codec import game_from_bytes, game_to_bytes
+
+
+class TestGameCodec(TestCase):
+    def setUp(self):
+        self.game = Game(game_random=GameRandom(3))
+        self.marquise = MechanicalMarquiseV2Player(self.game)
+        self.eyrie = ElectricEyriePlayer(self.game)
+        self.alliance = AutomatedAlliancePlayer(self.game)
+        for player in [self.marquise, self.eyrie, self.alliance]:
+            self.game.add_player(player)
+            player.supply.add_pieces(player, player.piece_stock.pieces)
+        self.marquise.traits = [TRAIT_HOSPITALS]
+        self.marquise.add_victory_points(7)
+        self.marquise.order_card = self.game.draw_card()
+        for clearing in self.game.clearings()[:5]:
+            self.marquise.supply.relocate_pieces(self.marquise, self.marquise.get_unplaced_warriors()[:3], clearing)
+            self.eyrie.supply.relocate_pieces(self.eyrie, self.eyrie.get_unplaced_warriors()[:1], clearing)
+        self.alliance.supply.relocate_pieces(self.alliance, self.alliance.get_unplaced_tokens()[:2],
+                                             self.game.board_map.get_clearing(2))
+        self.eyrie.decree.add_to_decree(self.game.draw_card())
+        self.alliance.players_who_have_removed_sympathy_since_last_turn.add(self.marquise)
+        self.game.discard_card(self.game.draw_card())
+
+    def test_round_trip(self):
+        data = game_to_bytes(self.game)
+        restored_game = game_from_bytes(data)
+
+        self.assertEqual(game_to_bytes(restored_game), data)
+        self.assertLess(len(data), 2048)
+
+    def test_restored_game_state(self):
+        restored_game = game_from_bytes(game_to_bytes(self.game))
+        marquise, eyrie, alliance = restored_game.players
+        clearing = restored_game.board_map.get_clearing(1)
+
+        self.assertEqual(marquise.victory_points, 7)
+        self.assertEqual(marquise.traits, [TRAIT_HOSPITALS])
+        self.assertEqual(marquise.order_card, self.marquise.order_card)
+        self.assertEqual(clearing.get_warrior_count_for_player(marquise), 3)
+        self.assertEqual(clearing.get_all_players_in_location(), [marquise, eyrie])
+        self.assertEqual(marquise.supply.get_warrior_count(), self.marquise.supply.get_warrior_count())
+        self.assertEqual(eyrie.decree.get_count_of_bird_cards_in_decree(),
+                         self.eyrie.decree.get_count_of_bird_cards_in_decree())
+        self.assertEqual(alliance.sympathetic_clearings, {restored_game.board_map.get_clearing(2)})
+        self.assertEqual(alliance.players_who_have_removed_sympathy_since_last_turn, {marquise})
+        self.assertEqual(restored_game.deck.cards, self.game.deck.cards)
+        self.assertEqual(restored_game.deck.discard_pile, self.game.deck.discard_pile)
+        self.assertEqual(restored_game.deck.tracker.get_next_card_suit_probability(Suit.FOX),
+                         self.game.deck.tracker.get_next_card_suit_probability(Suit.FOX))
+
+    def test_reading_does_not_disturb_random_state(self):
+        data = game_to_bytes(self.game)
+        random_state = random.getstate()
+        game_from_bytes(data)
+
+        self.assertEqual(random.getstate(), random_state)
+
+    def test_restored_game_continues_streams(self):
+        game_random = GameRandom(3)
+        game_random.restore_snapshot(self.game.random.get_snapshot())
+        restored_game = game_from_bytes(game_to_bytes(self.game), game_random)
+
+        self.assertIs(restored_game.random, game_random)
+        self.assertEqual(restored_game.random.streams_seed, 3)
+        self.assertEqual([restored_game.random.roll_battle_dice() for _ in range(10)],
+                         [self.game.random.roll_battle_dice() for _ in range(10)])
+        self.assertEqual(restored_game.random.deck_shuffle.random(), self.game.random.deck_shuffle.random())
+
+    def test_restored_decree_keeps_column_order(self):
+        for _ in range(6):
+            self.eyrie.decree.add_to_decree(self.game.draw_card())
+        restored_game = game_from_bytes(game_to_bytes(self.game))
+        eyrie = restored_game.players[1]
+
+        self.assertEqual(list(eyrie.decree.columns), list(self.eyrie.decree.columns))
+        self.assertEqual([[card.name for card in column] for column in eyrie.decree.columns.values()],
+                         [[card.name for card in column] for column in self.eyrie.decree.columns.values()])
+        eyrie.decree.purge()
+        self.eyrie.decree.purge()
+        self.assertEqual(restored_game.deck.discard_pile, self.game.deck.discard_pile)
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from game import Game
+from game_random import GameRandom
+from simulation.game_config import GameConfig
+from simulation.game_runner import create_bots, run_game
+
+FACTIONS = (Faction.MECHANICAL_MARQUISE_2_0, Faction.ELECTRIC_EYRIE, Faction.AUTOMATED_ALLIANCE)
+DIFFICULTIES = (BotDifficulty.BEGINNER, BotDifficulty.EXPERT, BotDifficulty.MASTER)
+
+
+class TestGameRunner(TestCase):
+    def test_bots_set_up_in_different_corners(self):
+        for seed in range(10):
+            game = Game(game_random=GameRandom(seed))
+            marquise, eyrie = create_bots(game, GameConfig(seed, FACTIONS[:2], DIFFICULTIES[:2]))
+            for bot in [marquise, eyrie]:
+                game.add_player(bot)
+                bot.setup()
+
+            keep_clearing = marquise.piece_stock.get_keep().location
+            roost_clearing = eyrie.piece_stock.get_roosts()[0].location
+            self.assertTrue(keep_clearing.is_corner_clearing)
+            self.assertTrue(roost_clearing.is_corner_clearing)
+            self.assertNotEqual(keep_clearing, roost_clearing)
+
+    def test_run_game(self):
+        config = GameConfig(3, FACTIONS, DIFFICULTIES, trait_names=(('Fortified',), ('Swoop',), ()))
+        result = run_game(config)
+
+        self.assertEqual(result.get_matchup_key(), config.get_matchup_key())
+        self.assertEqual(len(result.victory_points), 3)
+        self.assertGreater(result.turn_count, 0)
+        self.assertIn(result.winner_seat, [None, 0, 1, 2])
+
+    def test_run_game_is_reproducible(self):
+        config = GameConfig(7, FACTIONS, DIFFICULTIES)
+        first_result = run_game(config)
+        second_result = run_game(config)
+
+        self.assertEqual(first_result.victory_points, second_result.victory_points)
+        self.assertEqual(first_result.winner_seat, second_result.winner_seat)
+        self.assertEqual(first_result.turn_count, second_result.turn_count)
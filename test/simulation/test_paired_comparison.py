@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from game_random import GameRandom
+from simulation.game_config import GameConfig, GameResult
+from simulation.paired_comparison import create_paired_configs, PairedComparison
+
+FACTIONS = (Faction.MECHANICAL_MARQUISE_2_0, Faction.ELECTRIC_EYRIE)
+DIFFICULTIES = (BotDifficulty.EXPERT, BotDifficulty.EXPERT)
+
+
+# Stands in for a full game: the outcome is mostly the game's luck, plus a small edge for Fortified
+def run_lucky_fake_game(config: GameConfig) -> GameResult:
+    game_random = GameRandom(config.get_random_streams_seed())
+    luck = sum(game_random.roll_battle_dice()) + game_random.deck_shuffle.randint(0, 20)
+    marquise_victory_points = min(30, luck + (2 if 'Fortified' in config.trait_names[0] else 0))
+    winner_seat = 0 if marquise_victory_points >= 20 else 1
+    return GameResult(config, (marquise_victory_points, 30 - marquise_victory_points), winner_seat, turn_count=10)
+
+
+class TestPairedComparison(TestCase):
+    def setUp(self):
+        self.fortified_config = GameConfig(0, FACTIONS, DIFFICULTIES, trait_names=(('Fortified',), ()))
+        self.hospitals_config = GameConfig(0, FACTIONS, DIFFICULTIES, trait_names=(('Hospitals',), ()))
+
+    def compare(self, configs: list[GameConfig]) -> PairedComparison:
+        comparison = PairedComparison(self.fortified_config, self.hospitals_config, seat=0)
+        # In reverse, so the second game of each pair comes first
+        for config in reversed(configs):
+            comparison.add_result(run_lucky_fake_game(config))
+        return comparison
+
+    def test_create_paired_configs(self):
+        configs = create_paired_configs(self.fortified_config, self.hospitals_config, pair_count=3, first_seed=10)
+
+        self.assertEqual([config.seed for config in configs], [10, 10, 11, 11, 12, 12])
+        self.assertEqual(configs[0].get_random_streams_seed(), configs[1].get_random_streams_seed())
+        self.assertNotEqual(configs[0].get_matchup_key(), configs[1].get_matchup_key())
+
+    def test_independent_streams_by_default(self):
+        self.assertNotEqual(self.fortified_config.get_random_streams_seed(),
+                            self.hospitals_config.get_random_streams_seed())
+
+    def test_common_random_numbers_isolate_the_trait(self):
+        comparison = self.compare(create_paired_configs(self.fortified_config, self.hospitals_config, 200))
+
+        self.assertEqual(comparison.pair_count, 200)
+        self.assertEqual(comparison.unpaired_results, {})
+        # Each pair had exactly the same luck, so only Fortified's edge is left
+        self.assertEqual(comparison.get_victory_point_difference(), 2)
+        self.assertEqual(comparison.get_victory_point_difference_half_width(1.96), 0)
+
+    def test_independent_streams_are_noisier(self):
+        independent_configs = [config.with_seed(config.seed) for config in
+                               create_paired_configs(self.fortified_config, self.hospitals_config, 200)]
+        for config in independent_configs:
+            config.use_common_random_numbers = False
+        independent_comparison = self.compare(independent_configs)
+        paired_comparison = self.compare(create_paired_configs(self.fortified_config, self.hospitals_config, 200))
+
+        self.assertGreater(independent_comparison.get_victory_point_difference_half_width(1.96),
+                           5 * paired_comparison.get_victory_point_difference_half_width(1.96))
@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from simulation.game_config import GameConfig, GameResult
+from simulation.rating import get_bot_name, INITIAL_RATING, RatingTable
+
+FACTIONS = (Faction.MECHANICAL_MARQUISE_2_0, Faction.ELECTRIC_EYRIE, Faction.AUTOMATED_ALLIANCE)
+DIFFICULTIES = (BotDifficulty.EXPERT, BotDifficulty.EXPERT, BotDifficulty.EXPERT)
+CONFIG = GameConfig(0, FACTIONS, DIFFICULTIES, trait_names=(('Fortified',), (), ()))
+
+
+def create_result(victory_points: tuple[int, ...], winner_seat: int = None) -> GameResult:
+    return GameResult(CONFIG, victory_points, winner_seat, turn_count=10)
+
+
+class TestRatingTable(TestCase):
+    def setUp(self):
+        self.rating_table = RatingTable(k_factor=16)
+        self.marquise_key = (Faction.MECHANICAL_MARQUISE_2_0, BotDifficulty.EXPERT, ('Fortified',))
+        self.eyrie_key = (Faction.ELECTRIC_EYRIE, BotDifficulty.EXPERT, ())
+        self.alliance_key = (Faction.AUTOMATED_ALLIANCE, BotDifficulty.EXPERT, ())
+
+    def test_placement_by_victory_points(self):
+        self.rating_table.add_result(create_result((30, 20, 10), winner_seat=0))
+
+        # Between equal ratings, the first place wins both its head to heads and the last place loses both
+        self.assertAlmostEqual(self.rating_table.get_rating(self.marquise_key).rating, INITIAL_RATING + 8)
+        self.assertAlmostEqual(self.rating_table.get_rating(self.eyrie_key).rating, INITIAL_RATING)
+        self.assertAlmostEqual(self.rating_table.get_rating(self.alliance_key).rating, INITIAL_RATING - 8)
+
+    def test_winner_places_first_regardless_of_victory_points(self):
+        # Such as after a dominance victory
+        self.rating_table.add_result(create_result((10, 25, 5), winner_seat=2))
+
+        self.assertGreater(self.rating_table.get_rating(self.alliance_key).rating, INITIAL_RATING)
+        self.assertLess(self.rating_table.get_rating(self.marquise_key).rating, INITIAL_RATING)
+
+    def test_equal_victory_points_draw(self):
+        self.rating_table.add_result(create_result((20, 20, 20)))
+
+        for bot_key in [self.marquise_key, self.eyrie_key, self.alliance_key]:
+            self.assertAlmostEqual(self.rating_table.get_rating(bot_key).rating, INITIAL_RATING)
+
+    def test_ratings_are_zero_sum(self):
+        self.rating_table.add_results(create_result((seed % 30, 15, 30 - seed % 30)) for seed in range(50))
+        total_rating = sum(bot_rating.rating for bot_rating in self.rating_table.ratings.values())
+
+        self.assertAlmostEqual(total_rating, 3 * INITIAL_RATING)
+
+    def test_stronger_bot_rated_higher(self):
+        self.rating_table.add_results(create_result((30, 20, 10), winner_seat=0) for _ in range(200))
+        ranked_bot_keys = [bot_key for bot_key, _ in self.rating_table.get_snapshot().get_ranked()]
+
+        self.assertEqual(ranked_bot_keys, [self.marquise_key, self.eyrie_key, self.alliance_key])
+        self.assertEqual(self.rating_table.get_rating(self.marquise_key).game_count, 200)
+
+    def test_snapshots(self):
+        snapshots = []
+        rating_table = RatingTable(snapshot_interval=10, handle_snapshot=snapshots.append)
+        rating_table.add_results(create_result((30, 20, 10), winner_seat=0) for _ in range(35))
+
+        self.assertEqual([snapshot.game_count for snapshot in snapshots], [10, 20, 30])
+        # Snapshots are copies, so later games don't change them
+        self.assertLess(snapshots[0].ratings[self.marquise_key].rating, snapshots[1].ratings[self.marquise_key].rating)
+
+    def test_bot_name(self):
+        self.assertEqual(get_bot_name(self.marquise_key), 'Mechanical Marquise 2.0 (Expert, Fortified)')
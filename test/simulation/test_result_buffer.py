@@ -0,0 +1,50 @@
+from multiprocessing import Lock
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from simulation.game_config import GameConfig, GameResult
+from simulation.result_buffer import ResultRingBuffer
+
+
+class TestResultRingBuffer(TestCase):
+    def setUp(self):
+        self.result_buffer = ResultRingBuffer(capacity=2, lock=Lock())
+        self.config = GameConfig(2 ** 40, (Faction.MECHANICAL_MARQUISE_2_0, Faction.AUTOMATED_ALLIANCE),
+                                 (BotDifficulty.MASTER, BotDifficulty.BEGINNER),
+                                 trait_names=(('Fortified', 'Iron Will'), ('Veterans',)), max_rounds=80,
+                                 use_common_random_numbers=True)
+
+    def tearDown(self):
+        self.result_buffer.close()
+
+    def test_result_round_trips_through_buffer(self):
+        self.result_buffer.write_result(GameResult(self.config, (30, 12), winner_seat=0, turn_count=57))
+        drained_results = []
+
+        self.assertEqual(self.result_buffer.drain(drained_results.append), 1)
+        result = drained_results[0]
+        self.assertEqual(result.get_matchup_key(), self.config.get_matchup_key())
+        self.assertEqual(result.seed, 2 ** 40)
+        self.assertEqual(result.victory_points, (30, 12))
+        self.assertEqual(result.winner_seat, 0)
+        self.assertEqual(result.turn_count, 57)
+
+    def test_trait_order_round_trips_through_buffer(self):
+        config = GameConfig(0, (Faction.MECHANICAL_MARQUISE_2_0,), (BotDifficulty.MASTER,),
+                            trait_names=(('Iron Will', 'Fortified'),))
+        self.result_buffer.write_result(GameResult(config, (30,), winner_seat=0, turn_count=57))
+        drained_results = []
+        self.result_buffer.drain(drained_results.append)
+
+        self.assertEqual(drained_results[0].get_matchup_key(), config.get_matchup_key())
+        self.assertEqual(config.trait_names, (('Fortified', 'Iron Will'),))
+
+    def test_buffer_wraps_around(self):
+        drained_results = []
+        for turn_count in range(5):
+            self.result_buffer.write_result(GameResult(self.config, (1, 2), winner_seat=None, turn_count=turn_count))
+            self.result_buffer.drain(drained_results.append)
+
+        self.assertEqual([result.turn_count for result in drained_results], [0, 1, 2, 3, 4])
+        self.assertIsNone(drained_results[0].winner_seat)
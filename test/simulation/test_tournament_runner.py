@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_trait import TRAIT_FORTIFIED
+from constants import Faction
+from game import Game
+from simulation.game_config import GameConfig, GameResult
+from simulation.game_runner import create_bots
+from simulation.tournament_runner import TournamentRunner
+
+FACTIONS = (Faction.MECHANICAL_MARQUISE_2_0, Faction.ELECTRIC_EYRIE)
+DIFFICULTIES = (BotDifficulty.BEGINNER, BotDifficulty.EXPERT)
+
+
+# Stands in for a full game: seat 0 wins every even seed
+def run_fake_game(config: GameConfig) -> GameResult:
+    winner_seat = config.seed % 2
+    victory_points = (30, config.seed % 10) if winner_seat == 0 else (config.seed % 10, 30)
+    return GameResult(config, victory_points, winner_seat, turn_count=10)
+
+
+class TestTournamentRunner(TestCase):
+    def setUp(self):
+        self.configs = [GameConfig(seed, FACTIONS, DIFFICULTIES) for seed in range(40)]
+
+    def assert_all_games_aggregated(self, runner: TournamentRunner):
+        aggregator = runner.run(self.configs)
+        matchup_stats = aggregator.get_matchup_stats(self.configs[0].get_matchup_key())
+
+        self.assertEqual(aggregator.get_game_count(), 40)
+        self.assertEqual(matchup_stats.win_counts, [20, 20])
+        self.assertEqual(matchup_stats.get_win_rate(0), 0.5)
+        self.assertEqual(matchup_stats.turn_count_total, 400)
+
+    def test_run_in_process(self):
+        self.assert_all_games_aggregated(TournamentRunner(run_fake_game))
+
+    def test_run_on_worker_pool(self):
+        self.assert_all_games_aggregated(TournamentRunner(run_fake_game, worker_count=2, chunk_size=4))
+
+    def test_run_on_fork_server(self):
+        self.assert_all_games_aggregated(TournamentRunner(run_fake_game, worker_count=2, use_fork_server=True))
+
+    def test_create_bots_from_config(self):
+        game = Game()
+        config = GameConfig(0, FACTIONS, DIFFICULTIES, trait_names=(('Fortified',), ()))
+        marquise, eyrie = create_bots(game, config)
+
+        self.assertEqual(marquise.faction, Faction.MECHANICAL_MARQUISE_2_0)
+        self.assertIs(marquise.traits[0], TRAIT_FORTIFIED)
+        self.assertEqual(eyrie.difficulty, BotDifficulty.EXPERT)
+        self.assertEqual(eyrie.traits, [])
+
+    def test_run_with_shared_memory_results(self):
+        self.assert_all_games_aggregated(TournamentRunner(run_fake_game, worker_count=2, use_shared_memory_results=True,
+                                                          chunk_size=4, result_buffer_capacity=8))
+
+    def test_run_on_fork_server_with_shared_memory_results(self):
+        self.assert_all_games_aggregated(TournamentRunner(run_fake_game, worker_count=2, use_fork_server=True,
+                                                          use_shared_memory_results=True))
@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from bot_resources.bot_constants import BotDifficulty
+from constants import Faction
+from game_random import GameRandom
+from simulation.game_config import GameConfig, GameResult
+from simulation.simulation_constants import SearchObjective
+from simulation.tournament_runner import TournamentRunner
+from simulation.trait_search import TraitSearch
+
+FACTIONS = (Faction.MECHANICAL_MARQUISE_2_0, Faction.ELECTRIC_EYRIE)
+DIFFICULTIES = (BotDifficulty.EXPERT, BotDifficulty.EXPERT)
+MARQUISE_TRAIT_EDGES = {'Blitz': -0.15, 'Fortified': 0.3, 'Hospitals': -0.05, 'Iron Will': 0.2}
+EYRIE_TRAIT_EDGES = {'Nobility': 0.1, 'Relentless': 0.05, 'Swoop': 0.2, 'War Tax': -0.1}
+
+
+# Stands in for a full game: each trait moves the Marquise's chance of winning up or down
+def run_trait_fake_game(config: GameConfig) -> GameResult:
+    luck = GameRandom(config.get_random_streams_seed()).battle_dice.random()
+    marquise_win_chance = (0.3 + sum(MARQUISE_TRAIT_EDGES[trait_name] for trait_name in config.trait_names[0]) -
+                           sum(EYRIE_TRAIT_EDGES[trait_name] for trait_name in config.trait_names[1]))
+    winner_seat = 0 if luck < marquise_win_chance else 1
+    return GameResult(config, (30, 20) if winner_seat == 0 else (20, 30), winner_seat, turn_count=10)
+
+
+class TestTraitSearch(TestCase):
+    def setUp(self):
+        self.base_config = GameConfig(0, FACTIONS, DIFFICULTIES)
+
+    def test_finds_strongest_traits(self):
+        search = TraitSearch(TournamentRunner(run_trait_fake_game), self.base_config, population_size=8,
+                             games_per_candidate=100, seed=1)
+        best_candidate, fitness = search.run(generation_count=8)
+
+        self.assertEqual(best_candidate.trait_names, (('Fortified', 'Iron Will'), ()))
+        self.assertAlmostEqual(fitness, 0.8, delta=0.1)
+
+    def test_fitness_is_cached(self):
+        search = TraitSearch(TournamentRunner(run_trait_fake_game), self.base_config, population_size=8,
+                             games_per_candidate=50, seed=2)
+        search.run(generation_count=10)
+
+        # Only 16 trait sets exist for the Marquise, and none of them are ever played twice
+        self.assertEqual(search.games_played, len(search.fitness_cache) * 50)
+        self.assertLessEqual(len(search.fitness_cache), 16)
+
+    def test_only_evolved_seats_change(self):
+        search = TraitSearch(TournamentRunner(run_trait_fake_game), self.base_config, evolved_seats=(1,),
+                             evolve_difficulties=True, seed=3)
+        candidates = [search.mutate(search.create_random_candidate()) for _ in range(20)]
+
+        self.assertTrue(all(candidate.trait_names[0] == () for candidate in candidates))
+        self.assertTrue(all(candidate.difficulties[0] == BotDifficulty.EXPERT for candidate in candidates))
+        self.assertTrue(any(candidate.trait_names[1] for candidate in candidates))
+
+    def test_finds_balanced_traits(self):
+        search = TraitSearch(TournamentRunner(run_trait_fake_game, worker_count=2), self.base_config,
+                             objective=SearchObjective.BALANCED, population_size=12, games_per_candidate=100, seed=4)
+        best_candidate, fitness = search.run(generation_count=8)
+
+        # Both seats' win rates are within 5% of even
+        self.assertGreaterEqual(fitness, -0.1)
+        self.assertNotEqual(best_candidate.trait_names, ((), ()))
+
+    def test_base_config_traits_in_any_order(self):
+        base_config = GameConfig(0, FACTIONS, DIFFICULTIES, trait_names=(('Iron Will', 'Fortified'), ()))
+        search = TraitSearch(TournamentRunner(run_trait_fake_game, worker_count=2), base_config, population_size=4,
+                             games_per_candidate=20, seed=5)
+        search.run(generation_count=2)
+
+        self.assertEqual(search.get_fitness(base_config), search.get_fitness(search.create_candidate(
+            list(DIFFICULTIES), [('Fortified', 'Iron Will'), ()])))
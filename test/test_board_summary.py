@@ -0,0 +1,77 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from board_summary import BoardSummary, get_board_summary
+from constants import Faction, Item, Suit
+from game import Game
+from locations.clearing import Clearing
+from pieces.building import Building
+from pieces.item_token import ItemToken
+from pieces.ruin import Ruin
+from pieces.warrior import Warrior
+from player_resources.player import Player
+from sort_utils import sort_clearings_by_defenseless_enemy_buildings, sort_clearings_by_enemy_pieces, \
+    sort_clearings_by_martial_law, sort_clearings_by_ruled_by_self
+
+
+class TestBoardSummary(TestCase):
+    @patch('player_resources.player.Player.__abstractmethods__', set())
+    def setUp(self):
+        self.game = Game()
+        self.clearing1 = Clearing(self.game, Suit.FOX, priority=1, total_building_slots=2)
+        self.clearing2 = Clearing(self.game, Suit.MOUSE, priority=2, total_building_slots=1)
+        self.game.board_map.clearings = [self.clearing1, self.clearing2]
+        self.player1 = Player(self.game, Faction.MECHANICAL_MARQUISE_2_0)
+        self.player2 = Player(self.game, Faction.ELECTRIC_EYRIE)
+        self.game.add_player(self.player1)
+        self.game.add_player(self.player2)
+        self.clearing1.add_pieces(self.player1, [Warrior(self.player1) for _ in range(3)])
+        self.clearing1.add_piece(self.player2, Building(self.player2, 'Building'))
+        self.clearing2.add_pieces(self.player2, [Warrior(self.player2), Building(self.player2, 'Building')])
+
+    def test_clearing_summary_counts(self):
+        clearing_summary = BoardSummary(self.game.clearings()).get_clearing_summary(self.clearing1)
+
+        self.assertEqual(clearing_summary.get_warrior_count_for_player(self.player1), 3)
+        self.assertEqual(clearing_summary.get_enemy_piece_count(self.player1), 1)
+        self.assertEqual(clearing_summary.get_enemy_piece_count(self.player2), 3)
+        self.assertEqual(clearing_summary.get_defenseless_enemy_building_count(self.player1), 1)
+        self.assertEqual(clearing_summary.get_defenseless_enemy_building_count(self.player2), 0)
+        self.assertTrue(clearing_summary.is_under_enemy_martial_law(self.player2))
+        self.assertFalse(clearing_summary.is_under_enemy_martial_law(self.player1))
+        self.assertEqual(clearing_summary.open_building_slot_count, 1)
+        self.assertIs(clearing_summary.ruler, self.player1)
+
+    def test_get_board_summary_rebuilt_after_board_changes(self):
+        board_summary = get_board_summary(self.game)
+        self.assertIs(get_board_summary(self.game), board_summary)
+
+        self.clearing2.add_piece(self.player1, Warrior(self.player1))
+        self.assertIsNot(get_board_summary(self.game), board_summary)
+        self.assertEqual(get_board_summary(self.game).get_clearing_summary(self.clearing2).get_enemy_piece_count(
+            self.player2), 1)
+
+    def test_get_board_summary_rebuilt_after_ruin_changes(self):
+        self.clearing1.add_ruin(Ruin([ItemToken(Item.BAG, is_ruin_item=True)]))
+        self.assertEqual(get_board_summary(self.game).get_clearing_summary(self.clearing1).open_building_slot_count, 0)
+
+        self.clearing1.explore_ruin(self.player1)
+        self.assertEqual(get_board_summary(self.game).get_clearing_summary(self.clearing1).open_building_slot_count, 1)
+
+    def test_sorting_with_board_summary_matches_sorting_without(self):
+        board_summary = get_board_summary(self.game)
+        clearings = self.game.clearings()
+        for player in (self.player1, self.player2):
+            for descending in (True, False):
+                for sort_method in (sort_clearings_by_enemy_pieces, sort_clearings_by_martial_law,
+                                    sort_clearings_by_defenseless_enemy_buildings, sort_clearings_by_ruled_by_self):
+                    self.assertEqual(sort_method(clearings, player, descending, board_summary=board_summary),
+                                     sort_method(clearings, player, descending))
+
+    def test_ruler_of_tied_clearing(self):
+        self.clearing2.add_pieces(self.player1, [Warrior(self.player1), Warrior(self.player1)])
+        self.assertIsNone(BoardSummary(self.game.clearings()).get_clearing_summary(self.clearing2).ruler)
+
+        # LORDS OF THE FOREST: Eyrie Dynasties rule tied clearings
+        with patch.object(self.player2, 'does_rule_clearing', return_value=True):
+            self.assertIs(BoardSummary(self.game.clearings()).get_clearing_summary(self.clearing2).ruler, self.player2)
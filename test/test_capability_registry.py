@@ -0,0 +1,62 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from constants import Faction, Item
+from game import Game
+from pieces.building import Building
+from pieces.item_token import ItemToken
+from player_resources.player import Player
+
+
+class TestCapabilityRegistry(TestCase):
+    @patch('player_resources.player.Player.__abstractmethods__', set())
+    def setUp(self):
+        self.game = Game()
+        self.player = Player(self.game, Faction.ELECTRIC_EYRIE)
+        self.marquise = MechanicalMarquiseV2Player(self.game)
+        self.clearing = self.game.board_map.get_clearing(1)
+        self.river_clearing = self.game.board_map.get_clearing(7)
+
+    def test_default_player_capabilities(self):
+        self.game.add_player(self.player)
+
+        self.assertIsNone(self.game.capabilities.discarded_card_taker)
+        self.assertEqual(self.game.get_number_of_items_per_ruin(), 0)
+        self.assertNotIn(self.player, self.game.capabilities.damage_halving_players)
+        self.assertIn(self.player, self.game.capabilities.defenseless_capable_players)
+        self.assertNotIn(self.river_clearing, self.player.get_adjacent_clearings(self.clearing))
+
+    def test_overriding_halves_damage_marks_player(self):
+        self.game.add_player(self.marquise)
+
+        self.assertIn(self.marquise, self.game.capabilities.damage_halving_players)
+        self.clearing.add_piece(self.marquise, Building(self.marquise, 'Building'))
+        self.assertEqual(self.game.capabilities.halves_damage(self.marquise, self.clearing),
+                         self.marquise.halves_damage(self.clearing))
+
+    def test_replacing_players_refreshes_registry(self):
+        self.game.players = [self.player, self.marquise]
+
+        self.assertIn(self.player, self.game.capabilities.defenseless_capable_players)
+        self.assertIn(self.marquise, self.game.capabilities.damage_halving_players)
+
+    def test_refresh_picks_up_new_capabilities(self):
+        self.game.add_player(self.player)
+        with patch.object(self.player, 'treats_rivers_as_paths', return_value=True), \
+                patch.object(self.player, 'takes_discarded_cards', return_value=True):
+            self.game.capabilities.refresh()
+
+        self.assertEqual(self.game.capabilities.discarded_card_taker, self.player)
+        self.assertIn(self.river_clearing, self.player.get_adjacent_clearings(self.clearing))
+
+    def test_crafting_updates_registry(self):
+        self.game.add_player(self.player)
+        self.game.item_supply = [ItemToken(Item.BOOT), ItemToken(Item.BOOT)]
+        with patch.object(self.player, 'treats_rivers_as_paths', return_value=True):
+            self.game.craft_item(Item.BOOT, self.player, 1)
+
+        self.assertIn(self.river_clearing, self.player.get_adjacent_clearings(self.clearing))
+        self.game.craft_item(Item.BOOT, self.player, 1)
+        self.assertNotIn(self.river_clearing, self.player.get_adjacent_clearings(self.clearing))
@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from game import Game
+from game_random import GameRandom
+
+
+class TestGameRandom(TestCase):
+    def test_same_streams_seed_gives_same_streams(self):
+        first_random = GameRandom((5, 'matchup'))
+        second_random = GameRandom((5, 'matchup'))
+
+        self.assertEqual([first_random.roll_battle_dice() for _ in range(10)],
+                         [second_random.roll_battle_dice() for _ in range(10)])
+        self.assertEqual(first_random.corner_homeland.random(), second_random.corner_homeland.random())
+
+    def test_streams_are_independent(self):
+        first_random = GameRandom(5)
+        second_random = GameRandom(5)
+        for _ in range(10):
+            first_random.roll_battle_dice()
+
+        self.assertEqual(first_random.deck_shuffle.random(), second_random.deck_shuffle.random())
+        self.assertNotEqual(GameRandom(5).deck_shuffle.random(), GameRandom(5).ruin_items.random())
+
+    def test_games_with_same_streams_seed_start_the_same(self):
+        first_game = Game(game_random=GameRandom(11))
+        second_game = Game(game_random=GameRandom(11))
+
+        self.assertEqual(first_game.deck.cards, second_game.deck.cards)
+        self.assertEqual([quest_card.suit for quest_card in first_game.quest_deck.cards],
+                         [quest_card.suit for quest_card in second_game.quest_deck.cards])
+        self.assertEqual([[item_token.item for item_token in clearing.ruin.items]
+                          for clearing in first_game.clearings() if clearing.ruin],
+                         [[item_token.item for item_token in clearing.ruin.items]
+                          for clearing in second_game.clearings() if clearing.ruin])
@@ -0,0 +1,54 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from constants import Faction, Suit
+from game import Game
+from locations.clearing import Clearing
+from pieces.warrior import Warrior
+from player_resources.player import Player
+from query_cache import QueryCache
+
+
+class TestQueryCache(TestCase):
+    def test_get_caches_result(self):
+        query_cache = QueryCache()
+        compute_result = Mock(return_value=[1, 2])
+
+        self.assertEqual(query_cache.get('key', compute_result), [1, 2])
+        self.assertEqual(query_cache.get('key', compute_result), [1, 2])
+        self.assertEqual(compute_result.call_count, 1)
+        self.assertEqual(query_cache.hits, 1)
+        self.assertEqual(query_cache.misses, 1)
+
+    def test_get_recomputes_after_board_version_bump(self):
+        query_cache = QueryCache()
+        compute_result = Mock(return_value=[1, 2])
+
+        query_cache.get('key', compute_result)
+        query_cache.bump_board_version()
+        query_cache.get('key', compute_result)
+        self.assertEqual(compute_result.call_count, 2)
+        self.assertEqual(query_cache.hits, 0)
+        self.assertEqual(query_cache.misses, 2)
+
+    def test_get_hit_rate(self):
+        query_cache = QueryCache()
+        self.assertEqual(query_cache.get_hit_rate(), 0.0)
+        query_cache.get('key', lambda: 1)
+        query_cache.get('key', lambda: 1)
+        query_cache.get('key', lambda: 1)
+        query_cache.get('other_key', lambda: 1)
+        self.assertEqual(query_cache.get_hit_rate(), 0.5)
+
+    @patch('player_resources.player.Player.__abstractmethods__', set())
+    def test_adding_piece_to_location_invalidates_ruled_clearings(self):
+        game = Game()
+        clearing = Clearing(game, Suit.FOX, priority=1, total_building_slots=1)
+        game.board_map.clearings = [clearing]
+        player = Player(game, Faction.MECHANICAL_MARQUISE_2_0)
+
+        self.assertEqual(player.get_ruled_clearings(), [])
+        clearing.add_piece(player, Warrior(player))
+        self.assertEqual(player.get_ruled_clearings(), [clearing])
+        self.assertEqual(player.get_ruled_clearings(), [clearing])
+        self.assertEqual(game.query_cache.hits, 1)
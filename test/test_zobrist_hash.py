@@ -0,0 +1,100 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from bot_resources.bot_factions.electric_eyrie.electric_eyrie_player import ElectricEyriePlayer
+from bot_resources.bot_factions.mechanical_marquise_v2.mechanical_marquise_v2_player import \
+    MechanicalMarquiseV2Player
+from bot_resources.bot_factions.vagabot.satchel import Satchel
+from constants import Faction, Item
+from game import Game
+from game_random import GameRandom
+from pieces.item_token import ItemToken
+from simulation.game_codec import game_from_bytes, game_to_bytes
+from zobrist_hash import get_feature_key, HASH_MASK, ZobristHash
+
+
+class TestZobristHash(TestCase):
+    def test_feature_keys_are_stable(self):
+        self.assertEqual(get_feature_key(('Piece', ('Clearing', 1), Faction.ELECTRIC_EYRIE, 'Warrior', 'Warrior')),
+                         17907118893258848733)
+
+    def test_identical_features_do_not_cancel_out(self):
+        zobrist_hash = ZobristHash()
+        zobrist_hash.add_feature(('Feature', 1))
+        zobrist_hash.add_feature(('Feature', 1))
+
+        self.assertNotEqual(zobrist_hash.value, 0)
+        zobrist_hash.remove_features([('Feature', 1), ('Feature', 1)])
+        self.assertEqual(zobrist_hash.value, 0)
+
+
+class TestGameZobristHash(TestCase):
+    def create_game(self) -> tuple[Game, MechanicalMarquiseV2Player, ElectricEyriePlayer]:
+        game = Game(game_random=GameRandom(7))
+        marquise = MechanicalMarquiseV2Player(game)
+        eyrie = ElectricEyriePlayer(game)
+        for player in [marquise, eyrie]:
+            game.add_player(player)
+            player.supply.add_pieces(player, player.piece_stock.pieces)
+        return game, marquise, eyrie
+
+    def test_incremental_hash_matches_recomputed_hash(self):
+        game, marquise, eyrie = self.create_game()
+        clearing = game.board_map.get_clearing(1)
+        marquise.supply.relocate_pieces(marquise, marquise.get_unplaced_warriors()[:3], clearing)
+        eyrie.supply.relocate_pieces(eyrie, eyrie.get_unplaced_warriors()[:2], clearing)
+        clearing.move_pieces(marquise, clearing.get_warriors_for_player(marquise)[:1], game.board_map.get_clearing(5))
+        clearing.remove_pieces(eyrie, clearing.get_warriors_for_player(eyrie)[:1])
+        marquise.add_victory_points(4)
+        eyrie.decree.add_to_decree(game.draw_card())
+        game.discard_cards(game.deck.draw_cards(3))
+
+        self.assertEqual(game.zobrist_hash.value, game.compute_zobrist_hash())
+        eyrie.decree.purge()
+        self.assertEqual(game.zobrist_hash.value, game.compute_zobrist_hash())
+
+    def test_move_order_does_not_matter(self):
+        first_game, first_marquise, _ = self.create_game()
+        second_game, second_marquise, _ = self.create_game()
+        for game, marquise, destination_priorities in [(first_game, first_marquise, [2, 3]),
+                                                       (second_game, second_marquise, [3, 2])]:
+            for priority in destination_priorities:
+                marquise.supply.relocate_pieces(marquise, marquise.get_unplaced_warriors()[:1],
+                                                game.board_map.get_clearing(priority))
+            marquise.add_victory_points(2)
+            marquise.add_victory_points(1)
+
+        self.assertEqual(first_game.zobrist_hash.value, second_game.zobrist_hash.value)
+        first_marquise.add_victory_points(1)
+        self.assertNotEqual(first_game.zobrist_hash.value, second_game.zobrist_hash.value)
+
+    def test_drawing_changes_hash(self):
+        game, _, _ = self.create_game()
+        hash_before_draw = game.zobrist_hash.value
+        game.draw_card()
+
+        self.assertNotEqual(game.zobrist_hash.value, hash_before_draw)
+        self.assertEqual(game.zobrist_hash.value, game.compute_zobrist_hash())
+
+    def test_restored_game_has_same_hash(self):
+        game, marquise, eyrie = self.create_game()
+        marquise.supply.relocate_pieces(marquise, marquise.get_unplaced_warriors()[:2], game.board_map.forests[0])
+        marquise.add_victory_points(3)
+        eyrie.decree.add_to_decree(game.draw_card())
+
+        self.assertEqual(game_from_bytes(game_to_bytes(game)).zobrist_hash.value, game.zobrist_hash.value)
+
+    def test_satchel(self):
+        game = Game()
+        satchel = Satchel(game, Mock(faction=Faction.VAGABOT))
+        hash_without_satchel = game.zobrist_hash.value
+        for item in [Item.BOOT, Item.BOOT, Item.SWORD]:
+            satchel.add_item(ItemToken(item))
+        satchel.exhaust_items_if_possible(2)
+        satchel.damage_specific_item(satchel.get_exhausted_undamaged_items()[0])
+        hash_with_damaged_item = game.zobrist_hash.value
+        satchel.repair_all_items()
+
+        self.assertNotEqual(game.zobrist_hash.value, hash_with_damaged_item)
+        self.assertEqual(game.zobrist_hash.value, (hash_without_satchel + sum(
+            get_feature_key(feature) for feature in satchel.get_features())) & HASH_MASK)
@@ -1241,6 +1241,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_descending(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
 
@@ -1262,6 +1263,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_ascending(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
 
@@ -1283,6 +1285,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_descending_stable(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
 
@@ -1304,6 +1307,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_ascending_stable(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
 
@@ -1325,6 +1329,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_descending_multiple_players(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
         mock_player_3 = Mock()
@@ -1348,6 +1353,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_ascending_multiple_players(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
         mock_player_3 = Mock()
@@ -1371,6 +1377,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_descending_not_defenseless(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
         mock_player_3 = Mock()
@@ -1394,6 +1401,7 @@ class TestSortUtilsClearings(TestCase):
 
     def test_sort_clearings_by_defenseless_enemy_buildings_ascending_not_defenseless(self):
         mock_game = Mock()
+        mock_game.capabilities.is_defenseless = lambda player, clearing: player.is_defenseless(clearing)
         mock_player = Mock()
         mock_player_2 = Mock()
         mock_player_3 = Mock()